@@ -76,6 +76,12 @@ class Settings:
     mobula_api_key: str = os.getenv("MOBULA_API_KEY", "")
     moralis_api_key: str = os.getenv("MORALIS_API_KEY", "")
     blockvision_api_key: str = os.getenv("BLOCKVISION_API_KEY", "")
+    # Alchemy 使用 Portfolio API 一次性获取余额与元数据（False 时使用 JSON-RPC 余额 + 元数据两步查询）
+    alchemy_enhanced_api: bool = (
+        os.getenv("ALCHEMY_ENHANCED_API", "True").lower() == "true"
+    )
+    # Etherscan 系区块浏览器 API 密钥（用于查询 EVM 钱包首笔交易）
+    explorer_api_key: str = os.getenv("EXPLORER_API_KEY", "YourApiKeyToken")
 
     # 数据聚合策略配置
     data_aggregator_enabled: bool = (
@@ -84,6 +90,8 @@ class Settings:
     fallback_to_blockchain_service: bool = (
         os.getenv("FALLBACK_TO_BLOCKCHAIN_SERVICE", "True").lower() == "true"
     )
+    # Redis 共享缓存地址（为空时仅使用进程内缓存，需要安装 redis 包）
+    redis_url: str = os.getenv("REDIS_URL", "")
     # 使用通用配置，避免重复
     provider_timeout_seconds: int = int(
         os.getenv("PROVIDER_TIMEOUT_SECONDS", str(request_timeout))
@@ -102,6 +110,10 @@ class Settings:
     manual_token_addition_enabled: bool = (
         os.getenv("MANUAL_TOKEN_ADDITION_ENABLED", "True").lower() == "true"
     )
+    # Solana 代币账户使用 base64 二进制编码并在本地解析（False 时回退到 jsonParsed）
+    solana_binary_token_accounts: bool = (
+        os.getenv("SOLANA_BINARY_TOKEN_ACCOUNTS", "True").lower() == "true"
+    )
 
     # 数据提供商优先级配置
     primary_providers: list = os.getenv("PRIMARY_PROVIDERS", "covalent,mobula").split(
@@ -28,6 +28,8 @@ from app.routers import (
 
 # 导入历史数据服务
 from app.services.asset_history_service import AssetHistoryService
+from app.services.blockchain_service import close_http_client
+from app.services.data_aggregator import data_aggregator as data_aggregator_service
 
 # 初始化统一日志系统
 setup_logging()
@@ -90,6 +92,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except asyncio.CancelledError:
         pass
 
+    # 关闭共享的 HTTP 连接池与聚合器缓存连接
+    await close_http_client()
+    await data_aggregator_service.close()
+
     logger.info("关闭加密货币资产管理 API")
 
 
@@ -169,6 +175,7 @@ if __name__ == "__main__":
         port=settings.port,
         reload=settings.debug,
         log_level=settings.log_level.lower(),
+        loop="auto",  # 已安装 uvloop 时使用 uvloop 事件循环，否则回退到 asyncio
     )
 
 
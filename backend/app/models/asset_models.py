@@ -2,6 +2,7 @@
 资产相关的数据模型
 """
 
+from functools import cached_property
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field, field_validator, model_validator
 import uuid
@@ -234,6 +235,18 @@ class WalletCreationInfo(BaseModel):
     is_estimated: bool = Field(False, description="是否为估算时间")
     error_message: Optional[str] = Field(None, description="查询错误信息")
 
+    @classmethod
+    def error(
+        cls, address: str, chain_name: str, message: str, estimated: bool = False
+    ) -> "WalletCreationInfo":
+        """构造查询失败的结果（字段均为可信值，跳过校验直接构造）"""
+        return cls.model_construct(
+            address=address,
+            chain_name=chain_name,
+            is_estimated=estimated,
+            error_message=message,
+        )
+
 
 class WalletCreationResponse(BaseModel):
     """钱包创建时间查询响应模型"""
@@ -256,6 +269,35 @@ class DiscoveredToken(BaseModel):
     price_usdc: Optional[float] = Field(None, description="USDC价格")
     value_usdc: Optional[float] = Field(None, description="总价值（USDC）")
 
+    @cached_property
+    def contract_address_lower(self) -> Optional[str]:
+        """小写合约地址（首次访问时计算并缓存，不参与序列化）"""
+        return self.contract_address.lower() if self.contract_address else None
+
+    @classmethod
+    def build(
+        cls,
+        symbol: str,
+        name: Optional[str],
+        contract_address: Optional[str],
+        balance: float,
+        decimals: int,
+        is_native: bool,
+        price_usdc: Optional[float] = 0.0,
+        value_usdc: Optional[float] = 0.0,
+    ) -> "DiscoveredToken":
+        """按位置参数快速构造（用于发现流程的热循环，字段均为已解析的可信值，跳过校验）"""
+        return cls.model_construct(
+            symbol=symbol,
+            name=name,
+            contract_address=contract_address,
+            balance=balance,
+            decimals=decimals,
+            is_native=is_native,
+            price_usdc=price_usdc,
+            value_usdc=value_usdc,
+        )
+
 
 class WalletDiscoveryRequest(BaseModel):
     """钱包代币发现请求模型"""
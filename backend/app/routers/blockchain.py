@@ -66,9 +66,6 @@ async def get_wallet_creation_time(
 ):
     """查询钱包创建时间"""
     try:
-        # 确保区块链服务已初始化
-        await blockchain_service.ensure_initialized()
-        
         # 获取钱包创建时间
         creation_info = await blockchain_service.get_wallet_creation_time(
             address, chain_name
@@ -98,9 +95,6 @@ async def get_wallet_creation_time(
 async def discover_wallet_tokens(request: WalletDiscoveryRequest):
     """发现钱包代币"""
     try:
-        # 确保区块链服务已初始化
-        await blockchain_service.ensure_initialized()
-        
         # 发现代币
         discovered_tokens = await blockchain_service.discover_wallet_tokens(
             address=request.address,
@@ -149,9 +143,6 @@ async def discover_wallet_tokens_get(
 ):
     """通过GET方式发现钱包代币"""
     try:
-        # 确保区块链服务已初始化
-        await blockchain_service.ensure_initialized()
-        
         # 发现代币
         discovered_tokens = await blockchain_service.discover_wallet_tokens(
             address=address,
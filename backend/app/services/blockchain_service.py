@@ -8,19 +8,614 @@
 """
 
 import asyncio
-from typing import Dict, List, Optional
+import base64
+import hashlib
+import os
+import random
+import socket
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 from datetime import datetime
 from web3 import Web3
 from web3.exceptions import ContractLogicError
 import httpx
+import orjson
 
 # 使用统一日志系统
 from app.core.logger import get_logger
-from app.core.config import SUPPORTED_CHAINS
+from app.core.config import SUPPORTED_CHAINS, get_native_token, settings
 from app.models.asset_models import WalletCreationInfo, DiscoveredToken
 
 logger = get_logger(__name__)
 
+# ERC20 函数选择器：balanceOf(address) / decimals()
+_SEL_BALANCEOF = bytes.fromhex("70a08231")
+_SEL_DECIMALS = bytes.fromhex("313ce567")
+_SEL_BALANCEOF_HEX = "0x" + _SEL_BALANCEOF.hex()
+# Transfer(address,address,uint256) 事件签名
+_TRANSFER_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+_DECIMALS_CALLDATA = "0x" + _SEL_DECIMALS.hex()
+
+# JSON-RPC 请求头（请求体由 orjson 预先序列化）
+_JSON_HEADERS = {"content-type": "application/json"}
+
+# 区块浏览器首笔交易查询 URL 模板（Etherscan 兼容接口）
+_EXPLORER_TXLIST_QUERY = (
+    "module=account&action=txlist&address={address}&startblock=0"
+    "&endblock=99999999&page=1&offset=1&sort=asc&apikey={apikey}"
+)
+_EXPLORER_TEMPLATES = {
+    "ethereum": "https://api.etherscan.io/api?" + _EXPLORER_TXLIST_QUERY,
+    "arbitrum": "https://api.arbiscan.io/api?" + _EXPLORER_TXLIST_QUERY,
+    "base": "https://api.basescan.org/api?" + _EXPLORER_TXLIST_QUERY,
+    "polygon": "https://api.polygonscan.com/api?" + _EXPLORER_TXLIST_QUERY,
+    "bsc": "https://api.bscscan.com/api?" + _EXPLORER_TXLIST_QUERY,
+}
+
+# Esplora 已确认交易分页大小，以及查询钱包创建时间时最多翻页数
+_BTC_TXS_PAGE_SIZE = 25
+_BTC_MAX_TX_PAGES = 200
+
+# getSignaturesForAddress 每页签名数，以及查询钱包创建时间时最多翻页数
+_SOL_SIGNATURES_PAGE_LIMIT = 1000
+_SOL_MAX_SIGNATURE_PAGES = 20
+
+# 每个 JSON-RPC 批量请求中 suix_getCoinMetadata 的最大数量
+_SUI_METADATA_BATCH_SIZE = 20
+
+# 发现 ERC20 代币时并发查询余额的最大请求数
+_ERC20_PROBE_CONCURRENCY = 8
+
+# RPC 请求超时（总计 30 秒，建立连接 10 秒）
+_SOL_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+# Solana RPC 重试次数及各次重试的等待时间（秒）：速率限制（全抖动上限）/ 超时等其他错误
+_SOL_MAX_RETRIES = 3
+_SOL_429_WAITS = tuple(min(60, 2 * (2**a)) for a in range(_SOL_MAX_RETRIES))
+_SOL_GEN_WAITS = tuple(2 * (a + 1) for a in range(_SOL_MAX_RETRIES))
+
+# 余额结果的短期缓存时间（秒），用于吸收界面刷新带来的重复查询
+_BALANCE_CACHE_TTL = 2.0
+
+
+def _compute_backoff(response: Optional[httpx.Response], attempt: int) -> float:
+    """计算速率限制后的等待时间：优先遵循服务端 Retry-After，并加入随机抖动
+
+    没有 Retry-After 时使用全抖动（0 到指数上限之间均匀随机），
+    避免并发请求在同一时刻集中重试。
+    """
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after and retry_after.isdigit():
+        return min(int(retry_after), 60) + random.random()
+    return random.uniform(0, _SOL_429_WAITS[attempt])
+
+
+# Solana 代币元数据 LRU 缓存（mint -> (symbol, name)），元数据基本不变，全进程共享
+_SOLANA_METADATA_CACHE_SIZE = 100_000
+_solana_metadata_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+
+def _get_cached_solana_metadata(mint: str) -> Optional[tuple]:
+    """读取缓存的 Solana 代币元数据"""
+    metadata = _solana_metadata_cache.get(mint)
+    if metadata is not None:
+        _solana_metadata_cache.move_to_end(mint)
+    return metadata
+
+
+def _cache_solana_metadata(mint: str, metadata: tuple):
+    """写入 Solana 代币元数据缓存，超出容量时淘汰最久未使用的条目"""
+    _solana_metadata_cache[mint] = metadata
+    _solana_metadata_cache.move_to_end(mint)
+    if len(_solana_metadata_cache) > _SOLANA_METADATA_CACHE_SIZE:
+        _solana_metadata_cache.popitem(last=False)
+
+
+# 元数据查询未命中的 mint（mint -> 记录时间），TTL 内直接使用简化符号，不再重复请求
+_SOLANA_METADATA_MISS_TTL = 3600.0
+_solana_metadata_misses: Dict[str, float] = {}
+
+
+def _is_recent_solana_metadata_miss(mint: str) -> bool:
+    """判断 mint 是否在 TTL 内查询过且未找到元数据"""
+    missed_at = _solana_metadata_misses.get(mint)
+    if missed_at is None:
+        return False
+    if time.monotonic() - missed_at < _SOLANA_METADATA_MISS_TTL:
+        return True
+    del _solana_metadata_misses[mint]
+    return False
+
+
+def _record_solana_metadata_miss(mint: str):
+    """记录元数据未命中，超出容量时淘汰最早写入的条目"""
+    _solana_metadata_misses.pop(mint, None)
+    _solana_metadata_misses[mint] = time.monotonic()
+    if len(_solana_metadata_misses) > _SOLANA_METADATA_CACHE_SIZE:
+        del _solana_metadata_misses[next(iter(_solana_metadata_misses))]
+
+
+# Solana mint 小数位数缓存（mint -> decimals），小数位数创建后不可变
+_solana_mint_decimals: Dict[str, int] = {}
+
+
+def _cache_solana_decimals(mint: str, decimals: int):
+    """写入 mint 小数位数缓存，超出容量时淘汰最早写入的条目"""
+    _solana_mint_decimals[mint] = decimals
+    if len(_solana_mint_decimals) > _SOLANA_METADATA_CACHE_SIZE:
+        del _solana_mint_decimals[next(iter(_solana_mint_decimals))]
+
+
+# 正在进行中的 Metaplex 元数据查询（mint -> Task），并发请求同一 mint 时共享结果
+_metaplex_inflight: Dict[str, asyncio.Task] = {}
+
+_B58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+
+def _b58encode(data: bytes) -> str:
+    """Base58 编码（Solana 公钥的文本格式）"""
+    num = int.from_bytes(data, "big")
+    encoded = []
+    while num:
+        num, rem = divmod(num, 58)
+        encoded.append(_B58_ALPHABET[rem])
+    leading_zeros = len(data) - len(data.lstrip(b"\0"))
+    return "1" * leading_zeros + "".join(reversed(encoded))
+
+
+def _b58decode(value: str) -> bytes:
+    """Base58 解码"""
+    num = 0
+    for char in value:
+        num = num * 58 + _B58_ALPHABET.index(char)
+    decoded = num.to_bytes((num.bit_length() + 7) // 8, "big")
+    leading_ones = len(value) - len(value.lstrip("1"))
+    return b"\0" * leading_ones + decoded
+
+
+_ED25519_P = 2**255 - 19
+_ED25519_D = (-121665 * pow(121666, -1, _ED25519_P)) % _ED25519_P
+
+
+def _is_on_ed25519_curve(key: bytes) -> bool:
+    """判断 32 字节公钥能否解压为 ed25519 曲线上的点（与 Solana 的判定一致）"""
+    y = int.from_bytes(key, "little") & ((1 << 255) - 1)
+    y2 = y * y % _ED25519_P
+    u = (y2 - 1) % _ED25519_P
+    v = (_ED25519_D * y2 + 1) % _ED25519_P
+    x2 = u * pow(v, _ED25519_P - 2, _ED25519_P) % _ED25519_P
+    return x2 == 0 or pow(x2, (_ED25519_P - 1) // 2, _ED25519_P) == 1
+
+
+def _find_program_address(seeds: List[bytes], program_id: bytes) -> bytes:
+    """计算 PDA：从 bump=255 向下尝试，返回第一个不在曲线上的地址"""
+    for bump in range(255, -1, -1):
+        digest = hashlib.sha256(
+            b"".join(seeds) + bytes([bump]) + program_id + b"ProgramDerivedAddress"
+        ).digest()
+        if not _is_on_ed25519_curve(digest):
+            return digest
+    raise ValueError("无法找到有效的 PDA")
+
+
+# Metaplex Token Metadata 程序
+_METAPLEX_PROGRAM_ID = "metaqbxxUerdq28cj1RbAWkYQm3ybzjb6a8bt518x1s"
+_METAPLEX_PROGRAM_ID_BYTES = _b58decode(_METAPLEX_PROGRAM_ID)
+# 读取元数据账户的 getAccountInfo 请求模板（只需填入 PDA 地址）
+_METAPLEX_RPC_TEMPLATE = {"jsonrpc": "2.0", "id": 1, "method": "getAccountInfo"}
+_METAPLEX_ACCOUNT_CONFIG = {"encoding": "base64"}
+
+
+@lru_cache(maxsize=4096)
+def _metaplex_pda(mint: str) -> str:
+    """计算 mint 对应的 Metaplex 元数据账户地址 ["metadata", program_id, mint]"""
+    return _b58encode(
+        _find_program_address(
+            [b"metadata", _METAPLEX_PROGRAM_ID_BYTES, _b58decode(mint)],
+            _METAPLEX_PROGRAM_ID_BYTES,
+        )
+    )
+
+
+def _read_borsh_string(raw: bytes, offset: int) -> tuple:
+    """读取 Borsh 字符串（u32 小端长度 + UTF-8 字节），返回 (字符串, 新偏移)"""
+    length = int.from_bytes(raw[offset : offset + 4], "little")
+    start = offset + 4
+    text = raw[start : start + length].decode("utf-8", errors="ignore")
+    return text.rstrip("\0").strip(), start + length
+
+
+def _parse_metaplex_metadata(raw: bytes) -> tuple:
+    """解析 Metaplex 元数据账户：key(1) + update_authority(32) + mint(32) + name + symbol"""
+    name, offset = _read_borsh_string(raw, 1 + 32 + 32)
+    symbol, _ = _read_borsh_string(raw, offset)
+    return symbol or None, name or None
+
+
+def _parse_spl_token_account(raw: bytes) -> tuple:
+    """解析 165 字节的 SPL Token 账户：mint 位于 0..32，amount（u64 小端）位于 64..72"""
+    return _b58encode(raw[0:32]), int.from_bytes(raw[64:72], "little")
+
+
+# Solana RPC 节点健康状态（url -> [连续失败次数, 冷却截止时间]），全进程共享
+_rpc_health: Dict[str, list] = {}
+
+
+def _record_rpc_failure(rpc_url: str):
+    """记录节点失败，冷却时间随连续失败次数指数增长（最长 60 秒）"""
+    state = _rpc_health.setdefault(rpc_url, [0, 0.0])
+    state[0] += 1
+    state[1] = time.monotonic() + min(60, 2 ** state[0])
+
+
+def _record_rpc_success(rpc_url: str):
+    """节点请求成功，清除失败记录"""
+    _rpc_health.pop(rpc_url, None)
+
+
+def _rank_rpc_urls(rpc_urls: List[str]) -> List[str]:
+    """按 (冷却截止时间, 失败次数) 排序节点并跳过冷却中的节点；全部冷却时仍返回全部节点"""
+    def _key(url: str) -> tuple:
+        fails, cooldown_until = _rpc_health.get(url, (0, 0.0))
+        return cooldown_until, fails
+
+    ranked = sorted(rpc_urls, key=_key)
+    now = time.monotonic()
+    available = [url for url in ranked if _key(url)[0] <= now]
+    return available or ranked
+
+
+# Solana Token Registry：原始列表与 ETag 元信息缓存在磁盘，内存中按 mint 建立索引
+_TOKEN_REGISTRY_URL = "https://raw.githubusercontent.com/solana-labs/token-list/main/src/tokens/solana.tokenlist.json"
+_TOKEN_REGISTRY_TTL = 24 * 3600  # 超过该时间后用 If-None-Match 条件请求校验
+_TOKEN_REGISTRY_RETRY_AFTER = 10 * 60  # 刷新失败后沿用旧数据，间隔该时间再重试
+_token_registry_cache_path = os.path.join(settings.data_dir, "solana_tokenlist.json")
+_token_registry_meta_path = os.path.join(
+    settings.data_dir, "solana_tokenlist.meta.json"
+)
+_token_registry_index: Optional[Dict[str, tuple]] = None
+_token_registry_etag: Optional[str] = None
+_token_registry_fetched_at = 0.0
+_token_registry_lock = asyncio.Lock()
+
+
+def _build_token_registry_index(content: bytes) -> Dict[str, tuple]:
+    """解析 Token Registry 列表并按 mint 地址建立 (symbol, name, decimals) 索引
+
+    只保留查询用到的字段，不在内存中常驻完整的代币字典。
+    """
+    tokens = orjson.loads(content).get("tokens") or []
+    return {
+        token["address"]: (
+            token.get("symbol"),
+            token.get("name"),
+            token.get("decimals", 9),
+        )
+        for token in tokens
+        if token.get("address")
+    }
+
+
+def _load_token_registry_from_disk() -> tuple:
+    """从磁盘读取 Token Registry 缓存，返回 (索引, etag, 获取时间)"""
+    try:
+        if not os.path.exists(_token_registry_cache_path):
+            return None, None, 0.0
+        with open(_token_registry_cache_path, "rb") as f:
+            index = _build_token_registry_index(f.read())
+        meta = {}
+        if os.path.exists(_token_registry_meta_path):
+            with open(_token_registry_meta_path, "rb") as f:
+                meta = orjson.loads(f.read())
+        return index, meta.get("etag"), meta.get("fetched_at", 0.0)
+    except Exception as e:
+        logger.warning(f"加载本地 Token Registry 缓存失败: {e}")
+        return None, None, 0.0
+
+
+def _save_token_registry_to_disk(
+    content: Optional[bytes], etag: Optional[str], fetched_at: float
+):
+    """保存 Token Registry 列表（content 为 None 时只更新元信息）"""
+    try:
+        os.makedirs(os.path.dirname(_token_registry_cache_path), exist_ok=True)
+        if content is not None:
+            with open(_token_registry_cache_path, "wb") as f:
+                f.write(content)
+        with open(_token_registry_meta_path, "wb") as f:
+            f.write(orjson.dumps({"etag": etag, "fetched_at": fetched_at}))
+    except Exception as e:
+        logger.warning(f"保存 Token Registry 缓存失败: {e}")
+
+
+# 进程内共享的 HTTP 客户端（所有 BlockchainService 实例复用同一连接池）
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """获取共享的 HTTP 客户端（启用 HTTP/2 与 TCP_NODELAY）"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        # 传入自定义 transport 时，连接池限制需要设置在 transport 上
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=0,
+            limits=httpx.Limits(
+                max_keepalive_connections=100,
+                max_connections=1000,
+                keepalive_expiry=60,
+            ),
+            socket_options=[(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)],
+        )
+        _http_client = httpx.AsyncClient(
+            transport=transport, timeout=_SOL_TIMEOUT
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """关闭共享的 HTTP 客户端（应用关闭时调用）"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def _meets_min_value(value_usdc: Optional[float], min_value_usdc: float) -> bool:
+    """判断代币价值是否达到最小阈值（价值未知的代币保留）"""
+    return min_value_usdc <= 0 or value_usdc is None or value_usdc >= min_value_usdc
+
+
+@lru_cache(maxsize=65_536)
+def _iso_from_ts(ts: int) -> str:
+    """将 Unix 时间戳格式化为 ISO 时间字符串（按秒缓存）
+
+    保持本地时间、不带时区偏移，与数据库中已有的创建时间及
+    asset_history_service 中基于 datetime.now() 的比较保持一致。
+    """
+    return datetime.fromtimestamp(ts).isoformat()
+
+
+def _decode_uint_result(item: Optional[dict]) -> int:
+    """解析 eth_call 的 JSON-RPC 响应项，返回十六进制结果对应的整数"""
+    if not item or "error" in item:
+        raise ValueError(f"eth_call 失败: {(item or {}).get('error', '无响应')}")
+    result = item.get("result")
+    if not result or result == "0x":
+        raise ValueError("eth_call 返回空结果")
+    return int(result, 16)
+
+
+# 10 的整数次幂表，用于把链上整数金额换算为带小数的余额
+_POW10 = tuple(10**i for i in range(37))
+
+
+def _scale_amount(raw: int, decimals: int) -> float:
+    """按小数位数换算链上整数金额（整数相除，结果为最接近的浮点数）"""
+    if 0 <= decimals < len(_POW10):
+        return raw / _POW10[decimals]
+    return raw / (10**decimals)
+
+
+def _encode_balanceof(address: str) -> str:
+    """构造 balanceOf(address) 的 eth_call calldata（0x 前缀十六进制）"""
+    return _SEL_BALANCEOF_HEX + address.strip()[2:].lower().rjust(64, "0")
+
+
+def _normalize_key_part(value: str) -> str:
+    """规范化缓存键：十六进制地址不区分大小写，其他格式（如 base58、Move 类型）保持原样"""
+    if value.startswith("0x") and "::" not in value:
+        return value.lower()
+    return value
+
+
+# 已知的 Solana 代币信息（Token Registry 中查不到时使用）
+_KNOWN_SOLANA_TOKENS: Mapping[str, dict] = MappingProxyType(
+    {
+        # 主要稳定币
+        "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v": {
+            "symbol": "USDC",
+            "name": "USD Coin",
+            "decimals": 6,
+        },
+        "Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB": {
+            "symbol": "USDT",
+            "name": "Tether USD",
+            "decimals": 6,
+        },
+        # SOL 包装代币
+        "So11111111111111111111111111111111111111112": {
+            "symbol": "SOL",
+            "name": "Wrapped SOL",
+            "decimals": 9,
+        },
+        # 其他知名代币
+        "mSoLzYCxHdYgdzU16g5QSh3i5K3z3KZK7ytfqcJm7So": {
+            "symbol": "mSOL",
+            "name": "Marinade staked SOL",
+            "decimals": 9,
+        },
+        "7dHbWXmci3dT8UFYWYZweBLXgycu7Y3iL6trKn1Y7ARj": {
+            "symbol": "stSOL",
+            "name": "Lido Staked SOL",
+            "decimals": 9,
+        },
+        # 常见的 DeFi 代币
+        "4k3Dyjzvzp8eMZWUXbBCjEvwSkkk59S5iCNLY3QrkX6R": {
+            "symbol": "RAY",
+            "name": "Raydium",
+            "decimals": 6,
+        },
+        "SRMuApVNdxXokk5GT7XD5cUUgXMBCoAz2LHeuAoKWRt": {
+            "symbol": "SRM",
+            "name": "Serum",
+            "decimals": 6,
+        },
+        # 添加您提到的代币地址（如果知道的话）
+        "A5MpcHnx": {
+            "symbol": "UNKNOWN",
+            "name": "Unknown Token A5MpcHnx",
+            "decimals": 9,
+        },
+        "sSo14end": {
+            "symbol": "UNKNOWN",
+            "name": "Unknown Token sSo14end",
+            "decimals": 9,
+        },
+    }
+)
+
+
+# 各 EVM 链上的常见代币（发现 ERC20 代币时检查余额）
+# 这里只列出一些常见的代币，实际应用中可以从配置文件或数据库中获取
+_COMMON_TOKENS_BY_CHAIN: Mapping[str, List[Dict]] = MappingProxyType(
+    {
+        "ethereum": [
+            {
+                "symbol": "USDC",
+                "name": "USD Coin",
+                "contract_address": "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+                "decimals": 6,
+            },
+            {
+                "symbol": "USDT",
+                "name": "Tether USD",
+                "contract_address": "0xdAC17F958D2ee523a2206206994597C13D831ec7",
+                "decimals": 6,
+            },
+            {
+                "symbol": "DAI",
+                "name": "Dai Stablecoin",
+                "contract_address": "0x6B175474E89094C44Da98b954EedeAC495271d0F",
+                "decimals": 18,
+            },
+            {
+                "symbol": "WETH",
+                "name": "Wrapped Ether",
+                "contract_address": "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2",
+                "decimals": 18,
+            },
+        ],
+        "arbitrum": [
+            {
+                "symbol": "USDC",
+                "name": "USD Coin",
+                "contract_address": "0xaf88d065e77c8cC2239327C5EDb3A432268e5831",
+                "decimals": 6,
+            },
+            {
+                "symbol": "USDT",
+                "name": "Tether USD",
+                "contract_address": "0xFd086bC7CD5C481DCC9C85ebE478A1C0b69FCbb9",
+                "decimals": 6,
+            },
+        ],
+        "base": [
+            {
+                "symbol": "USDC",
+                "name": "USD Coin",
+                "contract_address": "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",
+                "decimals": 6,
+            },
+            {
+                "symbol": "USDT",
+                "name": "Tether USD",
+                "contract_address": "0xfde4C96c8593536E31F229EA8f37b2ADa2699bb2",
+                "decimals": 6,
+            },
+        ],
+        "polygon": [
+            {
+                "symbol": "USDC",
+                "name": "USD Coin",
+                "contract_address": "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174",
+                "decimals": 6,
+            },
+            {
+                "symbol": "USDT",
+                "name": "Tether USD",
+                "contract_address": "0xc2132D05D31c914a87C6611C10748AEb04B58e8F",
+                "decimals": 6,
+            },
+        ],
+        "bsc": [
+            {
+                "symbol": "USDC",
+                "name": "USD Coin",
+                "contract_address": "0x8AC76a51cc950d9822D68b83fE1Ad97B32Cd580d",
+                "decimals": 18,
+            },
+            {
+                "symbol": "USDT",
+                "name": "Tether USD",
+                "contract_address": "0x55d398326f99059fF775485246999027B3197955",
+                "decimals": 18,
+            },
+        ],
+    }
+)
+
+
+# 已知 Sui 代币的小数位数映射
+_KNOWN_SUI_DECIMALS: Mapping[str, int] = MappingProxyType(
+    {
+        "0x2::sui::SUI": 9,
+        "0xdba34672e30cb065b1f93e3ab55318768fd6fef66c15942c9f7cb846e2f900e7::usdc::USDC": 6,
+        "0xc060006111016b8a020ad5b33834984a437aaa7d3c74c18e09a95d48aceab08c::coin::COIN": 6,
+    }
+)
+
+
+@lru_cache(maxsize=4096)
+def _get_sui_token_decimals(coin_type: str) -> int:
+    """获取Sui代币的小数位数（coin_type 在请求间高度重复，结果做 LRU 缓存）"""
+    # 检查已知代币
+    if coin_type in _KNOWN_SUI_DECIMALS:
+        return _KNOWN_SUI_DECIMALS[coin_type]
+
+    # 根据代币符号推断
+    lowered = coin_type.lower()
+    if "usdc" in lowered or "usdt" in lowered:
+        return 6
+
+    # 默认使用9位小数（Sui标准）
+    return 9
+
+
+@lru_cache(maxsize=4096)
+def _extract_sui_token_symbol(coin_type: str) -> str:
+    """从 Sui coin_type 中提取代币符号（结果做 LRU 缓存）"""
+    try:
+        # coin_type 格式通常是: 0x...::module::TokenName
+        parts = coin_type.split("::")
+        if len(parts) >= 3:
+            return parts[-1].upper()
+        else:
+            # 如果格式不标准，返回地址的前8位
+            return coin_type[:8].upper()
+    except Exception:
+        return coin_type[:8].upper()
+
+
+@lru_cache(maxsize=64)
+def _native_token_info(chain_name: str) -> Mapping[str, object]:
+    """按链缓存原生代币信息（PREDEFINED_TOKENS 为静态表，返回只读映射）"""
+    native_token = get_native_token(chain_name)
+    if native_token:
+        return MappingProxyType(
+            {
+                "symbol": native_token["symbol"],
+                "name": native_token["name"],
+                "decimals": native_token["decimals"],
+            }
+        )
+
+    # 如果没有找到，返回默认值
+    return MappingProxyType({"symbol": "UNKNOWN", "name": "Unknown", "decimals": 18})
+
 
 class BlockchainService:
     """区块链服务类，用于获取代币余额和钱包信息"""
@@ -29,9 +624,20 @@ class BlockchainService:
         """初始化区块链服务"""
         self.web3_instances = {}
         self.connection_status = {}
-        self.http_client = httpx.AsyncClient(timeout=30.0)
+        self.http_client = get_http_client()
         self._initialization_lock = asyncio.Lock()
         self._chain_locks = {}  # 每个链的独立锁
+        # ERC20 精度缓存（精度不会变化），键为 (chain_name, 合约地址小写)
+        self._erc20_decimals: Dict[tuple, int] = {}
+        # 进行中的余额查询及其短期结果缓存，键为 (chain_name, address, token)
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+        self._balance_cache: Dict[tuple, tuple] = {}
+        # 按链类型分发的代币发现方法，未列出的链类型按 EVM 处理
+        self._dispatch = {
+            "solana": self._discover_solana_tokens,
+            "sui": self._discover_sui_tokens,
+            "bitcoin": self._discover_bitcoin_tokens,
+        }
 
         # 初始化每个链的锁
         for chain_name in SUPPORTED_CHAINS.keys():
@@ -143,16 +749,6 @@ class BlockchainService:
             }
             return False
 
-    async def _async_initialize(self):
-        """异步初始化Web3实例（已废弃，改为按需初始化）"""
-        # 保留此方法以兼容现有代码，但不执行任何操作
-        logger.info("使用按需初始化模式，跳过全量初始化")
-
-    async def _initialize_web3_instances(self):
-        """初始化各链的 Web3 实例（已废弃，改为按需初始化）"""
-        # 保留此方法以兼容现有代码，但不执行任何操作
-        logger.info("使用按需初始化模式，跳过全量初始化")
-
     def _is_connection_healthy(self, chain_name: str) -> bool:
         """检查连接是否健康"""
         if chain_name not in self.web3_instances:
@@ -166,11 +762,6 @@ class BlockchainService:
         except Exception:
             return False
 
-    async def ensure_initialized(self):
-        """确保服务已初始化（兼容性方法，现在不执行任何操作）"""
-        # 改为按需初始化，不再预先初始化所有链
-        logger.debug("使用按需初始化模式，无需预先初始化")
-
     async def reconnect_chain(self, chain_name: str) -> Optional[bool]:
         """重新连接指定链"""
         async with self._chain_locks.get(chain_name, asyncio.Lock()):
@@ -270,8 +861,42 @@ class BlockchainService:
         Returns:
             代币余额
         """
+        chain_name = chain_name.lower()
+        key = (
+            chain_name,
+            _normalize_key_part(address),
+            _normalize_key_part(token_contract_address or ""),
+        )
+
+        cached = self._balance_cache.get(key)
+        if cached and time.monotonic() - cached[1] < _BALANCE_CACHE_TTL:
+            return cached[0]
+
+        # 相同的查询正在进行时直接等待其结果，避免重复的 RPC 请求
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._fetch_token_balance(address, token_contract_address, chain_name)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        balance = await asyncio.shield(task)
+        now = time.monotonic()
+        if len(self._balance_cache) >= 1024:
+            self._balance_cache = {
+                k: v
+                for k, v in self._balance_cache.items()
+                if now - v[1] < _BALANCE_CACHE_TTL
+            }
+        self._balance_cache[key] = (balance, now)
+        return balance
+
+    async def _fetch_token_balance(
+        self, address: str, token_contract_address: Optional[str], chain_name: str
+    ) -> float:
+        """按链类型查询代币余额"""
         try:
-            chain_name = chain_name.lower()
             chain_config = SUPPORTED_CHAINS.get(chain_name)
             if not chain_config:
                 logger.error(f"不支持的区块链: {chain_name}")
@@ -315,7 +940,7 @@ class BlockchainService:
             if token_contract_address:
                 # ERC20 代币
                 return await self._get_erc20_balance(
-                    w3, address, token_contract_address
+                    w3, address, token_contract_address, chain_name
                 )
             else:
                 # 原生代币
@@ -329,9 +954,6 @@ class BlockchainService:
         self, address: str, token_mint: Optional[str], chain_config: dict
     ) -> float:
         """获取 Solana 代币余额（带重试机制）"""
-        max_retries = 3
-        base_delay = 2
-
         # 备用 Solana RPC 节点
         rpc_urls = [
             chain_config["rpc_url"],  # 主节点
@@ -340,145 +962,190 @@ class BlockchainService:
             "https://solana-mainnet.g.alchemy.com/v2/demo",  # Alchemy Demo
             "https://api.mainnet-beta.solana.com",  # 官方备用
         ]
+        # 跳过冷却中的节点，其余按健康状况排序
+        rpc_urls = _rank_rpc_urls(rpc_urls)
+
+        if not token_mint or token_mint.lower() == "native":
+            # 获取 SOL 余额
+            payload = {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "getBalance",
+                "params": [address],
+            }
+        else:
+            # 获取 SPL 代币余额
+            payload = {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "getTokenAccountsByOwner",
+                "params": [
+                    address,
+                    {"mint": token_mint},
+                    {"encoding": "jsonParsed"},
+                ],
+            }
 
         for rpc_url in rpc_urls:
-            for attempt in range(max_retries):
-                try:
-                    if not token_mint or token_mint.lower() == "native":
-                        # 获取 SOL 余额
-                        payload = {
-                            "jsonrpc": "2.0",
-                            "id": 1,
-                            "method": "getBalance",
-                            "params": [address],
-                        }
-                    else:
-                        # 获取 SPL 代币余额
-                        payload = {
-                            "jsonrpc": "2.0",
-                            "id": 1,
-                            "method": "getTokenAccountsByOwner",
-                            "params": [
-                                address,
-                                {"mint": token_mint},
-                                {"encoding": "jsonParsed"},
-                            ],
-                        }
-
-                    # 添加超时设置
-                    timeout = httpx.Timeout(30.0, connect=10.0)
-                    async with httpx.AsyncClient(timeout=timeout) as client:
-                        response = await client.post(rpc_url, json=payload)
-
-                        # 检查HTTP状态码
-                        if response.status_code == 429:
-                            # 429 Too Many Requests - 等待后重试
-                            wait_time = (
-                                base_delay * (2**attempt) + 30
-                            )  # 指数退避 + 额外等待
-                            logger.warning(
-                                f"Solana RPC 速率限制 (尝试 {attempt + 1}/{max_retries}，RPC: {rpc_url})，等待 {wait_time} 秒"
-                            )
-                            if attempt < max_retries - 1:
-                                await asyncio.sleep(wait_time)
-                                continue
-                            else:
-                                # 当前RPC节点重试次数用完，尝试下一个节点
-                                logger.warning(
-                                    f"RPC节点 {rpc_url} 重试次数用完，尝试下一个节点"
-                                )
-                                break
-
-                        response.raise_for_status()
-                        data = response.json()
-
-                        if "error" in data:
-                            error_code = data["error"].get("code", 0)
-                            error_message = data["error"].get("message", "未知错误")
-
-                            # 如果是速率限制错误，等待后重试
-                            if (
-                                error_code == 429
-                                or "too many requests" in error_message.lower()
-                            ):
-                                wait_time = base_delay * (2**attempt) + 30
-                                logger.warning(
-                                    f"Solana RPC 速率限制错误 (尝试 {attempt + 1}/{max_retries}，RPC: {rpc_url})，等待 {wait_time} 秒"
-                                )
-                                if attempt < max_retries - 1:
-                                    await asyncio.sleep(wait_time)
-                                    continue
-                                else:
-                                    break
-                            else:
-                                logger.error(f"Solana RPC 错误: {data['error']}")
-                                return 0.0
-
-                        # 处理成功响应
-                        if not token_mint or token_mint.lower() == "native":
-                            # SOL 余额（单位：lamports，1 SOL = 10^9 lamports）
-                            lamports = data["result"]["value"]
-                            balance = lamports / 1_000_000_000
-                            logger.debug(
-                                f"成功获取 SOL 余额: {balance} (RPC: {rpc_url})"
-                            )
-                            return balance
-                        else:
-                            # SPL 代币余额
-                            accounts = data["result"]["value"]
-                            if not accounts:
-                                return 0.0
-
-                            total_balance = 0
-                            for account in accounts:
-                                token_amount = account["account"]["data"]["parsed"][
-                                    "info"
-                                ]["tokenAmount"]
-                                balance = float(token_amount["uiAmount"] or 0)
-                                total_balance += balance
-
-                            logger.debug(
-                                f"成功获取 SPL 代币余额: {total_balance} (RPC: {rpc_url})"
-                            )
-                            return total_balance
+            data = await self._post_with_retry(rpc_url, payload, "余额查询")
+            if data is None:
+                # 当前RPC节点失败，尝试下一个节点
+                continue
+
+            if "error" in data:
+                logger.error(f"Solana RPC 错误: {data['error']}")
+                return 0.0
+
+            try:
+                if not token_mint or token_mint.lower() == "native":
+                    # SOL 余额（单位：lamports，1 SOL = 10^9 lamports）
+                    lamports = data["result"]["value"]
+                    balance = lamports / 1_000_000_000
+                    logger.debug(f"成功获取 SOL 余额: {balance} (RPC: {rpc_url})")
+                    return balance
+
+                # SPL 代币余额
+                accounts = data["result"]["value"]
+                if not accounts:
+                    return 0.0
+
+                total_balance = 0
+                for account in accounts:
+                    token_amount = account["account"]["data"]["parsed"]["info"][
+                        "tokenAmount"
+                    ]
+                    balance = float(token_amount["uiAmount"] or 0)
+                    total_balance += balance
+
+                logger.debug(
+                    f"成功获取 SPL 代币余额: {total_balance} (RPC: {rpc_url})"
+                )
+                return total_balance
+
+            except Exception as e:
+                logger.warning(f"解析 Solana 余额响应失败 (RPC: {rpc_url}): {e}")
+                continue
+
+        logger.error("所有 Solana RPC 节点都失败，无法获取余额")
+        return 0.0
+
+    async def _rpc_post(self, rpc_url: str, payload) -> httpx.Response:
+        """发送 JSON-RPC 请求（使用 orjson 序列化请求体）"""
+        return await self.http_client.post(
+            rpc_url, content=orjson.dumps(payload), headers=_JSON_HEADERS
+        )
+
+    async def _post_with_retry(
+        self,
+        rpc_url: str,
+        payload,
+        context: str,
+    ):
+        """向单个 Solana RPC 节点发送请求，统一处理速率限制、超时和 HTTP 错误的重试
+
+        Returns:
+            解析后的响应数据；非速率限制的 RPC 错误会原样返回，由调用方处理。
+            该节点重试次数用完或请求失败时返回 None。
+        """
+        max_retries = _SOL_MAX_RETRIES
+        for attempt in range(max_retries):
+            try:
+                response = await self._rpc_post(rpc_url, payload)
 
-                except httpx.TimeoutException as e:
+                # 检查HTTP状态码
+                if response.status_code == 429:
+                    _record_rpc_failure(rpc_url)
+                    wait_time = _compute_backoff(response, attempt)
                     logger.warning(
-                        f"Solana RPC 超时 (尝试 {attempt + 1}/{max_retries}，RPC: {rpc_url}): {e}"
+                        f"Solana RPC 速率限制 ({context}，尝试 {attempt + 1}/{max_retries}，RPC: {rpc_url})，等待 {wait_time:.1f} 秒"
                     )
                     if attempt < max_retries - 1:
-                        await asyncio.sleep(base_delay * (attempt + 1))
+                        await asyncio.sleep(wait_time)
                         continue
-                    else:
-                        break
+                    logger.warning(f"RPC节点 {rpc_url} 重试次数用完，尝试下一个节点")
+                    return None
+
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+
+                # 批量请求返回列表，以第一个错误为准
+                items = data if isinstance(data, list) else [data]
+                error = next(
+                    (item["error"] for item in items if "error" in item), None
+                )
+                if error is not None:
+                    error_code = error.get("code", 0)
+                    error_message = error.get("message", "未知错误")
 
-                except httpx.HTTPStatusError as e:
-                    if e.response.status_code == 429:
-                        wait_time = base_delay * (2**attempt) + 30
+                    if error_code == 429 or "too many requests" in error_message.lower():
+                        _record_rpc_failure(rpc_url)
+                        wait_time = _compute_backoff(response, attempt)
                         logger.warning(
-                            f"Solana RPC HTTP 429 (尝试 {attempt + 1}/{max_retries}，RPC: {rpc_url})，等待 {wait_time} 秒"
+                            f"Solana RPC 速率限制错误 ({context}，尝试 {attempt + 1}/{max_retries}，RPC: {rpc_url})，等待 {wait_time:.1f} 秒"
                         )
                         if attempt < max_retries - 1:
                             await asyncio.sleep(wait_time)
                             continue
-                        else:
-                            break
-                    else:
-                        logger.error(f"Solana RPC HTTP 错误 (RPC: {rpc_url}): {e}")
-                        break
+                        return None
 
-                except Exception as e:
+                _record_rpc_success(rpc_url)
+                return data
+
+            except httpx.TimeoutException as e:
+                _record_rpc_failure(rpc_url)
+                logger.warning(
+                    f"Solana RPC 超时 ({context}，尝试 {attempt + 1}/{max_retries}，RPC: {rpc_url}): {e}"
+                )
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(_SOL_GEN_WAITS[attempt])
+                    continue
+                return None
+
+            except httpx.HTTPStatusError as e:
+                _record_rpc_failure(rpc_url)
+                if e.response.status_code == 429:
+                    wait_time = _compute_backoff(e.response, attempt)
                     logger.warning(
-                        f"Solana RPC 请求失败 (尝试 {attempt + 1}/{max_retries}，RPC: {rpc_url}): {e}"
+                        f"Solana RPC HTTP 429 ({context}，尝试 {attempt + 1}/{max_retries}，RPC: {rpc_url})，等待 {wait_time:.1f} 秒"
                     )
                     if attempt < max_retries - 1:
-                        await asyncio.sleep(base_delay * (attempt + 1))
+                        await asyncio.sleep(wait_time)
                         continue
-                    else:
-                        break
+                    return None
+                logger.error(f"Solana RPC HTTP 错误 ({context}，RPC: {rpc_url}): {e}")
+                return None
 
-        logger.error("所有 Solana RPC 节点都失败，无法获取余额")
-        return 0.0
+            except Exception as e:
+                _record_rpc_failure(rpc_url)
+                logger.warning(
+                    f"Solana RPC 请求失败 ({context}，尝试 {attempt + 1}/{max_retries}，RPC: {rpc_url}): {e}"
+                )
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(_SOL_GEN_WAITS[attempt])
+                    continue
+                return None
+
+        return None
+
+    async def _race_rpc_urls(self, rpc_urls: List[str], try_one):
+        """并发请求所有 RPC 节点，返回最先成功的结果并取消其余请求
+
+        try_one(rpc_url) 在该节点失败时返回 None；所有节点都失败时返回 None。
+        """
+        tasks = [asyncio.create_task(try_one(rpc_url)) for rpc_url in rpc_urls]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    result = await next_done
+                except Exception as e:
+                    logger.warning(f"RPC 节点请求异常: {e}")
+                    continue
+                if result is not None:
+                    return result
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
 
     async def _get_sui_balance(
         self, address: str, coin_type: Optional[str], chain_config: dict
@@ -520,8 +1187,8 @@ class BlockchainService:
                 "params": [address, coin_type],
             }
 
-            response = await self.http_client.post(rpc_url, json=payload)
-            data = response.json()
+            response = await self._rpc_post(rpc_url, payload)
+            data = orjson.loads(response.content)
 
             if "error" in data:
                 logger.error(f"Sui RPC 错误: {data['error']}")
@@ -531,8 +1198,8 @@ class BlockchainService:
             total_balance = int(data["result"]["totalBalance"])
 
             # 根据代币类型确定小数位数
-            decimals = self._get_sui_token_decimals(coin_type)
-            balance = total_balance / (10**decimals)
+            decimals = _get_sui_token_decimals(coin_type)
+            balance = _scale_amount(total_balance, decimals)
 
             return balance
 
@@ -540,26 +1207,6 @@ class BlockchainService:
             logger.error(f"获取 Sui 余额失败: {e}")
             return 0.0
 
-    def _get_sui_token_decimals(self, coin_type: str) -> int:
-        """获取Sui代币的小数位数"""
-        # 已知代币的小数位数映射
-        known_decimals = {
-            "0x2::sui::SUI": 9,
-            "0xdba34672e30cb065b1f93e3ab55318768fd6fef66c15942c9f7cb846e2f900e7::usdc::USDC": 6,
-            "0xc060006111016b8a020ad5b33834984a437aaa7d3c74c18e09a95d48aceab08c::coin::COIN": 6,
-        }
-
-        # 检查已知代币
-        if coin_type in known_decimals:
-            return known_decimals[coin_type]
-
-        # 根据代币符号推断
-        if "usdc" in coin_type.lower() or "usdt" in coin_type.lower():
-            return 6
-
-        # 默认使用9位小数（Sui标准）
-        return 9
-
     async def _get_bitcoin_balance(self, address: str, chain_config: dict) -> float:
         """获取 Bitcoin 余额"""
         try:
@@ -567,12 +1214,14 @@ class BlockchainService:
             api_url = f"{chain_config['rpc_url']}/address/{address}"
 
             response = await self.http_client.get(api_url)
-            data = response.json()
+            response.raise_for_status()
+            data = orjson.loads(response.content)
 
             # Bitcoin 余额（单位：satoshi，1 BTC = 10^8 satoshi）
-            balance_satoshi = data.get("chain_stats", {}).get("funded_txo_sum", 0)
-            spent_satoshi = data.get("chain_stats", {}).get("spent_txo_sum", 0)
-            current_balance = balance_satoshi - spent_satoshi
+            stats = data.get("chain_stats") or {}
+            current_balance = stats.get("funded_txo_sum", 0) - stats.get(
+                "spent_txo_sum", 0
+            )
 
             return current_balance / 100_000_000  # 转换为 BTC
 
@@ -597,7 +1246,7 @@ class BlockchainService:
             return 0.0
 
     async def _get_erc20_balance(
-        self, w3: Web3, address: str, contract_address: str
+        self, w3: Web3, address: str, contract_address: str, chain_name: str
     ) -> float:
         """获取 ERC20 代币余额"""
         try:
@@ -610,36 +1259,18 @@ class BlockchainService:
                 logger.error(f"无效的合约地址格式: {contract_address}")
                 return 0.0
 
-            # ERC20 标准 ABI（只包含必要的函数）
-            erc20_abi = [
-                {
-                    "constant": True,
-                    "inputs": [{"name": "_owner", "type": "address"}],
-                    "name": "balanceOf",
-                    "outputs": [{"name": "balance", "type": "uint256"}],
-                    "type": "function",
-                },
-                {
-                    "constant": True,
-                    "inputs": [],
-                    "name": "decimals",
-                    "outputs": [{"name": "", "type": "uint8"}],
-                    "type": "function",
-                },
-            ]
+            token_address = w3.to_checksum_address(contract_address)
 
-            contract = w3.eth.contract(
-                address=w3.to_checksum_address(contract_address), abi=erc20_abi
+            # 直接通过 eth_call 调用 balanceOf，跳过 web3 合约对象的 ABI 处理
+            raw = await asyncio.to_thread(
+                w3.eth.call, {"to": token_address, "data": _encode_balanceof(address)}
             )
+            balance = int.from_bytes(raw, "big")
 
-            # 获取余额和精度
-            balance = contract.functions.balanceOf(
-                w3.to_checksum_address(address)
-            ).call()
-            decimals = contract.functions.decimals().call()
+            decimals = await self._get_erc20_decimals(w3, chain_name, token_address)
 
             # 转换为可读格式
-            return float(balance) / (10**decimals)
+            return _scale_amount(balance, decimals)
 
         except ContractLogicError as e:
             logger.error(f"合约调用失败: {e}")
@@ -648,6 +1279,95 @@ class BlockchainService:
             logger.error(f"获取 ERC20 余额失败: {e}")
             return 0.0
 
+    async def _batch_erc20_balances(
+        self,
+        rpc_url: str,
+        address: str,
+        chain_name: str,
+        contract_addresses: List[str],
+    ) -> Optional[list]:
+        """通过一次 JSON-RPC 批量 eth_call 查询多个 ERC20 余额（精度未缓存时一并查询）
+
+        Returns:
+            与 contract_addresses 一一对应的余额列表，单个代币失败时对应位置为异常对象；
+            节点不支持批量请求或请求失败时返回 None
+        """
+        if not contract_addresses or not self._is_valid_eth_address(address):
+            return None
+
+        balance_data = _encode_balanceof(address)
+        decimals_data = _DECIMALS_CALLDATA
+        batch_payload = []
+        for i, contract_address in enumerate(contract_addresses):
+            contract_address = contract_address.lower()
+            batch_payload.append(
+                {
+                    "jsonrpc": "2.0",
+                    "id": 2 * i,
+                    "method": "eth_call",
+                    "params": [
+                        {"to": contract_address, "data": balance_data},
+                        "latest",
+                    ],
+                }
+            )
+            if (chain_name, contract_address) not in self._erc20_decimals:
+                batch_payload.append(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": 2 * i + 1,
+                        "method": "eth_call",
+                        "params": [
+                            {"to": contract_address, "data": decimals_data},
+                            "latest",
+                        ],
+                    }
+                )
+
+        try:
+            response = await self._rpc_post(rpc_url, batch_payload)
+            response.raise_for_status()
+            results = orjson.loads(response.content)
+        except Exception as e:
+            logger.warning(f"批量 eth_call 请求失败，回退到逐个查询: {e}")
+            return None
+
+        if not isinstance(results, list):
+            logger.warning(f"RPC 节点不支持批量 eth_call，回退到逐个查询: {results}")
+            return None
+
+        results_by_id = {item.get("id"): item for item in results}
+        balances = []
+        for i, contract_address in enumerate(contract_addresses):
+            key = (chain_name, contract_address.lower())
+            try:
+                decimals = self._erc20_decimals.get(key)
+                if decimals is None:
+                    decimals = _decode_uint_result(results_by_id.get(2 * i + 1))
+                    self._erc20_decimals[key] = decimals
+                balance = _decode_uint_result(results_by_id.get(2 * i))
+                balances.append(_scale_amount(balance, decimals))
+            except Exception as e:
+                balances.append(e)
+
+        return balances
+
+    async def _get_erc20_decimals(
+        self, w3: Web3, chain_name: str, token_address: str
+    ) -> int:
+        """获取 ERC20 代币精度（按链和合约缓存）"""
+        key = (chain_name, token_address.lower())
+        decimals = self._erc20_decimals.get(key)
+        if decimals is None:
+            raw = await asyncio.to_thread(
+                w3.eth.call, {"to": token_address, "data": _SEL_DECIMALS}
+            )
+            if not raw:
+                raise ValueError(f"合约 {token_address} 未返回 decimals")
+            decimals = int.from_bytes(raw, "big")
+            self._erc20_decimals[key] = decimals
+        return decimals
+
     def _is_valid_eth_address(self, address: str) -> bool:
         """验证以太坊地址格式"""
         try:
@@ -691,15 +1411,8 @@ class BlockchainService:
         try:
             chain_config = SUPPORTED_CHAINS.get(chain_name.lower())
             if not chain_config:
-                return WalletCreationInfo(
-                    address=address,
-                    chain_name=chain_name,
-                    creation_timestamp=None,
-                    creation_date=None,
-                    first_transaction_hash=None,
-                    block_number=None,
-                    is_estimated=False,
-                    error_message=f"不支持的区块链: {chain_name}",
+                return WalletCreationInfo.error(
+                    address, chain_name, f"不支持的区块链: {chain_name}"
                 )
 
             chain_type = chain_config.get("chain_type", "evm")
@@ -725,16 +1438,7 @@ class BlockchainService:
             logger.error(
                 f"获取钱包创建时间失败 - 地址: {address}, 链: {chain_name}, 错误: {e}"
             )
-            return WalletCreationInfo(
-                address=address,
-                chain_name=chain_name,
-                creation_timestamp=None,
-                creation_date=None,
-                first_transaction_hash=None,
-                block_number=None,
-                is_estimated=False,
-                error_message=str(e),
-            )
+            return WalletCreationInfo.error(address, chain_name, str(e))
 
     async def _get_evm_wallet_creation_time(
         self, address: str, chain_name: str, chain_config: dict
@@ -743,15 +1447,8 @@ class BlockchainService:
         try:
             # 确保链已初始化
             if not await self.ensure_chain_initialized(chain_name):
-                return WalletCreationInfo(
-                    address=address,
-                    chain_name=chain_name,
-                    creation_timestamp=None,
-                    creation_date=None,
-                    first_transaction_hash=None,
-                    block_number=None,
-                    is_estimated=False,
-                    error_message=f"无法初始化 {chain_name} 链",
+                return WalletCreationInfo.error(
+                    address, chain_name, f"无法初始化 {chain_name} 链"
                 )
 
             w3 = self.web3_instances[chain_name]
@@ -766,7 +1463,7 @@ class BlockchainService:
             if response.status_code != 200:
                 return await self._estimate_wallet_creation_time(address, chain_name)
 
-            data = response.json()
+            data = orjson.loads(response.content)
 
             # 解析不同浏览器的响应格式
             first_tx = self._parse_explorer_response(data, chain_name)
@@ -781,7 +1478,7 @@ class BlockchainService:
                 try:
                     block = w3.eth.get_block(int(block_number))
                     timestamp = block["timestamp"]
-                    creation_date = datetime.fromtimestamp(timestamp).isoformat()
+                    creation_date = _iso_from_ts(timestamp)
 
                     return WalletCreationInfo(
                         address=address,
@@ -800,24 +1497,12 @@ class BlockchainService:
 
         except Exception as e:
             logger.error(f"获取 EVM 钱包创建时间失败: {e}")
-            return WalletCreationInfo(
-                address=address,
-                chain_name=chain_name,
-                creation_timestamp=None,
-                creation_date=None,
-                first_transaction_hash=None,
-                block_number=None,
-                is_estimated=False,
-                error_message=str(e),
-            )
+            return WalletCreationInfo.error(address, chain_name, str(e))
 
     async def _get_solana_wallet_creation_time(
         self, address: str, chain_config: dict
     ) -> WalletCreationInfo:
         """获取 Solana 钱包创建时间（带重试机制）"""
-        max_retries = 3
-        base_delay = 2
-
         # 备用 Solana RPC 节点
         rpc_urls = [
             chain_config["rpc_url"],  # 主节点
@@ -826,177 +1511,94 @@ class BlockchainService:
             "https://solana-mainnet.g.alchemy.com/v2/demo",  # Alchemy Demo
             "https://api.mainnet-beta.solana.com",  # 官方备用
         ]
+        # 跳过冷却中的节点，其余按健康状况排序
+        rpc_urls = _rank_rpc_urls(rpc_urls)
+        # 有节点正常应答但地址没有任何签名时记录下来，所有节点都应答后再据此判定
+        no_history = False
+
+        # 节点级失败返回 None，让竞速继续等待其他节点
+        async def _try_one(rpc_url: str) -> Optional[WalletCreationInfo]:
+            nonlocal no_history
+            # 签名按从新到旧返回，沿 before 向前翻页直到不足一页，即到达第一笔交易
+            signatures = []
+            before = None
+            is_estimated = False
+            for _ in range(_SOL_MAX_SIGNATURE_PAGES):
+                options = {"limit": _SOL_SIGNATURES_PAGE_LIMIT}
+                if before:
+                    options["before"] = before
+                payload = {
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "method": "getSignaturesForAddress",
+                    "params": [address, options],
+                }
 
-        for rpc_url in rpc_urls:
-            for attempt in range(max_retries):
-                try:
-                    # 获取账户的第一笔交易
-                    payload = {
-                        "jsonrpc": "2.0",
-                        "id": 1,
-                        "method": "getSignaturesForAddress",
-                        "params": [
-                            address,
-                            {
-                                "limit": 1000,  # 获取最多1000笔交易
-                                "before": None,  # 从最新开始
-                            },
-                        ],
-                    }
-
-                    # 添加超时设置
-                    timeout = httpx.Timeout(30.0, connect=10.0)
-                    async with httpx.AsyncClient(timeout=timeout) as client:
-                        response = await client.post(rpc_url, json=payload)
-
-                        # 检查HTTP状态码
-                        if response.status_code == 429:
-                            wait_time = base_delay * (2**attempt) + 30
-                            logger.warning(
-                                f"Solana RPC 速率限制 (钱包创建时间查询，尝试 {attempt + 1}/{max_retries}，RPC: {rpc_url})，等待 {wait_time} 秒"
-                            )
-                            if attempt < max_retries - 1:
-                                await asyncio.sleep(wait_time)
-                                continue
-                            else:
-                                break
-
-                        response.raise_for_status()
-                        data = response.json()
-
-                        if "error" in data:
-                            error_code = data["error"].get("code", 0)
-                            error_message = data["error"].get("message", "未知错误")
-
-                            if (
-                                error_code == 429
-                                or "too many requests" in error_message.lower()
-                            ):
-                                wait_time = base_delay * (2**attempt) + 30
-                                logger.warning(
-                                    f"Solana RPC 速率限制错误 (钱包创建时间查询，尝试 {attempt + 1}/{max_retries}，RPC: {rpc_url})，等待 {wait_time} 秒"
-                                )
-                                if attempt < max_retries - 1:
-                                    await asyncio.sleep(wait_time)
-                                    continue
-                                else:
-                                    break
-                            else:
-                                logger.error(
-                                    f"Solana RPC 错误 (钱包创建时间查询): {data['error']}"
-                                )
-                                return WalletCreationInfo(
-                                    address=address,
-                                    chain_name="solana",
-                                    creation_timestamp=None,
-                                    creation_date=None,
-                                    first_transaction_hash=None,
-                                    block_number=None,
-                                    is_estimated=False,
-                                    error_message=f"RPC错误: {data['error']}",
-                                )
-
-                        if not data.get("result"):
-                            return WalletCreationInfo(
-                                address=address,
-                                chain_name="solana",
-                                creation_timestamp=None,
-                                creation_date=None,
-                                first_transaction_hash=None,
-                                block_number=None,
-                                is_estimated=False,
-                                error_message="无法获取交易历史",
-                            )
+                data = await self._post_with_retry(
+                    rpc_url, payload, "钱包创建时间查询"
+                )
+                if data is None:
+                    return None
 
-                        signatures = data["result"]
-                        if not signatures:
-                            return WalletCreationInfo(
-                                address=address,
-                                chain_name="solana",
-                                creation_timestamp=None,
-                                creation_date=None,
-                                first_transaction_hash=None,
-                                block_number=None,
-                                is_estimated=False,
-                                error_message="该地址没有交易历史",
-                            )
+                if "error" in data:
+                    logger.warning(
+                        f"Solana RPC 错误 (钱包创建时间查询, {rpc_url}): "
+                        f"{data['error']}"
+                    )
+                    return None
+
+                page = data.get("result")
+                if page is None and before is None:
+                    return None
+                if page:
+                    signatures = page
+                if not page or len(page) < _SOL_SIGNATURES_PAGE_LIMIT:
+                    break
+                before = page[-1]["signature"]
+            else:
+                # 交易过多时只翻到上限页，结果标记为估算
+                logger.warning(
+                    f"Solana 地址交易数过多，仅翻页 {_SOL_MAX_SIGNATURE_PAGES} 页: {address}"
+                )
+                is_estimated = True
 
-                        # 获取最早的交易（列表末尾）
-                        first_signature = signatures[-1]
-                        signature = first_signature["signature"]
-                        block_time = first_signature.get("blockTime")
-
-                        if block_time:
-                            creation_date = datetime.fromtimestamp(
-                                block_time
-                            ).isoformat()
-                            logger.debug(
-                                f"成功获取 Solana 钱包创建时间: {creation_date} (RPC: {rpc_url})"
-                            )
-                            return WalletCreationInfo(
-                                address=address,
-                                chain_name="solana",
-                                creation_timestamp=block_time,
-                                creation_date=creation_date,
-                                first_transaction_hash=signature,
-                                block_number=None,
-                                is_estimated=False,
-                                error_message=None,
-                            )
+            if not signatures:
+                # 可能只是该节点数据滞后，交给其他节点
+                no_history = True
+                return None
 
-                        # 如果没有时间戳，使用估算方法
-                        return await self._estimate_wallet_creation_time(
-                            address, "solana"
-                        )
+            # 获取最早的交易（列表末尾）
+            first_signature = signatures[-1]
+            signature = first_signature["signature"]
+            block_time = first_signature.get("blockTime")
 
-                except httpx.TimeoutException as e:
-                    logger.warning(
-                        f"Solana RPC 超时 (钱包创建时间查询，尝试 {attempt + 1}/{max_retries}，RPC: {rpc_url}): {e}"
-                    )
-                    if attempt < max_retries - 1:
-                        await asyncio.sleep(base_delay * (attempt + 1))
-                        continue
-                    else:
-                        break
+            if block_time:
+                creation_date = _iso_from_ts(block_time)
+                logger.debug(
+                    f"成功获取 Solana 钱包创建时间: {creation_date} (RPC: {rpc_url})"
+                )
+                return WalletCreationInfo(
+                    address=address,
+                    chain_name="solana",
+                    creation_timestamp=block_time,
+                    creation_date=creation_date,
+                    first_transaction_hash=signature,
+                    block_number=None,
+                    is_estimated=is_estimated,
+                    error_message=None,
+                )
 
-                except httpx.HTTPStatusError as e:
-                    if e.response.status_code == 429:
-                        wait_time = base_delay * (2**attempt) + 30
-                        logger.warning(
-                            f"Solana RPC HTTP 429 (钱包创建时间查询，尝试 {attempt + 1}/{max_retries}，RPC: {rpc_url})，等待 {wait_time} 秒"
-                        )
-                        if attempt < max_retries - 1:
-                            await asyncio.sleep(wait_time)
-                            continue
-                        else:
-                            break
-                    else:
-                        logger.error(
-                            f"Solana RPC HTTP 错误 (钱包创建时间查询，RPC: {rpc_url}): {e}"
-                        )
-                        break
+            # 如果没有时间戳，使用估算方法
+            return await self._estimate_wallet_creation_time(address, "solana")
 
-                except Exception as e:
-                    logger.warning(
-                        f"Solana RPC 请求失败 (钱包创建时间查询，尝试 {attempt + 1}/{max_retries}，RPC: {rpc_url}): {e}"
-                    )
-                    if attempt < max_retries - 1:
-                        await asyncio.sleep(base_delay * (attempt + 1))
-                        continue
-                    else:
-                        break
+        result = await self._race_rpc_urls(rpc_urls, _try_one)
+        if result is not None:
+            return result
+        if no_history:
+            return WalletCreationInfo.error(address, "solana", "该地址没有交易历史")
 
         logger.error("所有 Solana RPC 节点都失败，无法获取钱包创建时间")
-        return WalletCreationInfo(
-            address=address,
-            chain_name="solana",
-            creation_timestamp=None,
-            creation_date=None,
-            first_transaction_hash=None,
-            block_number=None,
-            is_estimated=False,
-            error_message="所有RPC节点都失败",
-        )
+        return WalletCreationInfo.error(address, "solana", "所有RPC节点都失败")
 
     async def _get_sui_wallet_creation_time(
         self, address: str, chain_config: dict
@@ -1009,59 +1611,63 @@ class BlockchainService:
 
         except Exception as e:
             logger.error(f"获取 Sui 钱包创建时间失败: {e}")
-            return WalletCreationInfo(
-                address=address,
-                chain_name="sui",
-                creation_timestamp=None,
-                creation_date=None,
-                first_transaction_hash=None,
-                block_number=None,
-                is_estimated=False,
-                error_message=str(e),
-            )
+            return WalletCreationInfo.error(address, "sui", str(e))
 
     async def _get_bitcoin_wallet_creation_time(
         self, address: str, chain_config: dict
     ) -> WalletCreationInfo:
         """获取 Bitcoin 钱包创建时间"""
         try:
-            # 使用 Blockstream API 获取地址的第一笔交易
-            api_url = f"{chain_config['rpc_url']}/address/{address}/txs"
+            # 使用 Blockstream API：先读取地址摘要得到已确认交易数
+            base_url = f"{chain_config['rpc_url']}/address/{address}"
 
-            response = await self.http_client.get(api_url)
+            response = await self.http_client.get(base_url)
             if response.status_code != 200:
-                return WalletCreationInfo(
-                    address=address,
-                    chain_name="bitcoin",
-                    creation_timestamp=None,
-                    creation_date=None,
-                    first_transaction_hash=None,
-                    block_number=None,
-                    is_estimated=False,
-                    error_message="无法获取交易历史",
+                return WalletCreationInfo.error(address, "bitcoin", "无法获取交易历史")
+
+            stats = orjson.loads(response.content).get("chain_stats") or {}
+            tx_count = stats.get("tx_count", 0)
+            if not tx_count:
+                return WalletCreationInfo.error(address, "bitcoin", "该地址没有交易历史")
+
+            # 已确认交易按从新到旧分页（每页 25 笔），沿 last_seen_txid 翻到最后一页
+            transactions = []
+            page_url = f"{base_url}/txs/chain"
+            is_estimated = False
+            for page_index in range(_BTC_MAX_TX_PAGES):
+                response = await self.http_client.get(page_url)
+                if response.status_code != 200:
+                    return WalletCreationInfo.error(
+                        address, "bitcoin", "无法获取交易历史"
+                    )
+
+                page = orjson.loads(response.content)
+                if not page:
+                    break
+                transactions = page
+                if len(page) < _BTC_TXS_PAGE_SIZE or (
+                    (page_index + 1) * _BTC_TXS_PAGE_SIZE >= tx_count
+                ):
+                    break
+                page_url = f"{base_url}/txs/chain/{page[-1]['txid']}"
+            else:
+                # 交易过多时只翻到上限页，结果标记为估算
+                logger.warning(
+                    f"Bitcoin 地址交易数过多 ({tx_count})，仅翻页 {_BTC_MAX_TX_PAGES} 页"
                 )
+                is_estimated = True
 
-            transactions = response.json()
             if not transactions:
-                return WalletCreationInfo(
-                    address=address,
-                    chain_name="bitcoin",
-                    creation_timestamp=None,
-                    creation_date=None,
-                    first_transaction_hash=None,
-                    block_number=None,
-                    is_estimated=False,
-                    error_message="该地址没有交易历史",
-                )
+                return WalletCreationInfo.error(address, "bitcoin", "该地址没有交易历史")
 
-            # 获取最早的交易（通常是列表的最后一个）
+            # 获取最早的交易（最后一页的最后一个）
             first_tx = transactions[-1]
             tx_hash = first_tx.get("txid")
 
             # 获取区块信息
             if "status" in first_tx and "block_time" in first_tx["status"]:
                 block_time = first_tx["status"]["block_time"]
-                creation_date = datetime.fromtimestamp(block_time).isoformat()
+                creation_date = _iso_from_ts(block_time)
 
                 return WalletCreationInfo(
                     address=address,
@@ -1070,7 +1676,7 @@ class BlockchainService:
                     creation_date=creation_date,
                     first_transaction_hash=tx_hash,
                     block_number=None,
-                    is_estimated=False,
+                    is_estimated=is_estimated,
                     error_message=None,
                 )
 
@@ -1078,27 +1684,14 @@ class BlockchainService:
 
         except Exception as e:
             logger.error(f"获取 Bitcoin 钱包创建时间失败: {e}")
-            return WalletCreationInfo(
-                address=address,
-                chain_name="bitcoin",
-                creation_timestamp=None,
-                creation_date=None,
-                first_transaction_hash=None,
-                block_number=None,
-                is_estimated=False,
-                error_message=str(e),
-            )
+            return WalletCreationInfo.error(address, "bitcoin", str(e))
 
     def _get_explorer_api_url(self, chain_name: str, address: str) -> Optional[str]:
         """获取区块浏览器 API URL"""
-        explorer_apis = {
-            "ethereum": f"https://api.etherscan.io/api?module=account&action=txlist&address={address}&startblock=0&endblock=99999999&page=1&offset=1&sort=asc&apikey=YourApiKeyToken",
-            "arbitrum": f"https://api.arbiscan.io/api?module=account&action=txlist&address={address}&startblock=0&endblock=99999999&page=1&offset=1&sort=asc&apikey=YourApiKeyToken",
-            "base": f"https://api.basescan.org/api?module=account&action=txlist&address={address}&startblock=0&endblock=99999999&page=1&offset=1&sort=asc&apikey=YourApiKeyToken",
-            "polygon": f"https://api.polygonscan.com/api?module=account&action=txlist&address={address}&startblock=0&endblock=99999999&page=1&offset=1&sort=asc&apikey=YourApiKeyToken",
-            "bsc": f"https://api.bscscan.com/api?module=account&action=txlist&address={address}&startblock=0&endblock=99999999&page=1&offset=1&sort=asc&apikey=YourApiKeyToken",
-        }
-        return explorer_apis.get(chain_name)
+        template = _EXPLORER_TEMPLATES.get(chain_name)
+        if not template:
+            return None
+        return template.format(address=address, apikey=settings.explorer_api_key)
 
     def _parse_explorer_response(self, data: dict, chain_name: str) -> Optional[dict]:
         """解析区块浏览器响应"""
@@ -1120,29 +1713,13 @@ class BlockchainService:
             # 或者基于链的创建时间等
             logger.info(f"使用估算方法获取钱包创建时间: {address} on {chain_name}")
 
-            return WalletCreationInfo(
-                address=address,
-                chain_name=chain_name,
-                creation_timestamp=None,
-                creation_date=None,
-                first_transaction_hash=None,
-                block_number=None,
-                is_estimated=True,
-                error_message="无法获取准确的创建时间，建议手动查询",
+            return WalletCreationInfo.error(
+                address, chain_name, "无法获取准确的创建时间，建议手动查询", estimated=True
             )
 
         except Exception as e:
             logger.error(f"估算钱包创建时间失败: {e}")
-            return WalletCreationInfo(
-                address=address,
-                chain_name=chain_name,
-                creation_timestamp=None,
-                creation_date=None,
-                first_transaction_hash=None,
-                block_number=None,
-                is_estimated=False,
-                error_message=str(e),
-            )
+            return WalletCreationInfo.error(address, chain_name, str(e))
 
     async def discover_wallet_tokens(
         self,
@@ -1170,35 +1747,13 @@ class BlockchainService:
                 logger.error(f"不支持的区块链: {chain_name}")
                 return []
 
-            chain_type = chain_config.get("chain_type", "evm")
-            discovered_tokens = []
-
-            # 根据链类型调用不同的发现方法
-            if chain_type == "solana":
-                discovered_tokens = await self._discover_solana_tokens(
-                    address, chain_config, include_zero_balance
-                )
-            elif chain_type == "sui":
-                discovered_tokens = await self._discover_sui_tokens(
-                    address, chain_config, include_zero_balance
-                )
-            elif chain_type == "bitcoin":
-                discovered_tokens = await self._discover_bitcoin_tokens(
-                    address, chain_config
-                )
-            else:
-                # EVM 兼容链
-                discovered_tokens = await self._discover_evm_tokens(
-                    address, chain_name, chain_config, include_zero_balance
-                )
-
-            # 过滤掉价值过低的代币（如果设置了阈值）
-            if min_value_usdc > 0:
-                discovered_tokens = [
-                    token
-                    for token in discovered_tokens
-                    if token.value_usdc is None or token.value_usdc >= min_value_usdc
-                ]
+            # 根据链类型调用不同的发现方法（价值过低的代币在各发现方法中直接跳过）
+            handler = self._dispatch.get(
+                chain_config.get("chain_type", "evm"), self._discover_evm_tokens
+            )
+            discovered_tokens = await handler(
+                address, chain_config, include_zero_balance, min_value_usdc
+            )
 
             logger.info(f"在 {chain_name} 链上发现 {len(discovered_tokens)} 个代币")
             return discovered_tokens
@@ -1209,14 +1764,54 @@ class BlockchainService:
             )
             return []
 
+    async def discover_wallet_tokens_multi(
+        self,
+        address: str,
+        chain_names: List[str],
+        include_zero_balance: bool = False,
+        min_value_usdc: float = 0.01,
+    ) -> Dict[str, List[DiscoveredToken]]:
+        """
+        并发发现钱包在多条链上的代币
+
+        Args:
+            address: 钱包地址
+            chain_names: 区块链名称列表
+            include_zero_balance: 是否包含零余额代币
+            min_value_usdc: 最小价值阈值（USDC）
+
+        Returns:
+            链名称到发现代币列表的映射，单条链失败时对应列表为空
+        """
+        results = await asyncio.gather(
+            *[
+                self.discover_wallet_tokens(
+                    address, chain_name, include_zero_balance, min_value_usdc
+                )
+                for chain_name in chain_names
+            ],
+            return_exceptions=True,
+        )
+
+        discovered: Dict[str, List[DiscoveredToken]] = {}
+        for chain_name, result in zip(chain_names, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"发现钱包代币失败 - 地址: {address}, 链: {chain_name}, 错误: {result}"
+                )
+                result = []
+            discovered[chain_name] = result
+        return discovered
+
     async def _discover_evm_tokens(
         self,
         address: str,
-        chain_name: str,
         chain_config: dict,
         include_zero_balance: bool,
+        min_value_usdc: float = 0.0,
     ) -> List[DiscoveredToken]:
         """发现 EVM 兼容链的代币"""
+        chain_name = chain_config["name"]
         discovered_tokens = []
 
         try:
@@ -1231,21 +1826,20 @@ class BlockchainService:
             native_balance = await self._get_native_balance(w3, address)
             if native_balance > 0 or include_zero_balance:
                 native_info = self._get_native_token_info(chain_name)
-                native_token = DiscoveredToken(
-                    symbol=native_info["symbol"],
-                    name=native_info["name"],
-                    contract_address=None,
-                    balance=native_balance,
-                    decimals=native_info["decimals"],
-                    is_native=True,
-                    price_usdc=0.0,
-                    value_usdc=0.0,
+                native_token = DiscoveredToken.build(
+                    native_info["symbol"],
+                    native_info["name"],
+                    None,
+                    native_balance,
+                    native_info["decimals"],
+                    True,
                 )
-                discovered_tokens.append(native_token)
+                if _meets_min_value(native_token.value_usdc, min_value_usdc):
+                    discovered_tokens.append(native_token)
 
             # 2. 使用区块浏览器API获取ERC20代币
             erc20_tokens = await self._get_erc20_tokens_from_explorer(
-                address, chain_name, include_zero_balance
+                address, chain_name, include_zero_balance, min_value_usdc
             )
             discovered_tokens.extend(erc20_tokens)
 
@@ -1256,13 +1850,13 @@ class BlockchainService:
             return discovered_tokens
 
     async def _discover_solana_tokens(
-        self, address: str, chain_config: dict, include_zero_balance: bool
+        self,
+        address: str,
+        chain_config: dict,
+        include_zero_balance: bool,
+        min_value_usdc: float = 0.0,
     ) -> List[DiscoveredToken]:
         """发现 Solana 代币（带重试机制）"""
-        discovered_tokens = []
-        max_retries = 3
-        base_delay = 2
-
         # 备用 Solana RPC 节点
         rpc_urls = [
             chain_config["rpc_url"],  # 主节点
@@ -1271,218 +1865,188 @@ class BlockchainService:
             "https://solana-mainnet.g.alchemy.com/v2/demo",  # Alchemy Demo
             "https://api.mainnet-beta.solana.com",  # 官方备用
         ]
+        # 跳过冷却中的节点，其余按健康状况排序
+        rpc_urls = _rank_rpc_urls(rpc_urls)
 
-        for rpc_url in rpc_urls:
-            for attempt in range(max_retries):
-                try:
-                    # 添加超时设置
-                    timeout = httpx.Timeout(30.0, connect=10.0)
-                    async with httpx.AsyncClient(timeout=timeout) as client:
-                        # 1. 获取 SOL 余额
-                        sol_payload = {
-                            "jsonrpc": "2.0",
-                            "id": 1,
-                            "method": "getBalance",
-                            "params": [address],
-                        }
-
-                        response = await client.post(rpc_url, json=sol_payload)
-
-                        # 检查HTTP状态码
-                        if response.status_code == 429:
-                            wait_time = base_delay * (2**attempt) + 30
-                            logger.warning(
-                                f"Solana RPC 速率限制 (代币发现，尝试 {attempt + 1}/{max_retries}，RPC: {rpc_url})，等待 {wait_time} 秒"
-                            )
-                            if attempt < max_retries - 1:
-                                await asyncio.sleep(wait_time)
-                                continue
-                            else:
-                                break
-
-                        response.raise_for_status()
-                        data = response.json()
-
-                        if "error" in data:
-                            error_code = data["error"].get("code", 0)
-                            error_message = data["error"].get("message", "未知错误")
-
-                            if (
-                                error_code == 429
-                                or "too many requests" in error_message.lower()
-                            ):
-                                wait_time = base_delay * (2**attempt) + 30
-                                logger.warning(
-                                    f"Solana RPC 速率限制错误 (代币发现，尝试 {attempt + 1}/{max_retries}，RPC: {rpc_url})，等待 {wait_time} 秒"
-                                )
-                                if attempt < max_retries - 1:
-                                    await asyncio.sleep(wait_time)
-                                    continue
-                                else:
-                                    break
-                            else:
-                                logger.error(
-                                    f"Solana RPC 错误 (代币发现): {data['error']}"
-                                )
-                                break
-
-                        if "result" in data:
-                            lamports = data["result"]["value"]
-                            sol_balance = lamports / 1_000_000_000
-
-                            if sol_balance > 0 or include_zero_balance:
-                                sol_token = DiscoveredToken(
-                                    symbol="SOL",
-                                    name="Solana",
-                                    contract_address=None,
-                                    balance=sol_balance,
-                                    decimals=9,
-                                    is_native=True,
-                                    price_usdc=0.0,
-                                    value_usdc=0.0,
-                                )
-                                discovered_tokens.append(sol_token)
-
-                        # 2. 获取所有 SPL 代币账户
-                        spl_payload = {
-                            "jsonrpc": "2.0",
-                            "id": 1,
-                            "method": "getTokenAccountsByOwner",
-                            "params": [
-                                address,
-                                {
-                                    "programId": "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
-                                },
-                                {"encoding": "jsonParsed"},
-                            ],
-                        }
-
-                        response = await client.post(rpc_url, json=spl_payload)
-
-                        # 再次检查HTTP状态码
-                        if response.status_code == 429:
-                            wait_time = base_delay * (2**attempt) + 30
-                            logger.warning(
-                                f"Solana RPC 速率限制 (SPL代币查询，尝试 {attempt + 1}/{max_retries}，RPC: {rpc_url})，等待 {wait_time} 秒"
-                            )
-                            if attempt < max_retries - 1:
-                                await asyncio.sleep(wait_time)
-                                continue
-                            else:
-                                break
-
-                        response.raise_for_status()
-                        data = response.json()
-
-                        if "error" in data:
-                            error_code = data["error"].get("code", 0)
-                            error_message = data["error"].get("message", "未知错误")
-
-                            if (
-                                error_code == 429
-                                or "too many requests" in error_message.lower()
-                            ):
-                                wait_time = base_delay * (2**attempt) + 30
-                                logger.warning(
-                                    f"Solana RPC 速率限制错误 (SPL代币查询，尝试 {attempt + 1}/{max_retries}，RPC: {rpc_url})，等待 {wait_time} 秒"
-                                )
-                                if attempt < max_retries - 1:
-                                    await asyncio.sleep(wait_time)
-                                    continue
-                                else:
-                                    break
-                            else:
-                                logger.error(
-                                    f"Solana RPC 错误 (SPL代币查询): {data['error']}"
-                                )
-                                break
-
-                        if "result" in data:
-                            accounts = data["result"]["value"]
-
-                            for account in accounts:
-                                try:
-                                    token_info = account["account"]["data"]["parsed"][
-                                        "info"
-                                    ]
-                                    token_amount = token_info["tokenAmount"]
-                                    mint = token_info["mint"]
-
-                                    balance = float(token_amount["uiAmount"] or 0)
-                                    decimals = token_amount["decimals"]
-
-                                    if balance > 0 or include_zero_balance:
-                                        # 获取代币元数据
-                                        (
-                                            symbol,
-                                            name,
-                                        ) = await self._get_solana_token_metadata(
-                                            mint, rpc_url
-                                        )
-
-                                        solana_token = DiscoveredToken(
-                                            symbol=symbol or mint[:8].upper(),
-                                            name=name or f"Token {mint[:8]}",
-                                            contract_address=mint,
-                                            balance=balance,
-                                            decimals=decimals,
-                                            is_native=False,
-                                            price_usdc=0.0,
-                                            value_usdc=0.0,
-                                        )
-                                        discovered_tokens.append(solana_token)
-
-                                except Exception as e:
-                                    logger.warning(f"解析 Solana 代币账户失败: {e}")
-                                    continue
-
-                        logger.debug(
-                            f"成功发现 {len(discovered_tokens)} 个 Solana 代币 (RPC: {rpc_url})"
-                        )
-                        return discovered_tokens
+        async def _race_token_accounts(binary: bool) -> Optional[Tuple[str, dict]]:
+            """竞速获取 SOL 余额和 SPL 代币账户，返回 (选定的节点, 按 id 索引的结果)"""
+            # 通过一次 JSON-RPC 批量请求同时获取 SOL 余额和所有 SPL 代币账户
+            batch_payload = [
+                {
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "method": "getBalance",
+                    "params": [address],
+                },
+                {
+                    "jsonrpc": "2.0",
+                    "id": 2,
+                    "method": "getTokenAccountsByOwner",
+                    "params": [
+                        address,
+                        {"programId": "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"},
+                        {"encoding": "base64" if binary else "jsonParsed"},
+                    ],
+                },
+            ]
 
-                except httpx.TimeoutException as e:
-                    logger.warning(
-                        f"Solana RPC 超时 (代币发现，尝试 {attempt + 1}/{max_retries}，RPC: {rpc_url}): {e}"
-                    )
-                    if attempt < max_retries - 1:
-                        await asyncio.sleep(base_delay * (attempt + 1))
+            async def _try_one(rpc_url: str) -> Optional[Tuple[str, dict]]:
+                # 只竞速余额批量请求；元数据在选定节点上统一获取，避免每个节点重复请求
+                data = await self._post_with_retry(rpc_url, batch_payload, "代币发现")
+                if data is None:
+                    return None
+
+                # 节点拒绝整个批量请求时会返回单个错误对象
+                if isinstance(data, dict):
+                    data = [data]
+                results = {item.get("id"): item for item in data}
+                errors = [item["error"] for item in data if "error" in item]
+                if errors:
+                    logger.error(f"Solana RPC 错误 (代币发现): {errors[0]}")
+                    return None
+                return rpc_url, results
+
+            return await self._race_rpc_urls(rpc_urls, _try_one)
+
+        binary = settings.solana_binary_token_accounts
+        raced = await _race_token_accounts(binary)
+        if raced is None:
+            logger.error("所有 Solana RPC 节点都失败，无法发现代币")
+            return []
+        rpc_url, results = raced
+
+        discovered_tokens = []
+
+        sol_data = results.get(1, {})
+        if "result" in sol_data:
+            lamports = sol_data["result"]["value"]
+            sol_balance = lamports / 1_000_000_000
+
+            if sol_balance > 0 or include_zero_balance:
+                sol_token = DiscoveredToken.build(
+                    "SOL",
+                    "Solana",
+                    None,
+                    sol_balance,
+                    9,
+                    True,
+                )
+                if _meets_min_value(sol_token.value_usdc, min_value_usdc):
+                    discovered_tokens.append(sol_token)
+
+        spl_data = results.get(2, {})
+        if "result" in spl_data:
+            accounts = spl_data["result"]["value"]
+
+            # 先解析所有账户，筛选出需要的代币
+            holdings = []
+            raw_holdings = []
+            for account in accounts:
+                try:
+                    if binary:
+                        raw = base64.b64decode(account["account"]["data"][0])
+                        mint, amount = _parse_spl_token_account(raw)
+                        if amount > 0 or include_zero_balance:
+                            raw_holdings.append((mint, amount))
                         continue
-                    else:
-                        break
 
-                except httpx.HTTPStatusError as e:
-                    if e.response.status_code == 429:
-                        wait_time = base_delay * (2**attempt) + 30
-                        logger.warning(
-                            f"Solana RPC HTTP 429 (代币发现，尝试 {attempt + 1}/{max_retries}，RPC: {rpc_url})，等待 {wait_time} 秒"
-                        )
-                        if attempt < max_retries - 1:
-                            await asyncio.sleep(wait_time)
-                            continue
-                        else:
-                            break
-                    else:
-                        logger.error(
-                            f"Solana RPC HTTP 错误 (代币发现，RPC: {rpc_url}): {e}"
-                        )
-                        break
+                    token_info = account["account"]["data"]["parsed"]["info"]
+                    token_amount = token_info["tokenAmount"]
+                    mint = token_info["mint"]
+
+                    balance = float(token_amount["uiAmount"] or 0)
+                    decimals = token_amount["decimals"]
+
+                    if balance > 0 or include_zero_balance:
+                        holdings.append((mint, balance, decimals))
 
                 except Exception as e:
-                    logger.warning(
-                        f"Solana RPC 请求失败 (代币发现，尝试 {attempt + 1}/{max_retries}，RPC: {rpc_url}): {e}"
-                    )
-                    if attempt < max_retries - 1:
-                        await asyncio.sleep(base_delay * (attempt + 1))
-                        continue
-                    else:
-                        break
+                    logger.warning(f"解析 Solana 代币账户失败: {e}")
+                    continue
 
-        logger.error("所有 Solana RPC 节点都失败，无法发现代币")
+            # 批量读取 mint 账户（二进制模式下同时取得小数位数），
+            # 其余代币再并发逐个获取元数据
+            if binary:
+                mints = [mint for mint, _ in raw_holdings]
+            else:
+                mints = [mint for mint, _, _ in holdings]
+            mint_metadata = await self._get_solana_mints_metadata(
+                mints, rpc_url, need_decimals=binary
+            )
+            # mint 账户读取失败时依次回退到已知代币表和 Token Registry
+            unresolved = set()
+            for mint, amount in raw_holdings:
+                decimals = _solana_mint_decimals.get(mint)
+                if decimals is None:
+                    decimals = await self._get_fallback_solana_decimals(mint)
+                if decimals is None:
+                    unresolved.add(mint)
+                    continue
+                holdings.append((mint, _scale_amount(amount, decimals), decimals))
+
+            if unresolved:
+                # 仍未知小数位数时改用 jsonParsed 重新获取代币账户（自带小数位数），
+                # 不能因为一次 mint 账户读取失败而丢掉持有的代币
+                logger.warning(
+                    f"{len(unresolved)} 个 Solana 代币小数位数未知，改用 jsonParsed 重新查询"
+                )
+                parsed = await _race_token_accounts(False)
+                parsed_accounts = []
+                if parsed is not None:
+                    parsed_result = parsed[1].get(2, {}).get("result") or {}
+                    parsed_accounts = parsed_result.get("value") or []
+                resolved = set()
+                for account in parsed_accounts:
+                    try:
+                        token_info = account["account"]["data"]["parsed"]["info"]
+                        mint = token_info["mint"]
+                        if mint not in unresolved:
+                            continue
+                        token_amount = token_info["tokenAmount"]
+                        decimals = token_amount["decimals"]
+                        _cache_solana_decimals(mint, decimals)
+                        holdings.append(
+                            (mint, float(token_amount["uiAmount"] or 0), decimals)
+                        )
+                        resolved.add(mint)
+                    except Exception as e:
+                        logger.warning(f"解析 Solana 代币账户失败: {e}")
+                for mint in unresolved - resolved:
+                    logger.warning(f"无法获取 Solana 代币小数位数，跳过: {mint}")
+            missing = [mint for mint, _, _ in holdings if mint not in mint_metadata]
+            metadatas = await asyncio.gather(
+                *[self._get_solana_token_metadata(mint, rpc_url) for mint in missing],
+                return_exceptions=True,
+            )
+            for mint, metadata in zip(missing, metadatas):
+                if isinstance(metadata, Exception):
+                    logger.warning(f"获取 Solana 代币元数据失败: {metadata}")
+                    continue
+                mint_metadata[mint] = metadata
+
+            for mint, balance, decimals in holdings:
+                symbol, name = mint_metadata.get(mint, (None, None))
+
+                solana_token = DiscoveredToken.build(
+                    symbol or mint[:8].upper(),
+                    name or f"Token {mint[:8]}",
+                    mint,
+                    balance,
+                    decimals,
+                    False,
+                )
+                if _meets_min_value(solana_token.value_usdc, min_value_usdc):
+                    discovered_tokens.append(solana_token)
+
+        logger.debug(f"成功发现 {len(discovered_tokens)} 个 Solana 代币 (RPC: {rpc_url})")
         return discovered_tokens
 
     async def _discover_sui_tokens(
-        self, address: str, chain_config: dict, include_zero_balance: bool
+        self,
+        address: str,
+        chain_config: dict,
+        include_zero_balance: bool,
+        min_value_usdc: float = 0.0,
     ) -> List[DiscoveredToken]:
         """发现 Sui 代币 - 优先使用BlockVision API"""
         try:
@@ -1497,23 +2061,31 @@ class BlockchainService:
                 logger.info(
                     f"使用数据聚合器发现Sui代币成功: {len(discovered_tokens)} 个代币"
                 )
-                return discovered_tokens
+                return [
+                    token
+                    for token in discovered_tokens
+                    if _meets_min_value(token.value_usdc, min_value_usdc)
+                ]
 
             # 如果数据聚合器失败，回退到原生RPC
             logger.info("数据聚合器未发现代币，回退到原生Sui RPC")
             return await self._discover_sui_tokens_rpc(
-                address, chain_config, include_zero_balance
+                address, chain_config, include_zero_balance, min_value_usdc
             )
 
         except Exception as e:
             logger.error(f"发现 Sui 代币失败: {e}")
             # 回退到原生RPC
             return await self._discover_sui_tokens_rpc(
-                address, chain_config, include_zero_balance
+                address, chain_config, include_zero_balance, min_value_usdc
             )
 
     async def _discover_sui_tokens_rpc(
-        self, address: str, chain_config: dict, include_zero_balance: bool
+        self,
+        address: str,
+        chain_config: dict,
+        include_zero_balance: bool,
+        min_value_usdc: float = 0.0,
     ) -> List[DiscoveredToken]:
         """使用原生Sui RPC发现代币"""
         discovered_tokens = []
@@ -1529,25 +2101,24 @@ class BlockchainService:
                 "params": [address, "0x2::sui::SUI"],
             }
 
-            response = await self.http_client.post(rpc_url, json=sui_payload)
-            data = response.json()
+            response = await self._rpc_post(rpc_url, sui_payload)
+            data = orjson.loads(response.content)
 
             if "result" in data:
                 total_balance = int(data["result"]["totalBalance"])
                 sui_balance = total_balance / 1_000_000_000  # SUI是9位小数
 
                 if sui_balance > 0 or include_zero_balance:
-                    sui_token = DiscoveredToken(
-                        symbol="SUI",
-                        name="Sui",
-                        contract_address=None,
-                        balance=sui_balance,
-                        decimals=9,
-                        is_native=True,
-                        price_usdc=0.0,
-                        value_usdc=0.0,
+                    sui_token = DiscoveredToken.build(
+                        "SUI",
+                        "Sui",
+                        None,
+                        sui_balance,
+                        9,
+                        True,
                     )
-                    discovered_tokens.append(sui_token)
+                    if _meets_min_value(sui_token.value_usdc, min_value_usdc):
+                        discovered_tokens.append(sui_token)
 
             # 2. 获取所有代币余额
             all_balances_payload = {
@@ -1557,13 +2128,12 @@ class BlockchainService:
                 "params": [address],
             }
 
-            response = await self.http_client.post(rpc_url, json=all_balances_payload)
-            data = response.json()
+            response = await self._rpc_post(rpc_url, all_balances_payload)
+            data = orjson.loads(response.content)
 
             if "result" in data:
-                balances = data["result"]
-
-                for balance_info in balances:
+                holdings = []
+                for balance_info in data["result"]:
                     coin_type = balance_info["coinType"]
                     total_balance = int(balance_info["totalBalance"])
 
@@ -1571,24 +2141,35 @@ class BlockchainService:
                     if coin_type == "0x2::sui::SUI":
                         continue
 
-                    # 使用正确的小数位数
-                    decimals = self._get_sui_token_decimals(coin_type)
-                    balance = total_balance / (10**decimals)
+                    if total_balance > 0 or include_zero_balance:
+                        holdings.append((coin_type, total_balance))
 
-                    if balance > 0 or include_zero_balance:
-                        # 从coin_type中提取代币信息
-                        token_symbol = self._extract_sui_token_symbol(coin_type)
-
-                        sui_token = DiscoveredToken(
-                            symbol=token_symbol,
-                            name=token_symbol,
-                            contract_address=coin_type,
-                            balance=balance,
-                            decimals=decimals,
-                            is_native=False,
-                            price_usdc=0.0,
-                            value_usdc=0.0,
-                        )
+                # 3. 批量获取代币元数据（小数位数、符号、名称）
+                coins_metadata = await self._get_sui_coins_metadata(
+                    [coin_type for coin_type, _ in holdings], rpc_url
+                )
+
+                for coin_type, total_balance in holdings:
+                    metadata = coins_metadata.get(coin_type) or {}
+
+                    # 元数据缺失时回退到已知小数位数和 coin_type 中的符号
+                    decimals = metadata.get("decimals")
+                    if decimals is None:
+                        decimals = _get_sui_token_decimals(coin_type)
+                    balance = _scale_amount(total_balance, decimals)
+                    token_symbol = metadata.get(
+                        "symbol"
+                    ) or _extract_sui_token_symbol(coin_type)
+
+                    sui_token = DiscoveredToken.build(
+                        token_symbol,
+                        metadata.get("name") or token_symbol,
+                        coin_type,
+                        balance,
+                        decimals,
+                        False,
+                    )
+                    if _meets_min_value(sui_token.value_usdc, min_value_usdc):
                         discovered_tokens.append(sui_token)
 
             logger.info(f"Sui RPC发现代币: {len(discovered_tokens)} 个")
@@ -1598,10 +2179,52 @@ class BlockchainService:
             logger.error(f"发现 Sui 代币失败: {e}")
             return discovered_tokens
 
+    async def _get_sui_coins_metadata(
+        self, coin_types: List[str], rpc_url: str
+    ) -> Dict[str, dict]:
+        """通过 JSON-RPC 批量请求获取 Sui 代币元数据（每批最多 20 个 suix_getCoinMetadata）"""
+        metadata = {}
+        for start in range(0, len(coin_types), _SUI_METADATA_BATCH_SIZE):
+            chunk = coin_types[start : start + _SUI_METADATA_BATCH_SIZE]
+            batch_payload = [
+                {
+                    "jsonrpc": "2.0",
+                    "id": i,
+                    "method": "suix_getCoinMetadata",
+                    "params": [coin_type],
+                }
+                for i, coin_type in enumerate(chunk)
+            ]
+
+            try:
+                response = await self._rpc_post(rpc_url, batch_payload)
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+            except Exception as e:
+                logger.warning(f"批量获取 Sui 代币元数据失败: {e}")
+                continue
+
+            # 节点拒绝整个批量请求时会返回单个错误对象
+            if isinstance(data, dict):
+                logger.warning(f"Sui RPC 错误 (批量代币元数据): {data.get('error')}")
+                continue
+
+            for item in data:
+                index = item.get("id")
+                result = item.get("result")
+                if isinstance(index, int) and 0 <= index < len(chunk) and result:
+                    metadata[chunk[index]] = result
+
+        return metadata
+
     async def _discover_bitcoin_tokens(
-        self, address: str, chain_config: dict
+        self,
+        address: str,
+        chain_config: dict,
+        include_zero_balance: bool = False,
+        min_value_usdc: float = 0.0,
     ) -> List[DiscoveredToken]:
-        """发现 Bitcoin 代币（只有 BTC）"""
+        """发现 Bitcoin 代币（只有 BTC，零余额时不返回，忽略 include_zero_balance）"""
         discovered_tokens = []
 
         try:
@@ -1609,17 +2232,16 @@ class BlockchainService:
             btc_balance = await self._get_bitcoin_balance(address, chain_config)
 
             if btc_balance > 0:
-                btc_token = DiscoveredToken(
-                    symbol="BTC",
-                    name="Bitcoin",
-                    contract_address=None,
-                    balance=btc_balance,
-                    decimals=8,
-                    is_native=True,
-                    price_usdc=0.0,
-                    value_usdc=0.0,
+                btc_token = DiscoveredToken.build(
+                    "BTC",
+                    "Bitcoin",
+                    None,
+                    btc_balance,
+                    8,
+                    True,
                 )
-                discovered_tokens.append(btc_token)
+                if _meets_min_value(btc_token.value_usdc, min_value_usdc):
+                    discovered_tokens.append(btc_token)
 
             return discovered_tokens
 
@@ -1627,8 +2249,54 @@ class BlockchainService:
             logger.error(f"发现 Bitcoin 代币失败: {e}")
             return discovered_tokens
 
+    async def _is_inactive_evm_wallet(
+        self, w3: Web3, address: str, contract_addresses: List[str]
+    ) -> bool:
+        """判断地址是否从未发送交易、也从未收到过指定合约的 Transfer
+
+        日志查询覆盖完整历史，只有节点明确返回空结果时才返回 True；
+        节点拒绝查询（如日志区间过大）或出现任何错误时返回 False，
+        由调用方继续逐个探测余额。
+        """
+        if not contract_addresses or not self._is_valid_eth_address(address):
+            return False
+
+        def _check() -> bool:
+            checksum_address = w3.to_checksum_address(address)
+            if w3.eth.get_transaction_count(checksum_address) > 0:
+                return False
+
+            # 持有余额必然对应至少一次转入事件（topic2 为接收方地址）
+            logs = w3.eth.get_logs(
+                {
+                    "fromBlock": "earliest",
+                    "toBlock": "latest",
+                    "address": [
+                        w3.to_checksum_address(contract)
+                        for contract in contract_addresses
+                    ],
+                    "topics": [
+                        _TRANSFER_TOPIC,
+                        None,
+                        "0x" + address.strip()[2:].lower().rjust(64, "0"),
+                    ],
+                }
+            )
+            return not logs
+
+        try:
+            # 同一线程内依次完成 nonce 和日志查询
+            return await asyncio.to_thread(_check)
+        except Exception as e:
+            logger.debug(f"地址活跃度预检失败，继续探测代币余额: {e}")
+            return False
+
     async def _get_erc20_tokens_from_explorer(
-        self, address: str, chain_name: str, include_zero_balance: bool
+        self,
+        address: str,
+        chain_name: str,
+        include_zero_balance: bool,
+        min_value_usdc: float = 0.0,
     ) -> List[DiscoveredToken]:
         """从区块浏览器API获取ERC20代币列表"""
         tokens = []
@@ -1639,35 +2307,74 @@ class BlockchainService:
             # 在实际应用中，可以使用 Moralis、Alchemy 等服务的API
 
             # 示例：使用一些常见的代币合约地址进行检查
-            common_tokens = await self._get_common_tokens_for_chain(chain_name)
+            common_tokens = _COMMON_TOKENS_BY_CHAIN.get(chain_name, ())
 
             # 确保链已初始化
             if await self.ensure_chain_initialized(chain_name):
                 w3 = self.web3_instances[chain_name]
+                contract_addresses = [
+                    token_info["contract_address"] for token_info in common_tokens
+                ]
 
-                for token_info in common_tokens:
-                    try:
-                        balance = await self._get_erc20_balance(
-                            w3, address, token_info["contract_address"]
-                        )
+                # 优先通过一次批量 eth_call 查询全部余额；发往 w3 实际连接的节点
+                # （主节点不可用时 ensure_chain_initialized 可能已切换到备用节点）
+                rpc_url = (
+                    getattr(w3.provider, "endpoint_uri", None)
+                    or SUPPORTED_CHAINS[chain_name]["rpc_url"]
+                )
+                balances = await self._batch_erc20_balances(
+                    rpc_url,
+                    address,
+                    chain_name,
+                    contract_addresses,
+                )
+
+                # 批量查询失败且不需要零余额代币时，先确认地址从未持有过这些代币，
+                # 冷钱包无需再逐个探测（批量成功时不额外发起任何请求）
+                if (
+                    balances is None
+                    and not include_zero_balance
+                    and await self._is_inactive_evm_wallet(
+                        w3, address, contract_addresses
+                    )
+                ):
+                    logger.debug(f"{chain_name} 地址 {address} 无交易且无代币转入记录")
+                    return tokens
 
-                        if balance > 0 or include_zero_balance:
-                            token = DiscoveredToken(
-                                symbol=token_info["symbol"],
-                                name=token_info["name"],
-                                contract_address=token_info["contract_address"],
-                                balance=balance,
-                                decimals=token_info.get("decimals", 18),
-                                is_native=False,
-                                price_usdc=0.0,
-                                value_usdc=0.0,
+                if balances is None:
+                    # 节点不支持批量请求时并发逐个查询，信号量限制同时发往 RPC 的请求数
+                    semaphore = asyncio.Semaphore(_ERC20_PROBE_CONCURRENCY)
+
+                    async def _probe(token_info: Dict) -> float:
+                        async with semaphore:
+                            return await self._get_erc20_balance(
+                                w3, address, token_info["contract_address"], chain_name
                             )
-                            tokens.append(token)
 
-                    except Exception as e:
-                        logger.warning(f"检查代币 {token_info['symbol']} 余额失败: {e}")
+                    balances = await asyncio.gather(
+                        *[_probe(token_info) for token_info in common_tokens],
+                        return_exceptions=True,
+                    )
+
+                for token_info, balance in zip(common_tokens, balances):
+                    if isinstance(balance, Exception):
+                        logger.warning(
+                            f"检查代币 {token_info['symbol']} 余额失败: {balance}"
+                        )
                         continue
 
+                    if balance > 0 or include_zero_balance:
+                        token = DiscoveredToken.build(
+                            token_info["symbol"],
+                            token_info["name"],
+                            token_info["contract_address"],
+                            balance,
+                            token_info.get("decimals", 18),
+                            False,
+                        )
+                        if _meets_min_value(token.value_usdc, min_value_usdc):
+                            tokens.append(token)
+
             return tokens
 
         except Exception as e:
@@ -1675,109 +2382,94 @@ class BlockchainService:
             return tokens
 
     async def _get_common_tokens_for_chain(self, chain_name: str) -> List[Dict]:
-        """获取指定链上的常见代币列表"""
-        # 这里返回一些常见的代币，实际应用中可以从配置文件或数据库中获取
-        common_tokens = {
-            "ethereum": [
-                {
-                    "symbol": "USDC",
-                    "name": "USD Coin",
-                    "contract_address": "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
-                    "decimals": 6,
-                },
-                {
-                    "symbol": "USDT",
-                    "name": "Tether USD",
-                    "contract_address": "0xdAC17F958D2ee523a2206206994597C13D831ec7",
-                    "decimals": 6,
-                },
-                {
-                    "symbol": "DAI",
-                    "name": "Dai Stablecoin",
-                    "contract_address": "0x6B175474E89094C44Da98b954EedeAC495271d0F",
-                    "decimals": 18,
-                },
-                {
-                    "symbol": "WETH",
-                    "name": "Wrapped Ether",
-                    "contract_address": "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2",
-                    "decimals": 18,
-                },
-            ],
-            "arbitrum": [
-                {
-                    "symbol": "USDC",
-                    "name": "USD Coin",
-                    "contract_address": "0xaf88d065e77c8cC2239327C5EDb3A432268e5831",
-                    "decimals": 6,
-                },
-                {
-                    "symbol": "USDT",
-                    "name": "Tether USD",
-                    "contract_address": "0xFd086bC7CD5C481DCC9C85ebE478A1C0b69FCbb9",
-                    "decimals": 6,
-                },
-            ],
-            "base": [
-                {
-                    "symbol": "USDC",
-                    "name": "USD Coin",
-                    "contract_address": "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",
-                    "decimals": 6,
-                },
-                {
-                    "symbol": "USDT",
-                    "name": "Tether USD",
-                    "contract_address": "0xfde4C96c8593536E31F229EA8f37b2ADa2699bb2",
-                    "decimals": 6,
-                },
-            ],
-            "polygon": [
-                {
-                    "symbol": "USDC",
-                    "name": "USD Coin",
-                    "contract_address": "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174",
-                    "decimals": 6,
-                },
-                {
-                    "symbol": "USDT",
-                    "name": "Tether USD",
-                    "contract_address": "0xc2132D05D31c914a87C6611C10748AEb04B58e8F",
-                    "decimals": 6,
-                },
-            ],
-            "bsc": [
-                {
-                    "symbol": "USDC",
-                    "name": "USD Coin",
-                    "contract_address": "0x8AC76a51cc950d9822D68b83fE1Ad97B32Cd580d",
-                    "decimals": 18,
-                },
-                {
-                    "symbol": "USDT",
-                    "name": "Tether USD",
-                    "contract_address": "0x55d398326f99059fF775485246999027B3197955",
-                    "decimals": 18,
-                },
-            ],
-        }
+        """获取指定链上的常见代币列表（兼容旧调用，直接使用 _COMMON_TOKENS_BY_CHAIN）"""
+        return list(_COMMON_TOKENS_BY_CHAIN.get(chain_name, ()))
+
+    async def _get_solana_mints_metadata(
+        self, mints: List[str], rpc_url: str, need_decimals: bool = False
+    ) -> Dict[str, tuple]:
+        """通过 getMultipleAccounts 批量读取 mint 账户中的代币元数据
+
+        每次请求最多 100 个账户。只有带 tokenMetadata 扩展的 mint（Token-2022）
+        自带符号和名称，其余 mint 不会出现在返回结果中。读取到的小数位数
+        写入 _solana_mint_decimals；need_decimals 为 True 时，元数据已缓存
+        但小数位数未知的 mint 也会重新读取。
+        """
+        metadata = {}
+        uncached = []
+        for mint in mints:
+            cached = _get_cached_solana_metadata(mint)
+            if cached is not None:
+                metadata[mint] = cached
+            if cached is None or (
+                need_decimals and mint not in _solana_mint_decimals
+            ):
+                uncached.append(mint)
+        mints = uncached
+
+        for start in range(0, len(mints), 100):
+            chunk = mints[start : start + 100]
+            payload = {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "getMultipleAccounts",
+                "params": [chunk, {"encoding": "jsonParsed"}],
+            }
+
+            try:
+                response = await self._rpc_post(rpc_url, payload)
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+            except Exception as e:
+                logger.warning(f"批量获取 Solana mint 账户失败 (RPC: {rpc_url}): {e}")
+                continue
+
+            if "error" in data:
+                logger.warning(f"Solana RPC 错误 (批量 mint 账户): {data['error']}")
+                continue
+
+            accounts = (data.get("result") or {}).get("value") or []
+            for mint, account in zip(chunk, accounts):
+                account_data = (account or {}).get("data")
+                if not isinstance(account_data, dict):
+                    continue
+
+                info = account_data.get("parsed", {}).get("info", {})
+                if info.get("decimals") is not None:
+                    _cache_solana_decimals(mint, info["decimals"])
+                for extension in info.get("extensions", []):
+                    if extension.get("extension") != "tokenMetadata":
+                        continue
+                    state = extension.get("state", {})
+                    if state.get("symbol") and state.get("name"):
+                        metadata[mint] = (state["symbol"], state["name"])
+                        _cache_solana_metadata(mint, metadata[mint])
 
-        return common_tokens.get(chain_name, [])
+        return metadata
 
     async def _get_solana_token_metadata(self, mint: str, rpc_url: str) -> tuple:
         """获取 Solana 代币的元数据（符号和名称）"""
+        cached = _get_cached_solana_metadata(mint)
+        if cached is not None:
+            return cached
+        if _is_recent_solana_metadata_miss(mint):
+            return mint[:8].upper(), f"Token {mint[:8]}"
+
         try:
             # 1. 首先尝试从 Metaplex 元数据账户获取
             symbol, name = await self._get_metaplex_metadata(mint, rpc_url)
             if symbol and name:
+                _cache_solana_metadata(mint, (symbol, name))
                 return symbol, name
 
             # 2. 如果 Metaplex 失败，尝试从 Solana Token Registry 获取
             symbol, name = await self._get_token_registry_metadata(mint)
             if symbol and name:
+                _cache_solana_metadata(mint, (symbol, name))
                 return symbol, name
 
-            # 3. 如果都失败，返回简化的地址作为符号
+            # 3. 如果都失败，返回简化的地址作为符号（短期内不再重复查询）
+            _record_solana_metadata_miss(mint)
             return mint[:8].upper(), f"Token {mint[:8]}"
 
         except Exception as e:
@@ -1785,279 +2477,166 @@ class BlockchainService:
             return mint[:8].upper(), f"Token {mint[:8]}"
 
     async def _get_metaplex_metadata(self, mint: str, rpc_url: str) -> tuple:
-        """从 Metaplex 元数据账户获取代币信息（带重试机制）"""
-        max_retries = 3
-        base_delay = 2
-
-        for attempt in range(max_retries):
-            try:
-                # 计算 Metaplex 元数据账户地址
-                # PDA seeds: ["metadata", metaplex_program_id, mint_address]
-                metaplex_program_id = "metaqbxxUerdq28cj1RbAWkYQm3ybzjb6a8bt518x1s"
+        """从 Metaplex 元数据账户获取代币信息，同一 mint 的并发查询合并为一次请求"""
+        task = _metaplex_inflight.get(mint)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_metaplex_metadata(mint, rpc_url))
+            _metaplex_inflight[mint] = task
+            task.add_done_callback(lambda _: _metaplex_inflight.pop(mint, None))
+        # shield：单个调用方被取消时不影响其他等待同一结果的调用方
+        return await asyncio.shield(task)
+
+    async def _fetch_metaplex_metadata(self, mint: str, rpc_url: str) -> tuple:
+        """从 Metaplex 元数据账户获取代币信息（重试与退避由 _post_with_retry 统一处理）"""
+        # 在本地计算 Metaplex 元数据账户地址（PDA），直接读取该账户
+        metadata_payload = {
+            **_METAPLEX_RPC_TEMPLATE,
+            "params": [_metaplex_pda(mint), _METAPLEX_ACCOUNT_CONFIG],
+        }
 
-                # 使用 Solana RPC 的 getProgramAccounts 方法查找元数据账户
-                metadata_payload = {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "getProgramAccounts",
-                    "params": [
-                        metaplex_program_id,
-                        {
-                            "encoding": "base64",
-                            "filters": [
-                                {
-                                    "memcmp": {
-                                        "offset": 33,  # mint address offset in metadata account
-                                        "bytes": mint,
-                                    }
-                                }
-                            ],
-                        },
-                    ],
-                }
+        data = await self._post_with_retry(rpc_url, metadata_payload, "Metaplex元数据")
+        if data is None:
+            return None, None
 
-                # 添加超时设置
-                timeout = httpx.Timeout(30.0, connect=10.0)
-                async with httpx.AsyncClient(timeout=timeout) as client:
-                    response = await client.post(rpc_url, json=metadata_payload)
+        if "error" in data:
+            logger.warning(f"Solana RPC 错误 (Metaplex元数据): {data['error']}")
+            return None, None
 
-                    # 检查HTTP状态码
-                    if response.status_code == 429:
-                        wait_time = base_delay * (2**attempt) + 30
-                        logger.warning(
-                            f"Solana RPC 速率限制 (Metaplex元数据，尝试 {attempt + 1}/{max_retries})，等待 {wait_time} 秒"
-                        )
-                        if attempt < max_retries - 1:
-                            await asyncio.sleep(wait_time)
-                            continue
-                        else:
-                            return None, None
+        try:
+            account = (data.get("result") or {}).get("value")
+            if not account:
+                # 该 mint 没有 Metaplex 元数据账户
+                return None, None
 
-                    response.raise_for_status()
-                    data = response.json()
-
-                    if "error" in data:
-                        error_code = data["error"].get("code", 0)
-                        error_message = data["error"].get("message", "未知错误")
-
-                        if (
-                            error_code == 429
-                            or "too many requests" in error_message.lower()
-                        ):
-                            wait_time = base_delay * (2**attempt) + 30
-                            logger.warning(
-                                f"Solana RPC 速率限制错误 (Metaplex元数据，尝试 {attempt + 1}/{max_retries})，等待 {wait_time} 秒"
-                            )
-                            if attempt < max_retries - 1:
-                                await asyncio.sleep(wait_time)
-                                continue
-                            else:
-                                return None, None
-                        else:
-                            logger.warning(
-                                f"Solana RPC 错误 (Metaplex元数据): {data['error']}"
-                            )
-                            return None, None
+            raw = base64.b64decode(account["data"][0])
+            return _parse_metaplex_metadata(raw)
+        except Exception as e:
+            logger.warning(f"解析 Metaplex 元数据失败: {e}")
+            return None, None
 
-                    if "result" in data and data["result"]:
-                        # 解析元数据账户数据
-                        for account in data["result"]:
-                            try:
-                                # 这里需要解析 Metaplex 元数据格式
-                                # 由于格式复杂，我们先尝试简单的方法
-                                account_data = account["account"]["data"][0]
-                                return account_data, None
-                            except Exception:
-                                continue
+    async def _get_fallback_solana_decimals(self, mint: str) -> Optional[int]:
+        """从已知代币表或 Token Registry 获取 mint 的小数位数，都没有时返回 None"""
+        token_info = _KNOWN_SOLANA_TOKENS.get(mint)
+        if token_info and token_info.get("decimals") is not None:
+            return token_info["decimals"]
 
-                    return None, None
+        try:
+            token = (await self._ensure_token_registry()).get(mint)
+        except Exception as e:
+            logger.warning(f"读取 Token Registry 失败: {e}")
+            return None
+        if token and token[2] is not None:
+            return token[2]
+        return None
 
-            except httpx.TimeoutException as e:
-                logger.warning(
-                    f"Solana RPC 超时 (Metaplex元数据，尝试 {attempt + 1}/{max_retries}): {e}"
-                )
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(base_delay * (attempt + 1))
-                    continue
-                else:
-                    return None, None
+    async def _get_token_registry_metadata(self, mint: str) -> tuple:
+        """从 Solana Token Registry 获取代币信息（带重试机制）"""
+        max_retries = _SOL_MAX_RETRIES
 
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 429:
-                    wait_time = base_delay * (2**attempt) + 30
-                    logger.warning(
-                        f"Solana RPC HTTP 429 (Metaplex元数据，尝试 {attempt + 1}/{max_retries})，等待 {wait_time} 秒"
-                    )
-                    if attempt < max_retries - 1:
-                        await asyncio.sleep(wait_time)
-                        continue
-                    else:
-                        return None, None
-                else:
-                    logger.warning(f"Solana RPC HTTP 错误 (Metaplex元数据): {e}")
-                    return None, None
+        for attempt in range(max_retries):
+            try:
+                # 使用 Solana Labs Token List（磁盘缓存 + 内存索引）
+                token_registry = await self._ensure_token_registry()
+                token = token_registry.get(mint)
+                if token:
+                    symbol = token[0] or mint[:8].upper()
+                    name = token[1] or f"Token {mint[:8]}"
+                    logger.debug(f"从 Token Registry 获取到代币信息: {symbol} - {name}")
+                    return symbol, name
+
+                # 如果在主列表中没找到，尝试一些知名的代币注册表
+                token_info = _KNOWN_SOLANA_TOKENS.get(mint)
+                if token_info:
+                    symbol = token_info.get("symbol", mint[:8].upper())
+                    name = token_info.get("name", f"Token {mint[:8]}")
+                    logger.debug(f"从已知代币列表获取到代币信息: {symbol} - {name}")
+                    return symbol, name
+
+                return None, None
 
             except Exception as e:
+                # 超时、HTTP 错误等均按相同的间隔重试
                 logger.warning(
-                    f"从 Metaplex 获取元数据失败 (尝试 {attempt + 1}/{max_retries}): {e}"
+                    f"从 Token Registry 获取元数据失败 (尝试 {attempt + 1}/{max_retries}): {e}"
                 )
                 if attempt < max_retries - 1:
-                    await asyncio.sleep(base_delay * (attempt + 1))
+                    await asyncio.sleep(_SOL_GEN_WAITS[attempt])
                     continue
-                else:
-                    return None, None
+                return None, None
 
         return None, None
 
-    async def _get_token_registry_metadata(self, mint: str) -> tuple:
-        """从 Solana Token Registry 获取代币信息（带重试机制）"""
-        max_retries = 3
-        base_delay = 2
+    async def _ensure_token_registry(self) -> Dict[str, tuple]:
+        """确保 Token Registry 索引已加载且未过期
 
-        for attempt in range(max_retries):
-            try:
-                # 使用 Solana Labs Token List
-                token_list_url = "https://raw.githubusercontent.com/solana-labs/token-list/main/src/tokens/solana.tokenlist.json"
+        优先使用内存索引，其次读取磁盘缓存；超过 TTL 后带 If-None-Match
+        发起条件请求，304 时沿用现有数据。刷新失败但已有旧数据时继续使用旧数据，
+        并推迟 _TOKEN_REGISTRY_RETRY_AFTER 后再重试，避免每次查询都排队重新下载。
+        """
+        global _token_registry_index, _token_registry_etag, _token_registry_fetched_at
 
-                # 添加超时设置
-                timeout = httpx.Timeout(30.0, connect=10.0)
-                async with httpx.AsyncClient(timeout=timeout) as client:
-                    response = await client.get(token_list_url)
-                    response.raise_for_status()
-                    data = response.json()
-
-                    if "tokens" in data:
-                        for token in data["tokens"]:
-                            if token.get("address") == mint:
-                                symbol = token.get("symbol", mint[:8].upper())
-                                name = token.get("name", f"Token {mint[:8]}")
-                                logger.debug(
-                                    f"从 Token Registry 获取到代币信息: {symbol} - {name}"
-                                )
-                                return symbol, name
-
-                    # 如果在主列表中没找到，尝试一些知名的代币注册表
-                    known_tokens = await self._get_known_solana_tokens()
-                    if mint in known_tokens:
-                        token_info = known_tokens[mint]
-                        symbol = token_info.get("symbol", mint[:8].upper())
-                        name = token_info.get("name", f"Token {mint[:8]}")
-                        logger.debug(f"从已知代币列表获取到代币信息: {symbol} - {name}")
-                        return symbol, name
-
-                    return None, None
+        if (
+            _token_registry_index is not None
+            and time.time() - _token_registry_fetched_at < _TOKEN_REGISTRY_TTL
+        ):
+            return _token_registry_index
+
+        async with _token_registry_lock:
+            if _token_registry_index is None:
+                (
+                    _token_registry_index,
+                    _token_registry_etag,
+                    _token_registry_fetched_at,
+                ) = await asyncio.to_thread(_load_token_registry_from_disk)
+
+            if (
+                _token_registry_index is not None
+                and time.time() - _token_registry_fetched_at < _TOKEN_REGISTRY_TTL
+            ):
+                return _token_registry_index
 
-            except httpx.TimeoutException as e:
-                logger.warning(
-                    f"Token Registry 请求超时 (尝试 {attempt + 1}/{max_retries}): {e}"
-                )
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(base_delay * (attempt + 1))
-                    continue
-                else:
-                    return None, None
+            headers = {}
+            if _token_registry_index is not None and _token_registry_etag:
+                headers["If-None-Match"] = _token_registry_etag
 
-            except httpx.HTTPStatusError as e:
-                logger.warning(
-                    f"Token Registry HTTP 错误 (尝试 {attempt + 1}/{max_retries}): {e}"
+            try:
+                response = await self.http_client.get(
+                    _TOKEN_REGISTRY_URL, headers=headers
                 )
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(base_delay * (attempt + 1))
-                    continue
-                else:
-                    return None, None
 
-            except Exception as e:
-                logger.warning(
-                    f"从 Token Registry 获取元数据失败 (尝试 {attempt + 1}/{max_retries}): {e}"
-                )
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(base_delay * (attempt + 1))
-                    continue
+                if response.status_code == 304:
+                    content = None
                 else:
-                    return None, None
-
-        return None, None
+                    response.raise_for_status()
+                    content = response.content
+                    # 列表约数 MB，放到线程中解析，避免阻塞事件循环
+                    _token_registry_index = await asyncio.to_thread(
+                        _build_token_registry_index, content
+                    )
+                    _token_registry_etag = response.headers.get("ETag")
+            except Exception:
+                if _token_registry_index is None:
+                    raise
+                logger.warning("刷新 Token Registry 失败，继续使用本地缓存")
+                # 只在内存中推迟下次刷新，磁盘上仍记录真实的获取时间
+                _token_registry_fetched_at = (
+                    time.time() - _TOKEN_REGISTRY_TTL + _TOKEN_REGISTRY_RETRY_AFTER
+                )
+                return _token_registry_index
+
+            _token_registry_fetched_at = time.time()
+            await asyncio.to_thread(
+                _save_token_registry_to_disk,
+                content,
+                _token_registry_etag,
+                _token_registry_fetched_at,
+            )
+            return _token_registry_index
 
     async def _get_known_solana_tokens(self) -> dict:
-        """获取已知的 Solana 代币信息"""
-        return {
-            # 主要稳定币
-            "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v": {
-                "symbol": "USDC",
-                "name": "USD Coin",
-                "decimals": 6,
-            },
-            "Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB": {
-                "symbol": "USDT",
-                "name": "Tether USD",
-                "decimals": 6,
-            },
-            # SOL 包装代币
-            "So11111111111111111111111111111111111111112": {
-                "symbol": "SOL",
-                "name": "Wrapped SOL",
-                "decimals": 9,
-            },
-            # 其他知名代币
-            "mSoLzYCxHdYgdzU16g5QSh3i5K3z3KZK7ytfqcJm7So": {
-                "symbol": "mSOL",
-                "name": "Marinade staked SOL",
-                "decimals": 9,
-            },
-            "7dHbWXmci3dT8UFYWYZweBLXgycu7Y3iL6trKn1Y7ARj": {
-                "symbol": "stSOL",
-                "name": "Lido Staked SOL",
-                "decimals": 9,
-            },
-            # 常见的 DeFi 代币
-            "4k3Dyjzvzp8eMZWUXbBCjEvwSkkk59S5iCNLY3QrkX6R": {
-                "symbol": "RAY",
-                "name": "Raydium",
-                "decimals": 6,
-            },
-            "SRMuApVNdxXokk5GT7XD5cUUgXMBCoAz2LHeuAoKWRt": {
-                "symbol": "SRM",
-                "name": "Serum",
-                "decimals": 6,
-            },
-            # 添加您提到的代币地址（如果知道的话）
-            "A5MpcHnx": {
-                "symbol": "UNKNOWN",
-                "name": "Unknown Token A5MpcHnx",
-                "decimals": 9,
-            },
-            "sSo14end": {
-                "symbol": "UNKNOWN",
-                "name": "Unknown Token sSo14end",
-                "decimals": 9,
-            },
-        }
-
-    def _extract_sui_token_symbol(self, coin_type: str) -> str:
-        """从 Sui coin_type 中提取代币符号"""
-        try:
-            # coin_type 格式通常是: 0x...::module::TokenName
-            parts = coin_type.split("::")
-            if len(parts) >= 3:
-                return parts[-1].upper()
-            else:
-                # 如果格式不标准，返回地址的前8位
-                return coin_type[:8].upper()
-        except Exception:
-            return coin_type[:8].upper()
+        """获取已知的 Solana 代币信息（兼容旧调用，直接使用 _KNOWN_SOLANA_TOKENS）"""
+        return dict(_KNOWN_SOLANA_TOKENS)
 
-    def _get_native_token_info(self, chain_name: str) -> dict:
-        """获取链的原生代币信息"""
-        from app.core.config import get_native_token
-        
-        native_token = get_native_token(chain_name)
-        if native_token:
-            return {
-                "symbol": native_token["symbol"],
-                "name": native_token["name"],
-                "decimals": native_token["decimals"]
-            }
-        
-        # 如果没有找到，返回默认值
-        return {"symbol": "UNKNOWN", "name": "Unknown", "decimals": 18}
+    def _get_native_token_info(self, chain_name: str) -> Mapping[str, object]:
+        """获取链的原生代币信息（只读，结果按链缓存）"""
+        return _native_token_info(chain_name)
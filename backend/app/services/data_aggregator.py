@@ -6,18 +6,228 @@
 """
 
 import asyncio
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from enum import Enum
+from types import MappingProxyType
 import httpx
+import orjson
 from abc import ABC, abstractmethod
 
 from app.core.logger import get_logger
-from app.core.config import settings
+from app.core.config import SUPPORTED_CHAINS, settings
 from app.models.asset_models import DiscoveredToken
+from app.services.blockchain_service import get_http_client
 
 logger = get_logger(__name__)
 
+# 同时发起请求的提供商数量（对冲请求），其余提供商在这些都失败后依次尝试
+_HEDGE_SIZE = 2
+# 单个提供商并发请求数的 AIMD 调节范围：初始值 / 下限 / 上限，以及目标延迟（秒）
+_PROVIDER_CONCURRENCY = 4
+_PROVIDER_MIN_CONCURRENCY = 1
+_PROVIDER_MAX_CONCURRENCY = 32
+_PROVIDER_TARGET_LATENCY = 2.0
+# 提供商状态中展示支持情况的链
+_STATUS_CHAINS = ("ethereum", "polygon", "bsc", "arbitrum", "base", "solana", "sui")
+# Redis 共享缓存的键前缀
+_REDIS_KEY_PREFIX = "crypto_asset:aggregator:"
+# 提供商请求超时：交互路径上不允许单个慢提供商拖满 30 秒
+_PROVIDER_TIMEOUT = httpx.Timeout(5.0, connect=2.0, pool=2.0)
+# 429 时遵循 Retry-After 重试一次，等待时间上限（秒）
+_MAX_RETRY_AFTER = 10.0
+# 多链查询时同时进行的链数量
+_MULTICHAIN_CONCURRENCY = 8
+# 聚合结果缓存的最大条目数
+_PROVIDER_CACHE_SIZE = 10_000
+# 提供商内钱包资产缓存：TTL（秒）与最大条目数（代币元数据由各提供商单独长期缓存）
+_ASSETS_CACHE_TTL = 30.0
+_ASSETS_CACHE_SIZE = 256
+# 提供商令牌桶容量：允许的突发请求数，持续负载下按 1 / rate_limit_delay 的速率放行
+_RATE_LIMIT_BURST = 3
+
+
+@lru_cache(maxsize=64)
+def _pow10(decimals: int) -> int:
+    """10 的整数次幂（常见小数位数只有几种，结果缓存）"""
+    return 10 ** decimals
+
+
+def _find_asset_balance(
+    assets: List[DiscoveredToken], token_contract: Optional[str]
+) -> Optional[float]:
+    """在资产列表中查找指定代币的余额（token_contract 为 None 表示原生代币），未找到返回 None"""
+    token_contract = token_contract.lower() if token_contract else None
+    for asset in assets:
+        if token_contract is None:
+            if asset.is_native:
+                return asset.balance
+        elif asset.contract_address_lower == token_contract:
+            return asset.balance
+    return None
+
+
+def _index_asset_balances(assets: List[DiscoveredToken]) -> Dict[Optional[str], float]:
+    """按小写合约地址索引资产余额，原生代币的键为 None"""
+    balances: Dict[Optional[str], float] = {}
+    for asset in assets:
+        if asset.is_native:
+            balances.setdefault(None, asset.balance)
+        elif asset.contract_address:
+            balances.setdefault(asset.contract_address_lower, asset.balance)
+    return balances
+
+
+class ProviderCache:
+    """聚合结果缓存：访问时检查 TTL，超出容量时淘汰最久未使用的条目
+    
+    过期后的条目在 stale_ttl 内仍会保留，所有提供商都失败时可作为降级数据返回。
+    """
+    
+    def __init__(
+        self,
+        ttl: int = 300,
+        stale_ttl: int = 3600,
+        maxsize: int = _PROVIDER_CACHE_SIZE
+    ):
+        """
+        初始化聚合结果缓存
+        
+        Args:
+            ttl: 缓存生存时间（秒），默认5分钟
+            stale_ttl: 过期数据可用于降级的最长时间（秒），默认1小时
+            maxsize: 最大缓存条目数
+        """
+        self.cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.maxsize = maxsize
+    
+    def _get_entry(self, key: str, max_age: float) -> Optional[Dict[str, Any]]:
+        """获取年龄小于 max_age 的缓存条目，超过 stale_ttl 的条目直接删除"""
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
+        age = time.monotonic() - entry["timestamp"]
+        if age >= self.stale_ttl:
+            del self.cache[key]
+            return None
+        if age >= max_age:
+            return None
+        self.cache.move_to_end(key)
+        return entry
+    
+    def get(self, key: str) -> Optional[Any]:
+        """获取未过期的缓存数据"""
+        entry = self._get_entry(key, self.ttl)
+        return entry["data"] if entry is not None else None
+    
+    def get_stale(self, key: str) -> Optional[Any]:
+        """获取可用于降级的缓存数据（允许已过期但未超过 stale_ttl）"""
+        entry = self._get_entry(key, self.stale_ttl)
+        return entry["data"] if entry is not None else None
+    
+    def set(self, key: str, data: Any, provider: str) -> None:
+        """设置缓存数据"""
+        self.cache[key] = {
+            "data": data,
+            "timestamp": time.monotonic(),
+            "provider": provider
+        }
+        self.cache.move_to_end(key)
+        if len(self.cache) > self.maxsize:
+            self.cache.popitem(last=False)
+    
+    def clear(self) -> None:
+        """清空缓存"""
+        self.cache.clear()
+    
+    def get_cache_stats(self) -> Dict[str, int]:
+        """获取缓存统计信息"""
+        current_time = time.monotonic()
+        valid_count = sum(
+            1 for entry in self.cache.values()
+            if current_time - entry["timestamp"] < self.ttl
+        )
+        return {
+            "total_items": len(self.cache),
+            "valid_items": valid_count,
+            "expired_items": len(self.cache) - valid_count
+        }
+
+
+class AIMDLimiter:
+    """AIMD 并发限制器：请求成功且延迟达标时并发上限加一，失败时减半"""
+    
+    def __init__(
+        self,
+        initial: int = _PROVIDER_CONCURRENCY,
+        min_limit: int = _PROVIDER_MIN_CONCURRENCY,
+        max_limit: int = _PROVIDER_MAX_CONCURRENCY,
+        target_latency: float = _PROVIDER_TARGET_LATENCY
+    ):
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.target_latency = target_latency
+        self.avg_latency = 0.0
+        self.in_flight = 0
+        self._condition = asyncio.Condition()
+    
+    @asynccontextmanager
+    async def acquire(self):
+        """占用一个并发名额，退出时记录本次请求延迟"""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+        started_at = time.monotonic()
+        try:
+            yield
+        finally:
+            latency = time.monotonic() - started_at
+            # 指数滑动平均，平滑单次请求的延迟抖动
+            self.avg_latency = (
+                latency if not self.avg_latency
+                else 0.8 * self.avg_latency + 0.2 * latency
+            )
+            async with self._condition:
+                self.in_flight -= 1
+                self._condition.notify_all()
+    
+    def on_success(self):
+        """加性增：平均延迟不超过目标时放宽并发上限"""
+        if self.avg_latency <= self.target_latency:
+            self.limit = min(self.limit + 1, self.max_limit)
+    
+    def on_error(self):
+        """乘性减：出错（包括限流）时并发上限减半"""
+        self.limit = max(self.limit * 0.5, self.min_limit)
+
+
+class AsyncTokenBucket:
+    """异步令牌桶：桶内有令牌时请求立即放行，令牌耗尽后按速率排队等待
+    
+    令牌数允许为负，表示已预约的等待请求；扣减与补充之间没有 await，并发协程无需加锁。
+    """
+    
+    def __init__(self, rate: float, capacity: int = _RATE_LIMIT_BURST):
+        self.rate = rate
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+    
+    async def acquire(self):
+        """获取一个令牌，必要时等待到令牌补充"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        self.tokens -= 1
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.rate)
+
 
 class DataProviderType(Enum):
     """数据提供商类型枚举"""
@@ -26,6 +236,17 @@ class DataProviderType(Enum):
     FALLBACK = "fallback"  # 备用API
 
 
+class CircuitState(Enum):
+    """熔断器状态"""
+    CLOSED = "closed"        # 正常放行请求
+    OPEN = "open"            # 熔断中，直接拒绝请求
+    HALF_OPEN = "half_open"  # 冷却结束，放行探测请求
+
+
+class CircuitOpenError(Exception):
+    """提供商处于熔断状态，请求未发出即被拒绝"""
+
+
 class DataProviderPriority(Enum):
     """数据提供商优先级"""
     PRIMARY = 1    # 主要提供商
@@ -40,12 +261,31 @@ class BaseDataProvider(ABC):
         self.name = name
         self.provider_type = provider_type
         self.priority = priority
-        self.http_client = httpx.AsyncClient(timeout=30.0)
         self.rate_limit_delay = 1.0  # 默认请求间隔
-        self.last_request_time = 0
+        self.timeout = _PROVIDER_TIMEOUT
+        self._bucket: Optional[AsyncTokenBucket] = None
         self.error_count = 0
         self.max_errors = 5
+        # 熔断器：最近 failure_window 次请求中失败率达到阈值时熔断，冷却时间按倍数递增
+        self.state = CircuitState.CLOSED
+        self.opened_at = 0.0
+        self.failure_window: deque = deque(maxlen=20)
+        self.failure_threshold = 0.5
+        self.base_cooldown = 30.0
+        self.cooldown = self.base_cooldown
+        self.backoff_factor = 1.5
+        self.max_cooldown = 300.0
+        self.concurrency = AIMDLimiter()
+        # (地址, 链, 是否含零余额) -> [资产列表, 写入时间, 按合约地址的余额索引（首次查询时构建）]
+        self._assets_cache: "OrderedDict[Tuple[str, str, bool], list]" = OrderedDict()
+        # 进行中的资产请求：(地址, 链, 是否含零余额) -> [任务, 等待者数量]
+        self._inflight: Dict[Tuple[str, str, bool], list] = {}
         
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """所有提供商共享进程级 HTTP 客户端，复用连接池与 TLS 会话"""
+        return get_http_client()
+    
     @abstractmethod
     async def get_wallet_assets(
         self, 
@@ -56,6 +296,67 @@ class BaseDataProvider(ABC):
         """获取钱包资产"""
         pass
     
+    async def fetch_wallet_assets(
+        self, 
+        address: str, 
+        chain_name: str, 
+        include_zero_balance: bool = False
+    ) -> List[DiscoveredToken]:
+        """获取钱包资产（带短期缓存与单飞）：缓存未过期时直接返回；
+        相同参数的请求进行中时等待其结果，不重复请求上游
+        
+        所有等待者都被取消时（如对冲请求中落败的提供商）才取消底层请求。
+        """
+        key = (address, chain_name.lower(), include_zero_balance)
+        cached = self._assets_cache.get(key)
+        if cached is not None:
+            if time.monotonic() - cached[1] < _ASSETS_CACHE_TTL:
+                self._assets_cache.move_to_end(key)
+                return cached[0]
+            del self._assets_cache[key]
+        
+        entry = self._inflight.get(key)
+        if entry is None:
+            task = asyncio.ensure_future(
+                self._load_wallet_assets(key, address, chain_name, include_zero_balance)
+            )
+            entry = [task, 0]
+            self._inflight[key] = entry
+            task.add_done_callback(lambda _: self._release_inflight(key, entry))
+        
+        entry[1] += 1
+        try:
+            return await asyncio.shield(entry[0])
+        except asyncio.CancelledError:
+            if entry[1] == 1:
+                self._release_inflight(key, entry)
+                entry[0].cancel()
+            raise
+        finally:
+            entry[1] -= 1
+    
+    async def _load_wallet_assets(
+        self, 
+        key: Tuple[str, str, bool], 
+        address: str, 
+        chain_name: str, 
+        include_zero_balance: bool
+    ) -> List[DiscoveredToken]:
+        """请求上游并写入资产缓存"""
+        assets = await self.get_wallet_assets(address, chain_name, include_zero_balance)
+        # 空结果可能来自请求失败，不缓存
+        if assets:
+            self._assets_cache[key] = [assets, time.monotonic(), None]
+            self._assets_cache.move_to_end(key)
+            if len(self._assets_cache) > _ASSETS_CACHE_SIZE:
+                self._assets_cache.popitem(last=False)
+        return assets
+    
+    def _release_inflight(self, key: Tuple[str, str, bool], entry: list):
+        """移除进行中的请求记录（只移除自己的，避免误删之后发起的同参数请求）"""
+        if self._inflight.get(key) is entry:
+            del self._inflight[key]
+    
     @abstractmethod
     async def get_token_balance(
         self, 
@@ -66,6 +367,77 @@ class BaseDataProvider(ABC):
         """获取代币余额"""
         pass
     
+    async def get_wallet_assets_many(
+        self, 
+        pairs: List[Tuple[str, str]], 
+        include_zero_balance: bool = False
+    ) -> List[List[DiscoveredToken]]:
+        """并发获取多个 (地址, 链) 的钱包资产，结果顺序与 pairs 一致
+        
+        并发度受 AIMD 限制器与令牌桶约束；单个查询失败时对应位置返回空列表。
+        """
+        async def _fetch(address: str, chain_name: str) -> List[DiscoveredToken]:
+            async with self.concurrency.acquire():
+                return await self.fetch_wallet_assets(address, chain_name, include_zero_balance)
+        
+        results = await asyncio.gather(
+            *(_fetch(address, chain_name) for address, chain_name in pairs),
+            return_exceptions=True
+        )
+        assets_list = []
+        for (address, chain_name), result in zip(pairs, results):
+            if isinstance(result, Exception):
+                logger.warning(f"数据提供商 {self.name} 获取资产失败 {address} on {chain_name}: {result}")
+                assets_list.append([])
+            else:
+                assets_list.append(result)
+        return assets_list
+    
+    async def get_wallets_assets(
+        self, 
+        addresses: List[str], 
+        chain_name: str, 
+        include_zero_balance: bool = False
+    ) -> Dict[str, List[DiscoveredToken]]:
+        """并发获取同一条链上多个地址的资产，返回 地址 -> 资产列表"""
+        assets_list = await self.get_wallet_assets_many(
+            [(address, chain_name) for address in addresses], include_zero_balance
+        )
+        return dict(zip(addresses, assets_list))
+    
+    async def get_token_balances_batch(
+        self, 
+        address: str, 
+        token_contracts: List[Optional[str]], 
+        chain_name: str
+    ) -> Dict[Optional[str], float]:
+        """批量获取多个代币余额（None 表示原生代币）
+        
+        默认实现只获取一次钱包资产再按合约地址查找；支持批量查询的提供商可覆盖此方法。
+        """
+        balances = await self._assets_by_contract(address, chain_name)
+        return {
+            contract: balances.get(contract.lower() if contract else None, 0.0)
+            for contract in token_contracts
+        }
+    
+    async def _assets_by_contract(
+        self, 
+        address: str, 
+        chain_name: str
+    ) -> Dict[Optional[str], float]:
+        """获取按小写合约地址索引的钱包余额（原生代币的键为 None）
+        
+        索引随资产列表一起缓存，同一钱包的多次查询只构建一次。
+        """
+        assets = await self.fetch_wallet_assets(address, chain_name, include_zero_balance=True)
+        cached = self._assets_cache.get((address, chain_name.lower(), True))
+        if cached is None or cached[0] is not assets:
+            return _index_asset_balances(assets)
+        if cached[2] is None:
+            cached[2] = _index_asset_balances(assets)
+        return cached[2]
+    
     @abstractmethod
     async def get_token_price(self, token_symbol: str, chain_name: str) -> Optional[float]:
         """获取代币价格"""
@@ -77,45 +449,110 @@ class BaseDataProvider(ABC):
         pass
     
     async def _rate_limit(self):
-        """实施速率限制"""
-        current_time = asyncio.get_event_loop().time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.rate_limit_delay:
-            await asyncio.sleep(self.rate_limit_delay - time_since_last)
-        self.last_request_time = asyncio.get_event_loop().time()
+        """实施速率限制（令牌桶，允许少量突发；熔断中时直接抛出 CircuitOpenError，不发出请求）"""
+        self._check_circuit()
+        if self._bucket is None:
+            # 子类在 super().__init__() 之后才设置 rate_limit_delay，首次请求时再创建令牌桶
+            self._bucket = AsyncTokenBucket(rate=1.0 / self.rate_limit_delay)
+        await self._bucket.acquire()
+    
+    async def _send(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """发送请求（使用提供商超时）；遇到 429 时按 Retry-After 等待后重试一次"""
+        kwargs.setdefault("timeout", self.timeout)
+        response = await self.http_client.request(method, url, **kwargs)
+        if response.status_code != 429:
+            return response
+        
+        retry_after = response.headers.get("Retry-After", "")
+        wait = min(float(retry_after), _MAX_RETRY_AFTER) if retry_after.isdigit() else 1.0
+        logger.warning(f"数据提供商 {self.name} 被限流，{wait:.1f} 秒后重试")
+        self.concurrency.on_error()
+        await asyncio.sleep(wait)
+        return await self.http_client.request(method, url, **kwargs)
+    
+    def _check_circuit(self):
+        """熔断中且未过冷却时间时抛出 CircuitOpenError；冷却结束后转为半开放行探测请求"""
+        if self.state is CircuitState.OPEN:
+            if time.monotonic() - self.opened_at < self.cooldown:
+                raise CircuitOpenError(f"数据提供商 {self.name} 处于熔断状态")
+            self.state = CircuitState.HALF_OPEN
+            logger.info(f"数据提供商 {self.name} 熔断冷却结束，进入半开状态")
+    
+    def _open_circuit(self):
+        """进入熔断状态"""
+        self.state = CircuitState.OPEN
+        self.opened_at = time.monotonic()
+        logger.warning(f"数据提供商 {self.name} 已熔断，冷却 {self.cooldown:.0f} 秒")
     
     def is_healthy(self) -> bool:
-        """检查提供商是否健康"""
-        return self.error_count < self.max_errors
+        """检查提供商是否健康（熔断中且未过冷却时间时视为不健康）"""
+        if self.state is CircuitState.OPEN:
+            return time.monotonic() - self.opened_at >= self.cooldown
+        return True
     
     def record_error(self):
         """记录错误"""
+        if self.state is CircuitState.OPEN:
+            # 熔断期间被拒绝的请求不计入失败窗口
+            return
+        
         self.error_count += 1
+        self.failure_window.append(1)
+        self.concurrency.on_error()
         logger.warning(f"数据提供商 {self.name} 错误计数: {self.error_count}")
+        
+        if self.state is CircuitState.HALF_OPEN:
+            # 探测请求失败，延长冷却时间后重新熔断
+            self.cooldown = min(self.cooldown * self.backoff_factor, self.max_cooldown)
+            self._open_circuit()
+        elif (
+            len(self.failure_window) == self.failure_window.maxlen
+            and sum(self.failure_window) / len(self.failure_window) >= self.failure_threshold
+        ):
+            self._open_circuit()
+    
+    def record_success(self):
+        """记录成功请求，半开状态下的探测成功后恢复正常"""
+        self.error_count = 0
+        self.failure_window.append(0)
+        self.concurrency.on_success()
+        self.cooldown = self.base_cooldown
+        if self.state is not CircuitState.CLOSED:
+            self.state = CircuitState.CLOSED
+            logger.info(f"数据提供商 {self.name} 已恢复")
     
     def reset_errors(self):
-        """重置错误计数"""
+        """重置错误计数并关闭熔断器"""
         self.error_count = 0
+        self.failure_window.clear()
+        self.cooldown = self.base_cooldown
+        self.state = CircuitState.CLOSED
 
 
 class CovalentProvider(BaseDataProvider):
     """Covalent API 提供商 - 支持200+链的多链聚合API"""
     
+    # 链名称 -> Covalent 链标识（只读，所有实例共享）
+    supported_chains = MappingProxyType({
+        "ethereum": "eth-mainnet",
+        "polygon": "matic-mainnet", 
+        "bsc": "bsc-mainnet",
+        "arbitrum": "arbitrum-mainnet",
+        "base": "base-mainnet"
+    })
+    _supported_set = frozenset(supported_chains)
+    
     def __init__(self):
         super().__init__("Covalent", DataProviderType.MULTI_CHAIN, DataProviderPriority.PRIMARY)
         self.api_key = getattr(settings, 'covalent_api_key', "")
         self.base_url = "https://api.covalenthq.com/v1"
-        self.supported_chains = {
-            "ethereum": "eth-mainnet",
-            "polygon": "matic-mainnet", 
-            "bsc": "bsc-mainnet",
-            "arbitrum": "arbitrum-mainnet",
-            "base": "base-mainnet"
-        }
         self.rate_limit_delay = 0.5  # Covalent允许较高的请求频率
+        # 条件请求缓存：(链, 地址, 是否含零余额) -> (ETag, 上次解析结果)
+        self._etags: "OrderedDict[Tuple[str, str, bool], Tuple[str, List[DiscoveredToken]]]" = OrderedDict()
     
     def supports_chain(self, chain_name: str) -> bool:
-        return chain_name.lower() in self.supported_chains
+        # 聚合器传入的链名称已是小写，命中时无需再做 lower()
+        return chain_name in self._supported_set or chain_name.lower() in self._supported_set
     
     async def get_wallet_assets(
         self, 
@@ -139,36 +576,61 @@ class CovalentProvider(BaseDataProvider):
                 "no-nft-fetch": "true"
             }
             
-            response = await self.http_client.get(url, params=params)
+            # 带上次的 ETag 发起条件请求，数据未变化时服务端返回 304
+            etag_key = (chain_id, address, include_zero_balance)
+            previous = self._etags.get(etag_key)
+            headers = {"If-None-Match": previous[0]} if previous else None
+            
+            response = await self._send("GET", url, params=params, headers=headers)
+            if response.status_code == 304 and previous:
+                self._etags.move_to_end(etag_key)
+                self.record_success()
+                return previous[1]
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
+            items = (data.get("data") or {}).get("items") or ()
             tokens = []
+            append = tokens.append
+            build = DiscoveredToken.build
+            
+            for item in items:
+                get = item.get
+                raw_balance = get("balance")
+                if not raw_balance and not include_zero_balance:
+                    continue
+                
+                decimals = get("contract_decimals")
+                if decimals is None:
+                    decimals = 18
+                # 余额为大整数字符串，按整数换算避免先转浮点丢失精度
+                balance = int(raw_balance or 0) / _pow10(decimals)
+                
+                if not include_zero_balance and balance == 0:
+                    continue
+                
+                # 判断是否为原生代币（contract_address为None或空字符串）
+                contract_address = get("contract_address")
+                
+                append(build(
+                    get("contract_ticker_symbol") or "UNKNOWN",
+                    get("contract_name") or "",
+                    contract_address,
+                    balance,
+                    decimals,
+                    not contract_address or not contract_address.strip(),
+                    get("quote_rate"),
+                    get("quote") or 0
+                ))
             
-            if data.get("data") and data["data"].get("items"):
-                for item in data["data"]["items"]:
-                    balance = float(item.get("balance", 0)) / (10 ** item.get("contract_decimals", 18))
-                    
-                    if not include_zero_balance and balance == 0:
-                        continue
-                    
-                    # 判断是否为原生代币（contract_address为None或空字符串）
-                    contract_address = item.get("contract_address")
-                    is_native = not contract_address or contract_address.strip() == ""
-                    
-                    token = DiscoveredToken(
-                        symbol=item.get("contract_ticker_symbol", "UNKNOWN"),
-                        name=item.get("contract_name", ""),
-                        contract_address=contract_address,
-                        balance=balance,
-                        decimals=item.get("contract_decimals", 18),
-                        is_native=is_native,
-                        price_usdc=item.get("quote_rate"),
-                        value_usdc=item.get("quote", 0)
-                    )
-                    tokens.append(token)
+            etag = response.headers.get("ETag")
+            if etag:
+                self._etags[etag_key] = (etag, tokens)
+                self._etags.move_to_end(etag_key)
+                if len(self._etags) > _PROVIDER_CACHE_SIZE:
+                    self._etags.popitem(last=False)
             
-            self.reset_errors()
+            self.record_success()
             return tokens
             
         except Exception as e:
@@ -183,15 +645,9 @@ class CovalentProvider(BaseDataProvider):
         chain_name: str
     ) -> float:
         """获取代币余额"""
-        assets = await self.get_wallet_assets(address, chain_name, include_zero_balance=True)
-        
-        for asset in assets:
-            if token_contract is None and asset.is_native:
-                return asset.balance
-            elif token_contract and asset.contract_address and asset.contract_address.lower() == token_contract.lower():
-                return asset.balance
-        
-        return 0.0
+        assets = await self.fetch_wallet_assets(address, chain_name, include_zero_balance=True)
+        balance = _find_asset_balance(assets, token_contract)
+        return balance if balance is not None else 0.0
     
     async def get_token_price(self, token_symbol: str, chain_name: str) -> Optional[float]:
         """获取代币价格 - Covalent主要提供余额数据，价格数据有限"""
@@ -204,8 +660,13 @@ class DataAggregatorService:
     
     def __init__(self):
         self.providers: List[BaseDataProvider] = []
-        self.provider_cache: Dict[str, Any] = {}
         self.cache_ttl = 300  # 5分钟缓存
+        self.provider_cache = ProviderCache(ttl=self.cache_ttl)
+        # 进行中的上游查询（cache_key -> Task）
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # 可选的 Redis 共享缓存（配置 REDIS_URL 后在多个 worker 间复用结果），首次使用时创建
+        self._redis = None
+        self._redis_initialized = False
         self._initialize_providers()
         
     def _initialize_providers(self):
@@ -217,17 +678,17 @@ class DataAggregatorService:
             BlockVisionSuiProvider
         )
         
-        # 按优先级添加提供商
+        # 按优先级添加提供商（列表顺序即优先级顺序，同优先级按列表先后）
         provider_classes = [
-            CovalentProvider,       # 主要多链聚合API
-            BlockVisionSuiProvider, # Sui链专用高精度API (优先级最高)
-            ZerionProvider,         # DeFi专业数据
-            ZapperProvider,         # DeFi协议聚合
-            AlchemyProvider,        # 高性能基础设施
-            DeBankProvider,         # DeFi数据聚合
-            MobulaProvider,         # Sui链专用 (备用)
-            BitqueryProvider,       # GraphQL数据分析
-            MoralisProvider,        # Web3开发平台
+            CovalentProvider,       # 主要多链聚合API (PRIMARY)
+            BlockVisionSuiProvider, # Sui链专用高精度API (PRIMARY)
+            MobulaProvider,         # Sui链专用 (PRIMARY，排在 BlockVision 之后)
+            ZerionProvider,         # DeFi专业数据 (SECONDARY)
+            ZapperProvider,         # DeFi协议聚合 (SECONDARY)
+            AlchemyProvider,        # 高性能基础设施 (SECONDARY)
+            DeBankProvider,         # DeFi数据聚合 (SECONDARY)
+            BitqueryProvider,       # GraphQL数据分析 (FALLBACK)
+            MoralisProvider,        # Web3开发平台 (FALLBACK)
         ]
         
         for provider_class in provider_classes:
@@ -238,8 +699,16 @@ class DataAggregatorService:
             except Exception as e:
                 logger.error(f"初始化数据提供商失败 {provider_class.__name__}: {e}")
         
-        # 按优先级排序
-        self.providers.sort(key=lambda p: p.priority.value)
+        # 预先建立 链 -> 支持该链的提供商 索引（按优先级排序）
+        self._providers_by_chain: Dict[str, List[BaseDataProvider]] = {}
+        for chain_name in SUPPORTED_CHAINS:
+            self._providers_for_chain(chain_name)
+        
+        # 反向索引：提供商名称 -> 状态页展示的支持链
+        self._chains_by_provider: Dict[str, List[str]] = {p.name: [] for p in self.providers}
+        for chain_name in _STATUS_CHAINS:
+            for provider in self._providers_for_chain(chain_name):
+                self._chains_by_provider[provider.name].append(chain_name)
         logger.info(f"数据聚合器已初始化，共 {len(self.providers)} 个提供商")
     
     async def get_wallet_assets(
@@ -249,50 +718,87 @@ class DataAggregatorService:
         include_zero_balance: bool = False
     ) -> List[DiscoveredToken]:
         """获取钱包资产 - 使用多提供商策略"""
+        # 在入口统一规范化链名称，下游提供商与缓存键均使用小写名称
+        chain_name = chain_name.lower()
         cache_key = f"assets:{address}:{chain_name}:{include_zero_balance}"
         
         # 检查缓存
-        if cache_key in self.provider_cache:
-            cache_data = self.provider_cache[cache_key]
-            if datetime.now().timestamp() - cache_data["timestamp"] < self.cache_ttl:
-                logger.debug(f"使用缓存的钱包资产数据: {address}")
-                return cache_data["data"]
+        cached = await self._cache_get(cache_key)
+        if cached is not None:
+            logger.debug(f"使用缓存的钱包资产数据: {address}")
+            return cached
         
+        # 同一查询的并发请求共享一次上游调用
+        return await self._single_flight(
+            cache_key,
+            lambda: self._fetch_wallet_assets(cache_key, address, chain_name, include_zero_balance)
+        )
+    
+    async def _fetch_wallet_assets(
+        self, 
+        cache_key: str, 
+        address: str, 
+        chain_name: str, 
+        include_zero_balance: bool
+    ) -> List[DiscoveredToken]:
+        """从提供商获取钱包资产并写入缓存"""
         # 获取支持该链的提供商
-        compatible_providers = [
-            p for p in self.providers 
-            if p.supports_chain(chain_name) and p.is_healthy()
-        ]
+        compatible_providers = self._healthy_providers(chain_name)
         
         if not compatible_providers:
+            # 提供商均处于熔断状态时仍可能有可用的过期缓存
             logger.warning(f"没有可用的数据提供商支持链 {chain_name}")
-            return []
         
-        # 按优先级尝试提供商
-        for provider in compatible_providers:
-            try:
-                logger.debug(f"尝试使用 {provider.name} 获取 {address} 在 {chain_name} 的资产")
-                assets = await provider.get_wallet_assets(address, chain_name, include_zero_balance)
-                
-                if assets:
-                    # 缓存结果
-                    self.provider_cache[cache_key] = {
-                        "data": assets,
-                        "timestamp": datetime.now().timestamp(),
-                        "provider": provider.name
-                    }
-                    
-                    logger.info(f"成功使用 {provider.name} 获取到 {len(assets)} 个资产")
-                    return assets
-                    
-            except Exception as e:
-                logger.error(f"提供商 {provider.name} 获取资产失败: {e}")
-                provider.record_error()
-                continue
+        # 优先级最高的几个提供商并发请求，取第一个非空结果
+        provider, assets = await self._hedged_call(
+            compatible_providers,
+            lambda p: p.fetch_wallet_assets(address, chain_name, include_zero_balance),
+            lambda result: bool(result),
+            "获取资产"
+        )
+        
+        if provider is not None:
+            # 缓存结果
+            await self._cache_set(cache_key, assets, provider.name)
+            
+            logger.info(f"成功使用 {provider.name} 获取到 {len(assets)} 个资产")
+            return assets
+        
+        # 所有提供商都失败时，返回仍在降级期限内的旧数据
+        stale = self.provider_cache.get_stale(cache_key)
+        if stale is not None:
+            logger.warning(f"所有提供商都无法获取资产，使用过期缓存: {cache_key}")
+            return stale
         
         logger.warning(f"所有提供商都无法获取 {address} 在 {chain_name} 的资产")
         return []
     
+    async def get_wallet_assets_multichain(
+        self, 
+        address: str, 
+        chains: List[str], 
+        include_zero_balance: bool = False
+    ) -> Dict[str, List[DiscoveredToken]]:
+        """并发获取同一地址在多条链上的资产，单条链失败时该链返回空列表"""
+        semaphore = asyncio.Semaphore(_MULTICHAIN_CONCURRENCY)
+        
+        async def _fetch(chain_name: str) -> List[DiscoveredToken]:
+            async with semaphore:
+                return await self.get_wallet_assets(address, chain_name, include_zero_balance)
+        
+        results = await asyncio.gather(
+            *(_fetch(chain_name) for chain_name in chains),
+            return_exceptions=True
+        )
+        
+        assets_by_chain = {}
+        for chain_name, result in zip(chains, results):
+            if isinstance(result, Exception):
+                logger.error(f"获取 {address} 在 {chain_name} 的资产失败: {result}")
+                result = []
+            assets_by_chain[chain_name] = result
+        return assets_by_chain
+    
     async def get_token_balance(
         self, 
         address: str, 
@@ -300,105 +806,292 @@ class DataAggregatorService:
         chain_name: str
     ) -> float:
         """获取代币余额 - 使用多提供商策略"""
+        # 在入口统一规范化链名称，下游提供商与缓存键均使用小写名称
+        chain_name = chain_name.lower()
         cache_key = f"balance:{address}:{token_contract}:{chain_name}"
         
         # 检查缓存
-        if cache_key in self.provider_cache:
-            cache_data = self.provider_cache[cache_key]
-            if datetime.now().timestamp() - cache_data["timestamp"] < self.cache_ttl:
-                return cache_data["data"]
+        cached = await self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # 已缓存该钱包的资产列表时直接从中取余额，不再请求提供商
+        for include_zero_balance in (True, False):
+            assets = self.provider_cache.get(
+                f"assets:{address}:{chain_name}:{include_zero_balance}"
+            )
+            if assets is not None:
+                balance = _find_asset_balance(assets, token_contract)
+                if balance is not None:
+                    return balance
         
+        # 同一查询的并发请求共享一次上游调用
+        return await self._single_flight(
+            cache_key,
+            lambda: self._fetch_token_balance(cache_key, address, token_contract, chain_name)
+        )
+    
+    async def _fetch_token_balance(
+        self, 
+        cache_key: str, 
+        address: str, 
+        token_contract: Optional[str], 
+        chain_name: str
+    ) -> float:
+        """从提供商获取代币余额并写入缓存"""
         # 获取支持该链的提供商
-        compatible_providers = [
-            p for p in self.providers 
-            if p.supports_chain(chain_name) and p.is_healthy()
-        ]
+        compatible_providers = self._healthy_providers(chain_name)
         
-        # 按优先级尝试提供商
-        for provider in compatible_providers:
-            try:
-                balance = await provider.get_token_balance(address, token_contract, chain_name)
-                
-                if balance > 0:
-                    # 缓存结果
-                    self.provider_cache[cache_key] = {
-                        "data": balance,
-                        "timestamp": datetime.now().timestamp(),
-                        "provider": provider.name
-                    }
-                    
-                    return balance
-                    
-            except Exception as e:
-                logger.error(f"提供商 {provider.name} 获取余额失败: {e}")
-                provider.record_error()
-                continue
+        # 优先级最高的几个提供商并发请求，取第一个正余额
+        provider, balance = await self._hedged_call(
+            compatible_providers,
+            lambda p: p.get_token_balance(address, token_contract, chain_name),
+            lambda result: result > 0,
+            "获取余额"
+        )
+        
+        if provider is not None:
+            # 缓存结果
+            await self._cache_set(cache_key, balance, provider.name)
+            
+            return balance
         
         return 0.0
     
+    async def get_token_balances_batch(
+        self, 
+        address: str, 
+        token_contracts: List[Optional[str]], 
+        chain_name: str
+    ) -> Dict[Optional[str], float]:
+        """批量获取同一链上多个代币的余额（None 表示原生代币）- 使用多提供商策略"""
+        chain_name = chain_name.lower()
+        if not token_contracts:
+            return {}
+        
+        # 已缓存该钱包的完整资产列表时直接从中取余额
+        assets = await self._cache_get(f"assets:{address}:{chain_name}:True")
+        if assets is not None:
+            balances = _index_asset_balances(assets)
+            return {
+                contract: balances.get(contract.lower() if contract else None, 0.0)
+                for contract in token_contracts
+            }
+        
+        provider, balances = await self._hedged_call(
+            self._healthy_providers(chain_name),
+            lambda p: p.get_token_balances_batch(address, token_contracts, chain_name),
+            lambda result: any(balance > 0 for balance in result.values()),
+            "批量获取余额"
+        )
+        
+        if provider is None:
+            return {contract: 0.0 for contract in token_contracts}
+        
+        # 正余额逐个写入单币余额缓存，供 get_token_balance 复用
+        for contract, balance in balances.items():
+            if balance > 0:
+                await self._cache_set(
+                    f"balance:{address}:{contract}:{chain_name}", balance, provider.name
+                )
+        return balances
+    
     async def get_token_price(self, token_symbol: str, chain_name: str) -> Optional[float]:
         """获取代币价格 - 使用多提供商策略"""
+        # 在入口统一规范化链名称，下游提供商与缓存键均使用小写名称
+        chain_name = chain_name.lower()
         cache_key = f"price:{token_symbol}:{chain_name}"
         
         # 检查缓存
-        if cache_key in self.provider_cache:
-            cache_data = self.provider_cache[cache_key]
-            if datetime.now().timestamp() - cache_data["timestamp"] < self.cache_ttl:
-                return cache_data["data"]
+        cached = await self._cache_get(cache_key)
+        if cached is not None:
+            return cached
         
+        # 同一查询的并发请求共享一次上游调用
+        return await self._single_flight(
+            cache_key,
+            lambda: self._fetch_token_price(cache_key, token_symbol, chain_name)
+        )
+    
+    async def _fetch_token_price(
+        self, 
+        cache_key: str, 
+        token_symbol: str, 
+        chain_name: str
+    ) -> Optional[float]:
+        """从提供商获取代币价格并写入缓存"""
         # 获取支持该链的提供商
-        compatible_providers = [
-            p for p in self.providers 
-            if p.supports_chain(chain_name) and p.is_healthy()
-        ]
+        compatible_providers = self._healthy_providers(chain_name)
+        
+        # 优先级最高的几个提供商并发请求，取第一个有效价格
+        provider, price = await self._hedged_call(
+            compatible_providers,
+            lambda p: p.get_token_price(token_symbol, chain_name),
+            lambda result: True,
+            "获取价格"
+        )
+        
+        if provider is not None:
+            # 缓存结果
+            await self._cache_set(cache_key, price, provider.name)
+            
+            return price
+        
+        # 所有提供商都失败时，返回仍在降级期限内的旧价格
+        stale = self.provider_cache.get_stale(cache_key)
+        if stale is not None:
+            logger.warning(f"所有提供商都无法获取价格，使用过期缓存: {cache_key}")
+            return stale
+        
+        return None
+    
+    def _providers_for_chain(self, chain_name: str) -> List[BaseDataProvider]:
+        """获取支持指定链的提供商（结果按链缓存，未预建的链在首次查询时建立索引）"""
+        chain_key = chain_name.lower()
+        providers = self._providers_by_chain.get(chain_key)
+        if providers is None:
+            providers = [p for p in self.providers if p.supports_chain(chain_key)]
+            self._providers_by_chain[chain_key] = providers
+        return providers
+    
+    def _healthy_providers(self, chain_name: str) -> List[BaseDataProvider]:
+        """获取支持指定链且当前健康的提供商"""
+        return [p for p in self._providers_for_chain(chain_name) if p.is_healthy()]
+    
+    def _get_redis(self):
+        """获取 Redis 客户端；未配置 REDIS_URL 或未安装 redis 时返回 None"""
+        if not self._redis_initialized:
+            self._redis_initialized = True
+            if settings.redis_url:
+                try:
+                    from redis import asyncio as redis_asyncio
+                    self._redis = redis_asyncio.Redis.from_url(settings.redis_url)
+                    logger.info("数据聚合器已启用 Redis 共享缓存")
+                except ImportError:
+                    logger.warning("已配置 REDIS_URL 但未安装 redis，仅使用进程内缓存")
+        return self._redis
+    
+    async def _cache_get(self, cache_key: str) -> Optional[Any]:
+        """读取缓存：先查进程内缓存，未命中时查 Redis 并回填进程内缓存"""
+        cached = self.provider_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
-        # 按优先级尝试提供商
-        for provider in compatible_providers:
+        redis = self._get_redis()
+        if redis is None:
+            return None
+        
+        try:
+            raw = await redis.get(_REDIS_KEY_PREFIX + cache_key)
+            if raw is None:
+                return None
+            data = orjson.loads(raw)
+            if cache_key.startswith("assets:"):
+                data = [DiscoveredToken.model_construct(**token) for token in data]
+        except Exception as e:
+            logger.warning(f"读取 Redis 缓存失败 {cache_key}: {e}")
+            return None
+        
+        self.provider_cache.set(cache_key, data, "redis")
+        return data
+    
+    async def _cache_set(self, cache_key: str, data: Any, provider: str) -> None:
+        """写入进程内缓存，并同步写入 Redis（如已启用）"""
+        self.provider_cache.set(cache_key, data, provider)
+        
+        redis = self._get_redis()
+        if redis is None:
+            return
+        
+        try:
+            if cache_key.startswith("assets:"):
+                payload = orjson.dumps([token.model_dump() for token in data])
+            else:
+                payload = orjson.dumps(data)
+            await redis.set(_REDIS_KEY_PREFIX + cache_key, payload, ex=self.cache_ttl)
+        except Exception as e:
+            logger.warning(f"写入 Redis 缓存失败 {cache_key}: {e}")
+    
+    async def close(self):
+        """关闭 Redis 连接（应用关闭时调用）"""
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+            self._redis_initialized = False
+    
+    async def _single_flight(self, cache_key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """单飞：同一 cache_key 已有进行中的请求时等待其结果，而不是重复请求上游"""
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+        # shield：单个调用方被取消时不影响其他等待同一结果的调用方
+        return await asyncio.shield(task)
+    
+    async def _hedged_call(
+        self,
+        providers: List[BaseDataProvider],
+        call: Callable[[BaseDataProvider], Awaitable[Any]],
+        accept: Callable[[Any], bool],
+        action: str
+    ) -> Tuple[Optional[BaseDataProvider], Any]:
+        """对冲请求：前 _HEDGE_SIZE 个提供商并发请求，第一个可用结果胜出并取消其余请求
+        
+        并发的提供商都没有可用结果时，按优先级依次尝试剩余提供商。
+        
+        Returns:
+            (提供结果的提供商, 结果)；没有可用结果时返回 (None, None)
+        """
+        async def _attempt(provider: BaseDataProvider):
             try:
-                price = await provider.get_token_price(token_symbol, chain_name)
-                
-                if price is not None:
-                    # 缓存结果
-                    self.provider_cache[cache_key] = {
-                        "data": price,
-                        "timestamp": datetime.now().timestamp(),
-                        "provider": provider.name
-                    }
-                    
-                    return price
-                    
+                async with provider.concurrency.acquire():
+                    return provider, await call(provider)
             except Exception as e:
-                logger.error(f"提供商 {provider.name} 获取价格失败: {e}")
+                logger.error(f"提供商 {provider.name} {action}失败: {e}")
                 provider.record_error()
-                continue
+                return provider, None
         
-        return None
+        tasks = [asyncio.create_task(_attempt(p)) for p in providers[:_HEDGE_SIZE]]
+        try:
+            for future in asyncio.as_completed(tasks):
+                provider, result = await future
+                if result is not None and accept(result):
+                    return provider, result
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        for provider in providers[_HEDGE_SIZE:]:
+            provider, result = await _attempt(provider)
+            if result is not None and accept(result):
+                return provider, result
+        
+        return None, None
     
     def get_provider_status(self) -> Dict[str, Any]:
         """获取所有提供商的状态"""
+        # 每个提供商的健康状态只计算一次
+        healthy = [p.is_healthy() for p in self.providers]
         status = {
             "total_providers": len(self.providers),
-            "healthy_providers": len([p for p in self.providers if p.is_healthy()]),
+            "healthy_providers": sum(healthy),
             "providers": []
         }
         
-        for provider in self.providers:
+        for provider, is_healthy in zip(self.providers, healthy):
             provider_info = {
                 "name": provider.name,
                 "type": provider.provider_type.value,
                 "priority": provider.priority.value,
-                "is_healthy": provider.is_healthy(),
+                "is_healthy": is_healthy,
                 "error_count": provider.error_count,
+                "circuit_state": provider.state.value,
                 "max_errors": provider.max_errors,
-                "supported_chains": []
+                "supported_chains": self._chains_by_provider.get(provider.name, [])
             }
             
-            # 检查支持的链
-            test_chains = ["ethereum", "polygon", "bsc", "arbitrum", "base", "solana", "sui"]
-            for chain in test_chains:
-                if provider.supports_chain(chain):
-                    provider_info["supported_chains"].append(chain)
-            
             status["providers"].append(provider_info)
         
         return status
@@ -410,21 +1103,13 @@ class DataAggregatorService:
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """获取缓存统计信息"""
-        current_time = datetime.now().timestamp()
-        valid_cache = 0
-        expired_cache = 0
-        
-        for cache_data in self.provider_cache.values():
-            if current_time - cache_data["timestamp"] < self.cache_ttl:
-                valid_cache += 1
-            else:
-                expired_cache += 1
-        
+        stats = self.provider_cache.get_cache_stats()
         return {
-            "total_cache_entries": len(self.provider_cache),
-            "valid_cache_entries": valid_cache,
-            "expired_cache_entries": expired_cache,
-            "cache_ttl_seconds": self.cache_ttl
+            "total_cache_entries": stats["total_items"],
+            "valid_cache_entries": stats["valid_items"],
+            "expired_cache_entries": stats["expired_items"],
+            "cache_ttl_seconds": self.cache_ttl,
+            "cache_max_entries": self.provider_cache.maxsize
         }
 
 
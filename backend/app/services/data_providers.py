@@ -4,7 +4,16 @@
 包含各种多链和特定链的数据提供商，如Zerion、Zapper、DeBank、Bitquery、Alchemy、Moralis等
 """
 
-from typing import Dict, List, Optional, Any
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Tuple
+
+import httpx
+import orjson
 
 from app.core.logger import get_logger
 from app.core.config import settings
@@ -13,10 +22,79 @@ from app.services.data_aggregator import (
     BaseDataProvider,
     DataProviderType,
     DataProviderPriority,
+    _pow10,
 )
 
 logger = get_logger(__name__)
 
+def _parse(response: httpx.Response) -> Any:
+    """使用 orjson 解析响应体"""
+    return orjson.loads(response.content)
+
+
+# 超过该大小（字节）的响应体在线程池中解析，避免大钱包的解析阻塞事件循环
+_LARGE_RESPONSE_BYTES = 256 * 1024
+
+
+async def _parse_large(response: httpx.Response) -> Any:
+    """解析可能很大的响应体：小响应直接解析，大响应交给线程池"""
+    if len(response.content) < _LARGE_RESPONSE_BYTES:
+        return orjson.loads(response.content)
+    return await asyncio.to_thread(orjson.loads, response.content)
+
+
+# 表示零余额的十六进制写法（节点可能返回 "0x" 或省略字段）
+_ZERO_HEX = frozenset({"", "0x", "0x0", "0x00", None})
+
+
+def _hex_to_int(value: Optional[str]) -> int:
+    """解析十六进制余额（兼容十进制字符串），零值无需进入 int() 解析"""
+    if value in _ZERO_HEX:
+        return 0
+    if value.startswith("0x"):
+        return int(value, 16)
+    return int(value)
+
+
+# Alchemy Portfolio API：按钱包一次返回代币余额及元数据
+_ALCHEMY_TOKENS_BY_WALLET_URL = (
+    "https://api.g.alchemy.com/data/v1/{api_key}/assets/tokens/by-address"
+)
+# Portfolio API 返回这些状态码时视为当前密钥/套餐不可用，之后统一走 JSON-RPC 两步查询
+_ALCHEMY_ENHANCED_UNAVAILABLE = frozenset({401, 403})
+# 这些状态码只说明本次请求（地址/网络）不被接受，仅本次回退到 JSON-RPC
+_ALCHEMY_ENHANCED_REJECTED = frozenset({400, 404})
+
+# Alchemy 不支持批量请求时，并发请求代币元数据的上限
+_ALCHEMY_METADATA_CONCURRENCY = 10
+
+# Alchemy 代币元数据缓存：(链标识, 小写合约地址) -> (元数据, 写入时间)，元数据基本不变
+_META_TTL = 86400
+_META_CACHE_SIZE = 10_000
+_METADATA_CACHE: "OrderedDict[Tuple[str, str], Tuple[dict, float]]" = OrderedDict()
+
+
+def _get_cached_metadata(chain_id: str, contract_address: str) -> Optional[dict]:
+    """读取未过期的代币元数据缓存"""
+    key = (chain_id, contract_address.lower())
+    entry = _METADATA_CACHE.get(key)
+    if entry is None:
+        return None
+    if time.monotonic() - entry[1] >= _META_TTL:
+        del _METADATA_CACHE[key]
+        return None
+    _METADATA_CACHE.move_to_end(key)
+    return entry[0]
+
+
+def _cache_metadata(chain_id: str, contract_address: str, metadata: dict):
+    """写入代币元数据缓存，超出容量时淘汰最久未使用的条目"""
+    key = (chain_id, contract_address.lower())
+    _METADATA_CACHE[key] = (metadata, time.monotonic())
+    _METADATA_CACHE.move_to_end(key)
+    if len(_METADATA_CACHE) > _META_CACHE_SIZE:
+        _METADATA_CACHE.popitem(last=False)
+
 
 class ZerionProvider(BaseDataProvider):
     """Zerion API 提供商 - 专注于钱包和DeFi数据"""
@@ -26,6 +104,10 @@ class ZerionProvider(BaseDataProvider):
             "Zerion", DataProviderType.MULTI_CHAIN, DataProviderPriority.SECONDARY
         )
         self.api_key = getattr(settings, "zerion_api_key", "")
+        self._headers = {
+            "Authorization": f"Basic {self.api_key}",
+            "Content-Type": "application/json",
+        }
         self.base_url = "https://api.zerion.io/v1"
         self.supported_chains = {
             "ethereum": "ethereum",
@@ -35,10 +117,15 @@ class ZerionProvider(BaseDataProvider):
             "base": "base",
             "solana": "solana",
         }
+        self._supported_set = frozenset(self.supported_chains)
         self.rate_limit_delay = 1.0
 
     def supports_chain(self, chain_name: str) -> bool:
-        return chain_name.lower() in self.supported_chains
+        # 聚合器传入的链名称已是小写，命中时无需再做 lower()
+        return (
+            chain_name in self._supported_set
+            or chain_name.lower() in self._supported_set
+        )
 
     async def get_wallet_assets(
         self, address: str, chain_name: str, include_zero_balance: bool = False
@@ -50,21 +137,18 @@ class ZerionProvider(BaseDataProvider):
         try:
             await self._rate_limit()
 
-            headers = {
-                "Authorization": f"Basic {self.api_key}",
-                "Content-Type": "application/json",
-            }
-
             url = f"{self.base_url}/wallets/{address}/positions"
             params = {
                 "filter[chain_ids]": self.supported_chains[chain_name.lower()],
                 "currency": "usd",
             }
 
-            response = await self.http_client.get(url, headers=headers, params=params)
+            response = await self._send(
+                "GET", url, headers=self._headers, params=params
+            )
             response.raise_for_status()
 
-            data = response.json()
+            data = _parse(response)
             tokens = []
 
             if data.get("data"):
@@ -94,7 +178,7 @@ class ZerionProvider(BaseDataProvider):
                             )
                             tokens.append(token)
 
-            self.reset_errors()
+            self.record_success()
             return tokens
 
         except Exception as e:
@@ -106,21 +190,8 @@ class ZerionProvider(BaseDataProvider):
         self, address: str, token_contract: Optional[str], chain_name: str
     ) -> float:
         """获取代币余额"""
-        assets = await self.get_wallet_assets(
-            address, chain_name, include_zero_balance=True
-        )
-
-        for asset in assets:
-            if token_contract is None and asset.is_native:
-                return asset.balance
-            elif (
-                token_contract
-                and asset.contract_address
-                and asset.contract_address.lower() == token_contract.lower()
-            ):
-                return asset.balance
-
-        return 0.0
+        balances = await self._assets_by_contract(address, chain_name)
+        return balances.get(token_contract.lower() if token_contract else None, 0.0)
 
     async def get_token_price(
         self, token_symbol: str, chain_name: str
@@ -137,6 +208,10 @@ class ZapperProvider(BaseDataProvider):
             "Zapper", DataProviderType.MULTI_CHAIN, DataProviderPriority.SECONDARY
         )
         self.api_key = getattr(settings, "zapper_api_key", "")
+        self._headers = {
+            "Authorization": f"Basic {self.api_key}",
+            "Content-Type": "application/json",
+        }
         self.base_url = "https://api.zapper.fi/v2"
         self.supported_chains = {
             "ethereum": "ethereum",
@@ -145,10 +220,15 @@ class ZapperProvider(BaseDataProvider):
             "arbitrum": "arbitrum",
             "base": "base",
         }
+        self._supported_set = frozenset(self.supported_chains)
         self.rate_limit_delay = 1.0
 
     def supports_chain(self, chain_name: str) -> bool:
-        return chain_name.lower() in self.supported_chains
+        # 聚合器传入的链名称已是小写，命中时无需再做 lower()
+        return (
+            chain_name in self._supported_set
+            or chain_name.lower() in self._supported_set
+        )
 
     async def get_wallet_assets(
         self, address: str, chain_name: str, include_zero_balance: bool = False
@@ -160,21 +240,18 @@ class ZapperProvider(BaseDataProvider):
         try:
             await self._rate_limit()
 
-            headers = {
-                "Authorization": f"Basic {self.api_key}",
-                "Content-Type": "application/json",
-            }
-
             url = f"{self.base_url}/balances"
             params = {
                 "addresses[]": address,
                 "networks[]": self.supported_chains[chain_name.lower()],
             }
 
-            response = await self.http_client.get(url, headers=headers, params=params)
+            response = await self._send(
+                "GET", url, headers=self._headers, params=params
+            )
             response.raise_for_status()
 
-            data = response.json()
+            data = _parse(response)
             tokens = []
 
             if data.get(address):
@@ -197,7 +274,7 @@ class ZapperProvider(BaseDataProvider):
                         )
                         tokens.append(token)
 
-            self.reset_errors()
+            self.record_success()
             return tokens
 
         except Exception as e:
@@ -209,21 +286,8 @@ class ZapperProvider(BaseDataProvider):
         self, address: str, token_contract: Optional[str], chain_name: str
     ) -> float:
         """获取代币余额"""
-        assets = await self.get_wallet_assets(
-            address, chain_name, include_zero_balance=True
-        )
-
-        for asset in assets:
-            if token_contract is None and asset.is_native:
-                return asset.balance
-            elif (
-                token_contract
-                and asset.contract_address
-                and asset.contract_address.lower() == token_contract.lower()
-            ):
-                return asset.balance
-
-        return 0.0
+        balances = await self._assets_by_contract(address, chain_name)
+        return balances.get(token_contract.lower() if token_contract else None, 0.0)
 
     async def get_token_price(
         self, token_symbol: str, chain_name: str
@@ -240,16 +304,26 @@ class AlchemyProvider(BaseDataProvider):
             "Alchemy", DataProviderType.MULTI_CHAIN, DataProviderPriority.SECONDARY
         )
         self.api_key = getattr(settings, "alchemy_api_key", "")
+        self._headers = {"Content-Type": "application/json"}
         self.supported_chains = {
             "ethereum": "eth-mainnet",
             "polygon": "polygon-mainnet",
             "arbitrum": "arb-mainnet",
             "base": "base-mainnet",
         }
+        self._supported_set = frozenset(self.supported_chains)
         self.rate_limit_delay = 0.5
+        # 逐个请求代币元数据时的并发上限
+        self._meta_sem = asyncio.Semaphore(_ALCHEMY_METADATA_CONCURRENCY)
+        # Portfolio API 不可用时关闭，之后直接走 JSON-RPC 路径
+        self._supports_enhanced = getattr(settings, "alchemy_enhanced_api", True)
 
     def supports_chain(self, chain_name: str) -> bool:
-        return chain_name.lower() in self.supported_chains
+        # 聚合器传入的链名称已是小写，命中时无需再做 lower()
+        return (
+            chain_name in self._supported_set
+            or chain_name.lower() in self._supported_set
+        )
 
     async def get_wallet_assets(
         self, address: str, chain_name: str, include_zero_balance: bool = False
@@ -262,6 +336,15 @@ class AlchemyProvider(BaseDataProvider):
             await self._rate_limit()
 
             chain_id = self.supported_chains[chain_name.lower()]
+
+            if self._supports_enhanced:
+                tokens = await self._get_tokens_by_wallet(
+                    address, chain_id, include_zero_balance
+                )
+                if tokens is not None:
+                    self.record_success()
+                    return tokens
+
             url = f"https://{chain_id}.g.alchemy.com/v2/{self.api_key}"
 
             # 获取代币余额
@@ -272,53 +355,51 @@ class AlchemyProvider(BaseDataProvider):
                 "params": [address],
             }
 
-            headers = {"Content-Type": "application/json"}
-            response = await self.http_client.post(url, json=payload, headers=headers)
+            response = await self._send(
+                "POST", url, content=orjson.dumps(payload), headers=self._headers
+            )
             response.raise_for_status()
 
-            data = response.json()
+            data = _parse(response)
             tokens = []
 
-            if data.get("result") and data["result"].get("tokenBalances"):
-                for token_balance in data["result"]["tokenBalances"]:
-                    balance_hex = token_balance.get("tokenBalance", "0x0")
-                    if balance_hex == "0x0" and not include_zero_balance:
-                        continue
-
-                    balance = int(balance_hex, 16) if balance_hex != "0x0" else 0
-
-                    # 获取代币元数据
-                    metadata_payload = {
-                        "id": 1,
-                        "jsonrpc": "2.0",
-                        "method": "alchemy_getTokenMetadata",
-                        "params": [token_balance["contractAddress"]],
-                    }
-
-                    metadata_response = await self.http_client.post(
-                        url, json=metadata_payload, headers=headers
-                    )
-                    metadata = metadata_response.json().get("result", {})
+            # 先解析余额并剔除零余额（Alchemy 的零余额常为补零的 32 字节十六进制），
+            # 只为保留下来的代币请求元数据
+            token_balances = []
+            for token_balance in (data.get("result") or {}).get("tokenBalances") or []:
+                balance = _hex_to_int(token_balance.get("tokenBalance"))
+                if balance or include_zero_balance:
+                    token_balances.append((token_balance["contractAddress"], balance))
+
+            # 一次批量请求获取全部代币的元数据
+            metadata_by_contract = await self._get_tokens_metadata(
+                chain_id, url, [contract for contract, _ in token_balances]
+            )
 
-                    decimals = metadata.get("decimals", 18)
-                    balance_float = balance / (10**decimals) if balance > 0 else 0
+            for contract_address, balance in token_balances:
+                metadata = metadata_by_contract.get(contract_address, {})
+                decimals = metadata.get("decimals")
+                if decimals is None:
+                    decimals = 18
+                balance_float = balance / _pow10(decimals) if balance > 0 else 0
 
-                    if not include_zero_balance and balance_float == 0:
-                        continue
+                if not include_zero_balance and balance_float == 0:
+                    continue
 
-                    token = DiscoveredToken(
-                        symbol=metadata.get("symbol", "UNKNOWN"),
-                        name=metadata.get("name", ""),
-                        contract_address=token_balance["contractAddress"],
-                        balance=balance_float,
-                        decimals=decimals,
-                        is_native=False,
-                        price_usdc=None,
-                        value_usdc=None,
+                tokens.append(
+                    DiscoveredToken.build(
+                        metadata.get("symbol") or "UNKNOWN",
+                        metadata.get("name") or "",
+                        contract_address,
+                        balance_float,
+                        decimals,
+                        False,
+                        None,
+                        None,
                     )
-                    tokens.append(token)
+                )
 
-            self.reset_errors()
+            self.record_success()
             return tokens
 
         except Exception as e:
@@ -356,43 +437,35 @@ class AlchemyProvider(BaseDataProvider):
                     "params": [address, [token_contract]],
                 }
 
-            headers = {"Content-Type": "application/json"}
-            response = await self.http_client.post(url, json=payload, headers=headers)
+            response = await self._send(
+                "POST", url, content=orjson.dumps(payload), headers=self._headers
+            )
             response.raise_for_status()
 
-            data = response.json()
+            data = _parse(response)
 
             if token_contract is None:
                 # 原生代币余额
-                balance_hex = data.get("result", "0x0")
-                balance = int(balance_hex, 16) / (10**18)
-                return balance
+                return _hex_to_int(data.get("result")) / _pow10(18)
             else:
                 # ERC20代币余额
                 if data.get("result") and data["result"].get("tokenBalances"):
                     token_balance = data["result"]["tokenBalances"][0]
-                    balance_hex = token_balance.get("tokenBalance", "0x0")
+                    balance = _hex_to_int(token_balance.get("tokenBalance"))
+                    if balance == 0:
+                        return 0.0
 
                     # 获取代币精度
-                    metadata_payload = {
-                        "id": 1,
-                        "jsonrpc": "2.0",
-                        "method": "alchemy_getTokenMetadata",
-                        "params": [token_contract],
-                    }
-
-                    metadata_response = await self.http_client.post(
-                        url, json=metadata_payload, headers=headers
-                    )
-                    metadata = metadata_response.json().get("result", {})
-                    decimals = metadata.get("decimals", 18)
+                    metadata = (
+                        await self._get_tokens_metadata(
+                            chain_id, url, [token_contract]
+                        )
+                    ).get(token_contract, {})
+                    decimals = metadata.get("decimals")
+                    if decimals is None:
+                        decimals = 18
 
-                    balance = (
-                        int(balance_hex, 16) / (10**decimals)
-                        if balance_hex != "0x0"
-                        else 0
-                    )
-                    return balance
+                    return balance / _pow10(decimals)
 
             return 0.0
 
@@ -401,6 +474,158 @@ class AlchemyProvider(BaseDataProvider):
             logger.error(f"Alchemy获取代币余额失败 {address} on {chain_name}: {e}")
             return 0.0
 
+    async def _get_tokens_by_wallet(
+        self, address: str, chain_id: str, include_zero_balance: bool
+    ) -> Optional[List[DiscoveredToken]]:
+        """通过 Portfolio API 一次获取余额与元数据，无需再逐个请求元数据
+
+        Returns:
+            代币列表；接口不可用或拒绝本次请求时返回 None（401/403 时关闭该路径）
+        """
+        url = _ALCHEMY_TOKENS_BY_WALLET_URL.format(api_key=self.api_key)
+        body = {
+            "addresses": [{"address": address, "networks": [chain_id]}],
+            "withMetadata": True,
+            "withPrices": False,
+            "includeNativeTokens": False,
+        }
+        tokens = []
+
+        while True:
+            response = await self._send(
+                "POST", url, content=orjson.dumps(body), headers=self._headers
+            )
+            if response.status_code in _ALCHEMY_ENHANCED_UNAVAILABLE:
+                logger.warning(
+                    f"Alchemy Portfolio API 不可用({response.status_code})，"
+                    "改用 JSON-RPC 查询"
+                )
+                self._supports_enhanced = False
+                return None
+            if response.status_code in _ALCHEMY_ENHANCED_REJECTED:
+                logger.debug(
+                    f"Alchemy Portfolio API 拒绝请求({response.status_code}) "
+                    f"{address} on {chain_id}，本次改用 JSON-RPC 查询"
+                )
+                return None
+            response.raise_for_status()
+
+            data = _parse(response).get("data") or {}
+            for item in data.get("tokens") or []:
+                contract_address = item.get("tokenAddress")
+                if not contract_address:
+                    continue
+
+                balance = _hex_to_int(item.get("tokenBalance"))
+                if not include_zero_balance and balance == 0:
+                    continue
+
+                metadata = item.get("tokenMetadata") or {}
+                if metadata.get("decimals") is not None:
+                    _cache_metadata(chain_id, contract_address, metadata)
+                decimals = metadata.get("decimals")
+                if decimals is None:
+                    decimals = 18
+
+                tokens.append(
+                    DiscoveredToken.build(
+                        metadata.get("symbol") or "UNKNOWN",
+                        metadata.get("name") or "",
+                        contract_address,
+                        balance / _pow10(decimals) if balance > 0 else 0,
+                        decimals,
+                        False,
+                        None,
+                        None,
+                    )
+                )
+
+            page_key = data.get("pageKey")
+            if not page_key:
+                return tokens
+            body["pageKey"] = page_key
+
+    async def _get_tokens_metadata(
+        self,
+        chain_id: str,
+        url: str,
+        contract_addresses: List[str],
+    ) -> Dict[str, dict]:
+        """获取多个代币的元数据：优先读取缓存，未命中的合约通过一次 JSON-RPC 批量请求获取
+
+        节点不接受批量请求（返回非数组响应）时回退为逐个请求。
+
+        Returns:
+            合约地址 -> 元数据（symbol/name/decimals），获取失败的合约不在结果中
+        """
+        metadata_by_contract = {}
+        missing = []
+        for contract_address in contract_addresses:
+            cached = _get_cached_metadata(chain_id, contract_address)
+            if cached is not None:
+                metadata_by_contract[contract_address] = cached
+            else:
+                missing.append(contract_address)
+
+        fetched = await self._fetch_tokens_metadata(url, missing)
+        for contract_address, metadata in fetched.items():
+            _cache_metadata(chain_id, contract_address, metadata)
+        metadata_by_contract.update(fetched)
+        return metadata_by_contract
+
+    async def _fetch_tokens_metadata(
+        self, url: str, contract_addresses: List[str]
+    ) -> Dict[str, dict]:
+        """通过一次 JSON-RPC 批量请求获取多个代币的元数据（不读写缓存）"""
+        if not contract_addresses:
+            return {}
+
+        payload = [
+            {
+                "id": i,
+                "jsonrpc": "2.0",
+                "method": "alchemy_getTokenMetadata",
+                "params": [contract_address],
+            }
+            for i, contract_address in enumerate(contract_addresses)
+        ]
+        response = await self._send(
+            "POST", url, content=orjson.dumps(payload), headers=self._headers
+        )
+        response.raise_for_status()
+        data = _parse(response)
+
+        metadata_by_contract = {}
+        if isinstance(data, list):
+            for item in data:
+                index = item.get("id")
+                result = item.get("result")
+                if isinstance(index, int) and 0 <= index < len(contract_addresses):
+                    if result:
+                        metadata_by_contract[contract_addresses[index]] = result
+            return metadata_by_contract
+
+        logger.warning(
+            f"Alchemy 不支持批量元数据请求，改为逐个请求: {data.get('error')}"
+        )
+
+        async def _fetch_metadata(request: dict) -> Optional[dict]:
+            async with self._meta_sem:
+                response = await self._send(
+                    "POST", url, content=orjson.dumps(request), headers=self._headers
+                )
+                return _parse(response).get("result")
+
+        results = await asyncio.gather(
+            *[_fetch_metadata(request) for request in payload], return_exceptions=True
+        )
+        for contract_address, result in zip(contract_addresses, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Alchemy 获取代币元数据失败 {contract_address}: {result}")
+            elif result:
+                metadata_by_contract[contract_address] = result
+        return metadata_by_contract
+
     async def get_token_price(
         self, token_symbol: str, chain_name: str
     ) -> Optional[float]:
@@ -416,11 +641,15 @@ class MobulaProvider(BaseDataProvider):
             "Mobula", DataProviderType.CHAIN_SPECIFIC, DataProviderPriority.PRIMARY
         )
         self.api_key = getattr(settings, "mobula_api_key", "")
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
         self.base_url = "https://api.mobula.io/api/1"
         self.rate_limit_delay = 1.0
 
     def supports_chain(self, chain_name: str) -> bool:
-        return chain_name.lower() == "sui"
+        return chain_name == "sui" or chain_name.lower() == "sui"
 
     async def get_wallet_assets(
         self, address: str, chain_name: str, include_zero_balance: bool = False
@@ -432,18 +661,15 @@ class MobulaProvider(BaseDataProvider):
         try:
             await self._rate_limit()
 
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-            }
-
             url = f"{self.base_url}/wallet/portfolio"
             params = {"wallet": address, "blockchains": "Sui"}
 
-            response = await self.http_client.get(url, headers=headers, params=params)
+            response = await self._send(
+                "GET", url, headers=self._headers, params=params
+            )
             response.raise_for_status()
 
-            data = response.json()
+            data = _parse(response)
             tokens = []
 
             if data.get("data") and data["data"].get("assets"):
@@ -465,7 +691,7 @@ class MobulaProvider(BaseDataProvider):
                     )
                     tokens.append(token)
 
-            self.reset_errors()
+            self.record_success()
             return tokens
 
         except Exception as e:
@@ -477,21 +703,8 @@ class MobulaProvider(BaseDataProvider):
         self, address: str, token_contract: Optional[str], chain_name: str
     ) -> float:
         """获取代币余额"""
-        assets = await self.get_wallet_assets(
-            address, chain_name, include_zero_balance=True
-        )
-
-        for asset in assets:
-            if token_contract is None and asset.is_native:
-                return asset.balance
-            elif (
-                token_contract
-                and asset.contract_address
-                and asset.contract_address.lower() == token_contract.lower()
-            ):
-                return asset.balance
-
-        return 0.0
+        balances = await self._assets_by_contract(address, chain_name)
+        return balances.get(token_contract.lower() if token_contract else None, 0.0)
 
     async def get_token_price(
         self, token_symbol: str, chain_name: str
@@ -503,18 +716,15 @@ class MobulaProvider(BaseDataProvider):
         try:
             await self._rate_limit()
 
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-            }
-
             url = f"{self.base_url}/market/data"
             params = {"symbol": token_symbol, "blockchain": "Sui"}
 
-            response = await self.http_client.get(url, headers=headers, params=params)
+            response = await self._send(
+                "GET", url, headers=self._headers, params=params
+            )
             response.raise_for_status()
 
-            data = response.json()
+            data = _parse(response)
 
             if data.get("data") and data["data"].get("price"):
                 return float(data["data"]["price"])
@@ -535,6 +745,7 @@ class DeBankProvider(BaseDataProvider):
             "DeBank", DataProviderType.MULTI_CHAIN, DataProviderPriority.SECONDARY
         )
         self.api_key = getattr(settings, "debank_api_key", "")
+        self._headers = {"AccessKey": self.api_key, "Content-Type": "application/json"}
         self.base_url = "https://pro-openapi.debank.com/v1"
         self.supported_chains = {
             "ethereum": "eth",
@@ -543,10 +754,15 @@ class DeBankProvider(BaseDataProvider):
             "arbitrum": "arb",
             "base": "base",
         }
+        self._supported_set = frozenset(self.supported_chains)
         self.rate_limit_delay = 1.0
 
     def supports_chain(self, chain_name: str) -> bool:
-        return chain_name.lower() in self.supported_chains
+        # 聚合器传入的链名称已是小写，命中时无需再做 lower()
+        return (
+            chain_name in self._supported_set
+            or chain_name.lower() in self._supported_set
+        )
 
     async def get_wallet_assets(
         self, address: str, chain_name: str, include_zero_balance: bool = False
@@ -558,16 +774,16 @@ class DeBankProvider(BaseDataProvider):
         try:
             await self._rate_limit()
 
-            headers = {"AccessKey": self.api_key, "Content-Type": "application/json"}
-
             chain_id = self.supported_chains[chain_name.lower()]
             url = f"{self.base_url}/user/token_list"
             params = {"id": address, "chain_id": chain_id, "is_all": "true"}
 
-            response = await self.http_client.get(url, headers=headers, params=params)
+            response = await self._send(
+                "GET", url, headers=self._headers, params=params
+            )
             response.raise_for_status()
 
-            data = response.json()
+            data = await _parse_large(response)
             tokens = []
 
             for token_data in data:
@@ -590,7 +806,7 @@ class DeBankProvider(BaseDataProvider):
                 )
                 tokens.append(token)
 
-            self.reset_errors()
+            self.record_success()
             return tokens
 
         except Exception as e:
@@ -602,21 +818,8 @@ class DeBankProvider(BaseDataProvider):
         self, address: str, token_contract: Optional[str], chain_name: str
     ) -> float:
         """获取代币余额"""
-        assets = await self.get_wallet_assets(
-            address, chain_name, include_zero_balance=True
-        )
-
-        for asset in assets:
-            if token_contract is None and asset.is_native:
-                return asset.balance
-            elif (
-                token_contract
-                and asset.contract_address
-                and asset.contract_address.lower() == token_contract.lower()
-            ):
-                return asset.balance
-
-        return 0.0
+        balances = await self._assets_by_contract(address, chain_name)
+        return balances.get(token_contract.lower() if token_contract else None, 0.0)
 
     async def get_token_price(
         self, token_symbol: str, chain_name: str
@@ -625,6 +828,26 @@ class DeBankProvider(BaseDataProvider):
         return None
 
 
+# Bitquery 余额查询：地址通过 GraphQL 变量传入，查询文本按网络预先生成后复用
+_BITQUERY_BALANCE_QUERY = """
+query ($address: String!) {
+  %(network)s(network: %(network)s) {
+    address(address: {is: $address}) {
+      balances {
+        currency {
+          symbol
+          name
+          address
+          decimals
+        }
+        value
+      }
+    }
+  }
+}
+"""
+
+
 class BitqueryProvider(BaseDataProvider):
     """Bitquery API 提供商 - 区块链数据分析平台"""
 
@@ -633,6 +856,7 @@ class BitqueryProvider(BaseDataProvider):
             "Bitquery", DataProviderType.MULTI_CHAIN, DataProviderPriority.FALLBACK
         )
         self.api_key = getattr(settings, "bitquery_api_key", "")
+        self._headers = {"X-API-KEY": self.api_key, "Content-Type": "application/json"}
         self.base_url = "https://graphql.bitquery.io"
         self.supported_chains = {
             "ethereum": "ethereum",
@@ -641,10 +865,25 @@ class BitqueryProvider(BaseDataProvider):
             "arbitrum": "arbitrum",
             "solana": "solana",
         }
+        self._supported_set = frozenset(self.supported_chains)
+        self._queries = {
+            chain: _BITQUERY_BALANCE_QUERY % {"network": network}
+            for chain, network in self.supported_chains.items()
+        }
+        # 自动持久化查询（APQ）：先只发送查询哈希，服务端未缓存时再补发完整查询
+        self._query_hashes = {
+            chain: hashlib.sha256(query.encode()).hexdigest()
+            for chain, query in self._queries.items()
+        }
+        self._use_persisted_queries = True
         self.rate_limit_delay = 2.0
 
     def supports_chain(self, chain_name: str) -> bool:
-        return chain_name.lower() in self.supported_chains
+        # 聚合器传入的链名称已是小写，命中时无需再做 lower()
+        return (
+            chain_name in self._supported_set
+            or chain_name.lower() in self._supported_set
+        )
 
     async def get_wallet_assets(
         self, address: str, chain_name: str, include_zero_balance: bool = False
@@ -656,25 +895,12 @@ class BitqueryProvider(BaseDataProvider):
         try:
             await self._rate_limit()
 
-            headers = {"X-API-KEY": self.api_key, "Content-Type": "application/json"}
-
-            # 构建GraphQL查询
-            if chain_name.lower() == "solana":
-                query = self._build_solana_balance_query(address)
-            else:
-                query = self._build_evm_balance_query(address, chain_name)
-
-            response = await self.http_client.post(
-                self.base_url, json={"query": query}, headers=headers
-            )
-            response.raise_for_status()
-
-            data = response.json()
+            data = await self._post_balance_query(address, chain_name)
             tokens = self._parse_bitquery_response(
                 data, chain_name, include_zero_balance
             )
 
-            self.reset_errors()
+            self.record_success()
             return tokens
 
         except Exception as e:
@@ -682,46 +908,62 @@ class BitqueryProvider(BaseDataProvider):
             logger.error(f"Bitquery获取钱包资产失败 {address} on {chain_name}: {e}")
             return []
 
-    def _build_evm_balance_query(self, address: str, chain_name: str) -> str:
-        """构建EVM链的余额查询"""
-        network = self.supported_chains[chain_name.lower()]
-        return f"""
-        {{
-          {network}(network: {network}) {{
-            address(address: {{is: "{address}"}}) {{
-              balances {{
-                currency {{
-                  symbol
-                  name
-                  address
-                  decimals
-                }}
-                value
-              }}
-            }}
-          }}
-        }}
-        """
+    async def _post_balance_query(self, address: str, chain_name: str) -> dict:
+        """发送余额查询：优先只发送持久化查询哈希，未命中或不支持时补发完整查询"""
+        # 查询文本固定，地址作为变量传入
+        if chain_name.lower() == "solana":
+            query = self._build_solana_balance_query()
+        else:
+            query = self._build_evm_balance_query(chain_name)
+        body: Dict[str, Any] = {"variables": {"address": address}}
+
+        if self._use_persisted_queries:
+            body["extensions"] = {
+                "persistedQuery": {
+                    "version": 1,
+                    "sha256Hash": self._query_hashes[chain_name.lower()],
+                }
+            }
+            response = await self._send(
+                "POST", self.base_url, content=orjson.dumps(body), headers=self._headers
+            )
+            if response.status_code >= 500:
+                response.raise_for_status()
+            try:
+                # 部分网关以 4xx 返回 PersistedQueryNotFound，同样需要解析错误信息
+                data = _parse(response)
+            except orjson.JSONDecodeError:
+                data = None
+            if not isinstance(data, dict):
+                data = {}
+            if response.is_success and data.get("data") is not None:
+                return data
+            missed = any(
+                isinstance(error, dict)
+                and error.get("message") == "PersistedQueryNotFound"
+                for error in data.get("errors") or []
+            )
+            if not missed:
+                # 首个非“未命中”的响应即说明服务端不支持 APQ，之后直接发送完整查询
+                logger.info("Bitquery 不支持持久化查询，改为发送完整查询")
+                self._use_persisted_queries = False
+                del body["extensions"]
+            # 未命中时同时发送查询文本与哈希，由服务端登记该哈希供后续请求使用
+
+        body["query"] = query
+        response = await self._send(
+            "POST", self.base_url, content=orjson.dumps(body), headers=self._headers
+        )
+        response.raise_for_status()
+        return _parse(response)
 
-    def _build_solana_balance_query(self, address: str) -> str:
-        """构建Solana链的余额查询"""
-        return f"""
-        {{
-          solana(network: solana) {{
-            address(address: {{is: "{address}"}}) {{
-              balances {{
-                currency {{
-                  symbol
-                  name
-                  address
-                  decimals
-                }}
-                value
-              }}
-            }}
-          }}
-        }}
-        """
+    def _build_evm_balance_query(self, chain_name: str) -> str:
+        """获取EVM链的余额查询"""
+        return self._queries[chain_name.lower()]
+
+    def _build_solana_balance_query(self) -> str:
+        """获取Solana链的余额查询"""
+        return self._queries["solana"]
 
     def _parse_bitquery_response(
         self, data: dict, chain_name: str, include_zero_balance: bool
@@ -762,21 +1004,8 @@ class BitqueryProvider(BaseDataProvider):
         self, address: str, token_contract: Optional[str], chain_name: str
     ) -> float:
         """获取代币余额"""
-        assets = await self.get_wallet_assets(
-            address, chain_name, include_zero_balance=True
-        )
-
-        for asset in assets:
-            if token_contract is None and asset.is_native:
-                return asset.balance
-            elif (
-                token_contract
-                and asset.contract_address
-                and asset.contract_address.lower() == token_contract.lower()
-            ):
-                return asset.balance
-
-        return 0.0
+        balances = await self._assets_by_contract(address, chain_name)
+        return balances.get(token_contract.lower() if token_contract else None, 0.0)
 
     async def get_token_price(
         self, token_symbol: str, chain_name: str
@@ -793,6 +1022,7 @@ class MoralisProvider(BaseDataProvider):
             "Moralis", DataProviderType.MULTI_CHAIN, DataProviderPriority.FALLBACK
         )
         self.api_key = getattr(settings, "moralis_api_key", "")
+        self._headers = {"X-API-Key": self.api_key, "Content-Type": "application/json"}
         self.base_url = "https://deep-index.moralis.io/api/v2.2"
         self.supported_chains = {
             "ethereum": "0x1",
@@ -802,10 +1032,15 @@ class MoralisProvider(BaseDataProvider):
             "base": "0x2105",
             "solana": "mainnet",
         }
+        self._supported_set = frozenset(self.supported_chains)
         self.rate_limit_delay = 1.0
 
     def supports_chain(self, chain_name: str) -> bool:
-        return chain_name.lower() in self.supported_chains
+        # 聚合器传入的链名称已是小写，命中时无需再做 lower()
+        return (
+            chain_name in self._supported_set
+            or chain_name.lower() in self._supported_set
+        )
 
     async def get_wallet_assets(
         self, address: str, chain_name: str, include_zero_balance: bool = False
@@ -817,8 +1052,6 @@ class MoralisProvider(BaseDataProvider):
         try:
             await self._rate_limit()
 
-            headers = {"X-API-Key": self.api_key, "Content-Type": "application/json"}
-
             chain_id = self.supported_chains[chain_name.lower()]
 
             if chain_name.lower() == "solana":
@@ -828,17 +1061,19 @@ class MoralisProvider(BaseDataProvider):
                 url = f"{self.base_url}/{address}/erc20"
                 params = {"chain": chain_id}
 
-            response = await self.http_client.get(url, headers=headers, params=params)
+            response = await self._send(
+                "GET", url, headers=self._headers, params=params
+            )
             response.raise_for_status()
 
-            data = response.json()
+            data = await _parse_large(response)
 
             if chain_name.lower() == "solana":
                 tokens = self._parse_solana_response(data, include_zero_balance)
             else:
                 tokens = self._parse_evm_response(data, include_zero_balance)
 
-            self.reset_errors()
+            self.record_success()
             return tokens
 
         except Exception as e:
@@ -855,22 +1090,23 @@ class MoralisProvider(BaseDataProvider):
         for token_data in data:
             balance_raw = int(token_data.get("balance", 0))
             decimals = int(token_data.get("decimals", 18))
-            balance = balance_raw / (10**decimals)
+            balance = balance_raw / _pow10(decimals)
 
             if not include_zero_balance and balance == 0:
                 continue
 
-            token = DiscoveredToken(
-                symbol=token_data.get("symbol", "UNKNOWN"),
-                name=token_data.get("name", ""),
-                contract_address=token_data.get("token_address"),
-                balance=balance,
-                decimals=decimals,
-                is_native=False,
-                price_usdc=None,
-                value_usdc=None,
+            tokens.append(
+                DiscoveredToken.build(
+                    token_data.get("symbol") or "UNKNOWN",
+                    token_data.get("name") or "",
+                    token_data.get("token_address"),
+                    balance,
+                    decimals,
+                    False,
+                    None,
+                    None,
+                )
             )
-            tokens.append(token)
 
         return tokens
 
@@ -904,21 +1140,8 @@ class MoralisProvider(BaseDataProvider):
         self, address: str, token_contract: Optional[str], chain_name: str
     ) -> float:
         """获取代币余额"""
-        assets = await self.get_wallet_assets(
-            address, chain_name, include_zero_balance=True
-        )
-
-        for asset in assets:
-            if token_contract is None and asset.is_native:
-                return asset.balance
-            elif (
-                token_contract
-                and asset.contract_address
-                and asset.contract_address.lower() == token_contract.lower()
-            ):
-                return asset.balance
-
-        return 0.0
+        balances = await self._assets_by_contract(address, chain_name)
+        return balances.get(token_contract.lower() if token_contract else None, 0.0)
 
     async def get_token_price(
         self, token_symbol: str, chain_name: str
@@ -927,6 +1150,80 @@ class MoralisProvider(BaseDataProvider):
         return None
 
 
+def _safe_float(value: Any) -> Optional[float]:
+    """解析可选数值字段：缺失或空字符串返回 None，数值直接返回，无法解析时返回 None"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+# Sui 原生代币的两种 coin_type 写法
+_SUI_NATIVE_TYPES = frozenset(
+    {
+        "0x2::sui::SUI",
+        "0x0000000000000000000000000000000000000000000000000000000000000002::sui::SUI",
+    }
+)
+
+# 已知 Sui 代币的元数据（coin_type 区分大小写，按原样作为键；只读，所有实例共享）
+_SUI_KNOWN_TOKENS: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {
+        coin_type: MappingProxyType(metadata)
+        for coin_type, metadata in {
+            # SUI原生代币
+            "0x2::sui::SUI": {"symbol": "SUI", "name": "Sui", "decimals": 9},
+            "0x0000000000000000000000000000000000000000000000000000000000000002::sui::SUI": {
+                "symbol": "SUI", "name": "Sui", "decimals": 9
+            },
+            # USDC代币
+            "0xdba34672e30cb065b1f93e3ab55318768fd6fef66c15942c9f7cb846e2f900e7::usdc::USDC": {
+                "symbol": "USDC", "name": "USD Coin", "decimals": 6,
+            },
+            # USDT代币
+            "0xc060006111016b8a020ad5b33834984a437aaa7d3c74c18e09a95d48aceab08c::coin::COIN": {
+                "symbol": "USDT", "name": "Tether USD", "decimals": 6,
+            },
+            "0x7926cdedd3053cffe30d21933d78ed4a60d6d05f470985371d20e3135d93b1eb::usdt::USDT": {
+                "symbol": "USDT", "name": "Tether USD", "decimals": 6,
+            },
+            # WETH代币
+            "0xaf8cd5edc19c4512f4259f0bee101a40d41ebed738ade5874359610ef8eeced5::coin::COIN": {
+                "symbol": "WETH", "name": "Wrapped Ether", "decimals": 8,
+            },
+            # 其他常见代币
+            "0x83556891f4a0f233ce7b05cfe7f957d4020492a34f5405b2cb9377d060bef4bf::spring_sui::SPRING_SUI": {
+                "symbol": "sSUI", "name": "Spring Staked SUI", "decimals": 9,
+            },
+            "0xbde4ba4c2e274a60ce15c1cfff9e5c42e41654ac8b6d906a57efa4bd3c29f47d::hasui::HASUI": {
+                "symbol": "haSUI", "name": "haSUI", "decimals": 9,
+            },
+        }.items()
+    }
+)
+
+
+@lru_cache(maxsize=4096)
+def _extract_symbol_from_coin_type(coin_type: str) -> str:
+    """从coin_type中提取代币符号（结果做 LRU 缓存）"""
+    try:
+        # coin_type 格式: 0x...::module::TokenName
+        if "::" in coin_type:
+            parts = coin_type.split("::")
+            if len(parts) >= 3:
+                return parts[-1].upper()
+
+        # 如果格式不标准，返回地址的前8位
+        return coin_type[:8].upper()
+
+    except Exception:
+        return "UNKNOWN"
+
+
 class BlockVisionSuiProvider(BaseDataProvider):
     """BlockVision Sui Indexing API 提供商 - 专门针对Sui链的高精度数据提供商"""
 
@@ -935,11 +1232,14 @@ class BlockVisionSuiProvider(BaseDataProvider):
             "BlockVision", DataProviderType.CHAIN_SPECIFIC, DataProviderPriority.PRIMARY
         )
         self.api_key = getattr(settings, "blockvision_api_key", "")
+        self._headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            self._headers["x-api-key"] = self.api_key  # 注意：BlockVision使用小写的x-api-key
         self.base_url = "https://api.blockvision.org/v2"
         self.rate_limit_delay = 2.0  # 增加速率限制延迟以避免429错误
 
     def supports_chain(self, chain_name: str) -> bool:
-        return chain_name.lower() == "sui"
+        return chain_name == "sui" or chain_name.lower() == "sui"
 
     async def get_wallet_assets(
         self, address: str, chain_name: str, include_zero_balance: bool = False
@@ -951,20 +1251,16 @@ class BlockVisionSuiProvider(BaseDataProvider):
         try:
             await self._rate_limit()
 
-            headers = {"Content-Type": "application/json"}
-
-            # 如果有API密钥，添加到请求头
-            if self.api_key:
-                headers["x-api-key"] = self.api_key  # 注意：BlockVision使用小写的x-api-key
-
             # 使用BlockVision的Account Coins API
             url = f"{self.base_url}/sui/account/coins"
             params = {"account": address}
 
-            response = await self.http_client.get(url, headers=headers, params=params)
+            response = await self._send(
+                "GET", url, headers=self._headers, params=params
+            )
             response.raise_for_status()
 
-            data = response.json()
+            data = await _parse_large(response)
             tokens = []
 
             # 根据实际API响应结构解析数据
@@ -988,35 +1284,25 @@ class BlockVisionSuiProvider(BaseDataProvider):
                             continue
 
                         # 计算实际余额
-                        balance = balance_raw / (10**decimals)
+                        balance = balance_raw / _pow10(decimals)
 
                         if balance > 0 or include_zero_balance:
                             # 判断是否为原生代币 - 检查完整的SUI coin type
-                            is_native = coin_type in [
-                                "0x2::sui::SUI", 
-                                "0x0000000000000000000000000000000000000000000000000000000000000002::sui::SUI"
-                            ]
+                            is_native = coin_type in _SUI_NATIVE_TYPES
                             
                             # 获取价格信息（如果可用）
-                            price_usdc = None
-                            value_usdc = None
-                            try:
-                                if coin_data.get("price") and coin_data.get("price") != "":
-                                    price_usdc = float(coin_data.get("price", 0))
-                                if coin_data.get("usdValue") and coin_data.get("usdValue") != "":
-                                    value_usdc = float(coin_data.get("usdValue", 0))
-                            except (ValueError, TypeError):
-                                pass
-
-                            token = DiscoveredToken(
-                                symbol=symbol or self._extract_symbol_from_coin_type(coin_type),
-                                name=name or symbol or "Unknown",
-                                contract_address=None if is_native else coin_type,
-                                balance=balance,
-                                decimals=decimals,
-                                is_native=is_native,
-                                price_usdc=price_usdc,
-                                value_usdc=value_usdc,
+                            price_usdc = _safe_float(coin_data.get("price"))
+                            value_usdc = _safe_float(coin_data.get("usdValue"))
+
+                            token = DiscoveredToken.build(
+                                symbol or _extract_symbol_from_coin_type(coin_type),
+                                name or symbol or "Unknown",
+                                None if is_native else coin_type,
+                                balance,
+                                decimals,
+                                is_native,
+                                price_usdc,
+                                value_usdc,
                             )
                             tokens.append(token)
                             
@@ -1026,7 +1312,7 @@ class BlockVisionSuiProvider(BaseDataProvider):
                         logger.warning(f"解析Sui代币数据失败: {e}, 数据: {coin_data}")
                         continue
 
-            self.reset_errors()
+            self.record_success()
             logger.info(
                 f"BlockVision成功获取Sui钱包资产: {address}, 发现 {len(tokens)} 个代币"
             )
@@ -1045,24 +1331,9 @@ class BlockVisionSuiProvider(BaseDataProvider):
             return 0.0
 
         try:
-            # 获取所有代币，然后筛选目标代币
-            assets = await self.get_wallet_assets(
-                address, chain_name, include_zero_balance=True
-            )
-
-            for asset in assets:
-                # 原生代币匹配
-                if token_contract is None and asset.is_native:
-                    return asset.balance
-                # 合约代币匹配
-                elif (
-                    token_contract
-                    and asset.contract_address
-                    and asset.contract_address.lower() == token_contract.lower()
-                ):
-                    return asset.balance
-
-            return 0.0
+            # 按合约地址索引全部代币余额后直接查找
+            balances = await self._assets_by_contract(address, chain_name)
+            return balances.get(token_contract.lower() if token_contract else None, 0.0)
 
         except Exception as e:
             logger.error(f"BlockVision获取Sui代币余额失败: {e}")
@@ -1074,24 +1345,21 @@ class BlockVisionSuiProvider(BaseDataProvider):
         """获取代币价格 - BlockVision可能不提供价格数据，返回None让价格服务处理"""
         return None
 
-    async def _get_coin_metadata(self, coin_type: str) -> Dict[str, Any]:
+    async def _get_coin_metadata(self, coin_type: str) -> Mapping[str, Any]:
         """获取代币元数据 - 备用方法，主要数据已从账户API获取"""
         try:
             await self._rate_limit()
 
-            headers = {"Content-Type": "application/json"}
-
-            if self.api_key:
-                headers["x-api-key"] = self.api_key
-
             # 使用BlockVision的Coin Detail API
             url = f"{self.base_url}/sui/coin/detail"
             params = {"coin_type": coin_type}
 
-            response = await self.http_client.get(url, headers=headers, params=params)
+            response = await self._send(
+                "GET", url, headers=self._headers, params=params
+            )
             response.raise_for_status()
 
-            data = response.json()
+            data = _parse(response)
 
             if data.get("code") == 200 and data.get("result") and data["result"].get("data"):
                 coin_info = data["result"]["data"]
@@ -1110,64 +1378,16 @@ class BlockVisionSuiProvider(BaseDataProvider):
             logger.warning(f"获取Sui代币元数据失败: {e}, coin_type: {coin_type}")
             return self._get_default_coin_metadata(coin_type)
 
-    def _get_default_coin_metadata(self, coin_type: str) -> Dict[str, Any]:
-        """获取默认代币元数据"""
-        # 已知代币的元数据 - 包含常见的Sui代币
-        known_tokens = {
-            # SUI原生代币
-            "0x2::sui::SUI": {"symbol": "SUI", "name": "Sui", "decimals": 9},
-            "0x0000000000000000000000000000000000000000000000000000000000000002::sui::SUI": {
-                "symbol": "SUI", "name": "Sui", "decimals": 9
-            },
-            
-            # USDC代币
-            "0xdba34672e30cb065b1f93e3ab55318768fd6fef66c15942c9f7cb846e2f900e7::usdc::USDC": {
-                "symbol": "USDC", "name": "USD Coin", "decimals": 6,
-            },
-            
-            # USDT代币
-            "0xc060006111016b8a020ad5b33834984a437aaa7d3c74c18e09a95d48aceab08c::coin::COIN": {
-                "symbol": "USDT", "name": "Tether USD", "decimals": 6,
-            },
-            "0x7926cdedd3053cffe30d21933d78ed4a60d6d05f470985371d20e3135d93b1eb::usdt::USDT": {
-                "symbol": "USDT", "name": "Tether USD", "decimals": 6,
-            },
-            
-            # WETH代币
-            "0xaf8cd5edc19c4512f4259f0bee101a40d41ebed738ade5874359610ef8eeced5::coin::COIN": {
-                "symbol": "WETH", "name": "Wrapped Ether", "decimals": 8,
-            },
-            
-            # 其他常见代币
-            "0x83556891f4a0f233ce7b05cfe7f957d4020492a34f5405b2cb9377d060bef4bf::spring_sui::SPRING_SUI": {
-                "symbol": "sSUI", "name": "Spring Staked SUI", "decimals": 9,
-            },
-            "0xbde4ba4c2e274a60ce15c1cfff9e5c42e41654ac8b6d906a57efa4bd3c29f47d::hasui::HASUI": {
-                "symbol": "haSUI", "name": "haSUI", "decimals": 9,
-            },
-        }
-
-        if coin_type in known_tokens:
-            return known_tokens[coin_type]
+    def _get_default_coin_metadata(self, coin_type: str) -> Mapping[str, Any]:
+        """获取默认代币元数据（已知代币返回只读映射）"""
+        known = _SUI_KNOWN_TOKENS.get(coin_type)
+        if known is not None:
+            return known
 
         # 默认值
+        symbol = _extract_symbol_from_coin_type(coin_type)
         return {
-            "symbol": self._extract_symbol_from_coin_type(coin_type),
-            "name": self._extract_symbol_from_coin_type(coin_type),
+            "symbol": symbol,
+            "name": symbol,
             "decimals": 9,  # Sui默认小数位数
         }
-
-    def _extract_symbol_from_coin_type(self, coin_type: str) -> str:
-        """从coin_type中提取代币符号"""
-        try:
-            # coin_type 格式: 0x...::module::TokenName
-            if "::" in coin_type:
-                parts = coin_type.split("::")
-                if len(parts) >= 3:
-                    return parts[-1].upper()
-
-            # 如果格式不标准，返回地址的前8位
-            return coin_type[:8].upper()
-
-        except Exception:
-            return "UNKNOWN"
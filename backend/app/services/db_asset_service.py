@@ -446,7 +446,6 @@ class DatabaseAssetService:
             # 创建区块链服务实例
             blockchain_service = BlockchainService()
 
-            # 不再调用 ensure_initialized()，改为按需初始化
             # 区块链服务会在需要时自动初始化指定的链
 
             # 调用区块链服务发现代币
@@ -158,23 +158,34 @@ class TokenDiscoveryService:
         tokens: List[DiscoveredToken], 
         chain_name: str
     ) -> List[DiscoveredToken]:
-        """增强代币价格信息"""
-        enhanced_tokens = []
+        """增强代币价格信息（按符号去重后并发查询价格）"""
+        # 只为缺少价格信息的代币查询，同一符号只查询一次
+        symbols = list(dict.fromkeys(
+            token.symbol for token in tokens if token.price_usdc is None
+        ))
+        if not symbols:
+            return tokens
+        
+        results = await asyncio.gather(
+            *[data_aggregator.get_token_price(symbol, chain_name) for symbol in symbols],
+            return_exceptions=True
+        )
+        
+        prices = {}
+        for symbol, price in zip(symbols, results):
+            if isinstance(price, Exception):
+                logger.debug(f"获取代币 {symbol} 价格失败: {price}")
+            elif price is not None:
+                prices[symbol] = price
         
         for token in tokens:
-            # 如果代币没有价格信息，尝试获取
             if token.price_usdc is None:
-                try:
-                    price = await data_aggregator.get_token_price(token.symbol, chain_name)
-                    if price is not None:
-                        token.price_usdc = price
-                        token.value_usdc = token.balance * price
-                except Exception as e:
-                    logger.debug(f"获取代币 {token.symbol} 价格失败: {e}")
-            
-            enhanced_tokens.append(token)
+                price = prices.get(token.symbol)
+                if price is not None:
+                    token.price_usdc = price
+                    token.value_usdc = token.balance * price
         
-        return enhanced_tokens
+        return tokens
     
     async def _check_predefined_tokens(
         self, 
@@ -262,7 +273,7 @@ class TokenDiscoveryService:
         for token in tokens:
             # 创建唯一键
             if token.contract_address:
-                key = f"contract:{token.contract_address.lower()}"
+                key = f"contract:{token.contract_address_lower}"
             else:
                 key = f"native:{token.symbol.upper()}"
             
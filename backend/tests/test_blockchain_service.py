@@ -0,0 +1,174 @@
+"""区块链服务测试：Solana 工具函数、RPC 竞速与 Token Registry 降级"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.services import blockchain_service
+from app.services.blockchain_service import (
+    BlockchainService,
+    _b58decode,
+    _b58encode,
+    _is_on_ed25519_curve,
+    _metaplex_pda,
+    _parse_spl_token_account,
+)
+
+
+# 参考实现（solders Pubkey.find_program_address）计算的 Metaplex 元数据账户地址，
+# 覆盖 bump=255 与需要向下尝试的情况
+@pytest.mark.parametrize(
+    "mint,expected",
+    [
+        (
+            "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",  # USDC, bump 255
+            "5x38Kp4hvdomTCnCrAny4UtMUt5rQBdB6px2K1Ui45Wq",
+        ),
+        (
+            "So11111111111111111111111111111111111111112",  # wSOL, bump 255
+            "6dM4TqWyWJsbx7obrdLcviBkTafD5E8av61zfU6jq57X",
+        ),
+        (
+            "JUPyiwrYJFskUPiHa7hKeqbbqbqbqm2q9trQ5yJi4wH",  # JUP, bump 253
+            "8FEdhNURP2afgTYTbCqUnh5PrAfrm6teiUNRJ6RHsVHc",
+        ),
+        (
+            "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263",  # BONK, bump 250
+            "FDZZbyY9XGpL3CNKUZxLk3wFTTQYL3TkDiDzqxrizcPN",
+        ),
+    ],
+)
+def test_metaplex_pda_matches_reference(mint, expected):
+    assert _metaplex_pda(mint) == expected
+
+
+def test_pda_is_off_curve_and_wallet_keys_are_on_curve():
+    pda = _metaplex_pda("So11111111111111111111111111111111111111112")
+    assert not _is_on_ed25519_curve(_b58decode(pda))
+    usdc = _b58decode("EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v")
+    assert _is_on_ed25519_curve(usdc)
+    assert _is_on_ed25519_curve(bytes(32))
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "11111111111111111111111111111111",
+        "So11111111111111111111111111111111111111112",
+        "metaqbxxUerdq28cj1RbAWkYQm3ybzjb6a8bt518x1s",
+    ],
+)
+def test_b58_round_trip(value):
+    raw = _b58decode(value)
+    assert len(raw) == 32
+    assert _b58encode(raw) == value
+
+
+def test_parse_spl_token_account():
+    mint = _b58decode("EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v")
+    owner = bytes(range(32))
+    amount = 1_234_567_890
+    raw = mint + owner + amount.to_bytes(8, "little") + bytes(165 - 72)
+
+    assert _parse_spl_token_account(raw) == (
+        "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
+        amount,
+    )
+
+
+class TestRaceRpcUrls:
+    def test_first_non_none_result_wins_and_cancels_the_rest(self):
+        cancelled = []
+
+        async def _try_one(rpc_url):
+            if rpc_url == "slow":
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.append(rpc_url)
+                    raise
+            if rpc_url == "broken":
+                raise RuntimeError("boom")
+            if rpc_url == "empty":
+                return None
+            await asyncio.sleep(0.01)
+            return rpc_url
+
+        async def _run():
+            result = await BlockchainService()._race_rpc_urls(
+                ["slow", "broken", "empty", "fast"], _try_one
+            )
+            # 给被取消的任务一次调度机会
+            await asyncio.sleep(0)
+            return result
+
+        assert asyncio.run(_run()) == "fast"
+        assert cancelled == ["slow"]
+
+    def test_all_nodes_failing_returns_none(self):
+        async def _try_one(rpc_url):
+            if rpc_url == "broken":
+                raise RuntimeError("boom")
+            return None
+
+        result = asyncio.run(
+            BlockchainService()._race_rpc_urls(["broken", "empty"], _try_one)
+        )
+        assert result is None
+
+
+class FailingClient:
+    """每次 GET 都失败的 HTTP 客户端，记录调用次数"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def get(self, url, headers=None):
+        self.calls += 1
+        raise httpx.ConnectError("cdn down")
+
+
+class TestTokenRegistry:
+    @pytest.fixture
+    def stale_registry(self, monkeypatch):
+        index = {"mint": ("SYM", "Name", 6)}
+        monkeypatch.setattr(blockchain_service, "_token_registry_index", index)
+        monkeypatch.setattr(blockchain_service, "_token_registry_etag", '"etag"')
+        monkeypatch.setattr(
+            blockchain_service,
+            "_token_registry_fetched_at",
+            time.time() - blockchain_service._TOKEN_REGISTRY_TTL - 1,
+        )
+        monkeypatch.setattr(blockchain_service, "_token_registry_lock", asyncio.Lock())
+        return index
+
+    def test_failed_refresh_returns_stale_index_and_backs_off(self, stale_registry):
+        service = BlockchainService()
+        client = FailingClient()
+        service.http_client = client
+
+        async def _run():
+            first = await service._ensure_token_registry()
+            second = await service._ensure_token_registry()
+            return first, second
+
+        first, second = asyncio.run(_run())
+
+        assert first is stale_registry
+        assert second is stale_registry
+        assert client.calls == 1
+
+    def test_refresh_is_retried_after_backoff(self, stale_registry):
+        service = BlockchainService()
+        client = FailingClient()
+        service.http_client = client
+
+        asyncio.run(service._ensure_token_registry())
+        blockchain_service._token_registry_fetched_at -= (
+            blockchain_service._TOKEN_REGISTRY_RETRY_AFTER
+        )
+        asyncio.run(service._ensure_token_registry())
+
+        assert client.calls == 2
@@ -0,0 +1,278 @@
+"""数据聚合器测试：熔断器、对冲请求、降级缓存与 Redis 缓存"""
+
+import asyncio
+from typing import List
+
+import pytest
+
+from app.models.asset_models import DiscoveredToken
+from app.services.data_aggregator import (
+    BaseDataProvider,
+    CircuitOpenError,
+    CircuitState,
+    DataAggregatorService,
+    DataProviderPriority,
+    DataProviderType,
+    ProviderCache,
+)
+
+
+def _token(symbol: str = "USDC", balance: float = 1.5) -> DiscoveredToken:
+    return DiscoveredToken(
+        symbol=symbol,
+        name=symbol,
+        contract_address="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+        balance=balance,
+        decimals=6,
+    )
+
+
+class FakeProvider(BaseDataProvider):
+    """按预设行为返回结果的提供商：delay 秒后返回 result，或抛出 error"""
+
+    def __init__(self, name: str, result=None, delay: float = 0.0, error=None):
+        super().__init__(
+            name, DataProviderType.MULTI_CHAIN, DataProviderPriority.PRIMARY
+        )
+        self.result = result
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.cancelled = False
+
+    async def get_wallet_assets(
+        self, address: str, chain_name: str, include_zero_balance: bool = False
+    ) -> List[DiscoveredToken]:
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+    async def get_token_balance(
+        self, address: str, token_contract: str, chain_name: str
+    ) -> float:
+        return 0.0
+
+    async def get_token_price(self, token_symbol: str, chain_name: str):
+        return None
+
+    def supports_chain(self, chain_name: str) -> bool:
+        return True
+
+
+class FakeRedis:
+    """内存版 Redis，只实现聚合器用到的 get/set"""
+
+    def __init__(self, fail: bool = False):
+        self.store = {}
+        self.fail = fail
+
+    async def get(self, key):
+        if self.fail:
+            raise ConnectionError("redis down")
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.store[key] = value
+
+
+def _service(redis=None) -> DataAggregatorService:
+    service = DataAggregatorService()
+    service._redis = redis
+    service._redis_initialized = True
+    return service
+
+
+def _open_circuit(provider: BaseDataProvider) -> None:
+    for _ in range(provider.failure_window.maxlen):
+        provider.record_error()
+
+
+class TestCircuitBreaker:
+    def test_opens_only_after_full_window_reaches_threshold(self):
+        provider = FakeProvider("p")
+        for _ in range(provider.failure_window.maxlen - 1):
+            provider.record_error()
+        assert provider.state is CircuitState.CLOSED
+
+        provider.record_error()
+        assert provider.state is CircuitState.OPEN
+        assert not provider.is_healthy()
+        with pytest.raises(CircuitOpenError):
+            provider._check_circuit()
+
+    def test_mixed_window_below_threshold_stays_closed(self):
+        provider = FakeProvider("p")
+        for i in range(provider.failure_window.maxlen * 2):
+            if i % 3 == 0:
+                provider.record_error()
+            else:
+                provider.record_success()
+        assert provider.state is CircuitState.CLOSED
+
+    def test_errors_while_open_are_not_counted(self):
+        provider = FakeProvider("p")
+        _open_circuit(provider)
+        error_count = provider.error_count
+
+        provider.record_error()
+        assert provider.error_count == error_count
+        assert provider.cooldown == provider.base_cooldown
+
+    def test_half_open_failure_reopens_with_longer_cooldown(self):
+        provider = FakeProvider("p")
+        _open_circuit(provider)
+        provider.opened_at -= provider.cooldown
+        assert provider.is_healthy()
+
+        provider._check_circuit()
+        assert provider.state is CircuitState.HALF_OPEN
+
+        provider.record_error()
+        assert provider.state is CircuitState.OPEN
+        assert provider.cooldown == provider.base_cooldown * provider.backoff_factor
+
+    def test_cooldown_is_capped(self):
+        provider = FakeProvider("p")
+        _open_circuit(provider)
+        for _ in range(50):
+            provider.opened_at -= provider.cooldown
+            provider._check_circuit()
+            provider.record_error()
+        assert provider.cooldown == provider.max_cooldown
+
+    def test_half_open_success_closes_and_resets_cooldown(self):
+        provider = FakeProvider("p")
+        _open_circuit(provider)
+        provider.opened_at -= provider.cooldown
+        provider._check_circuit()
+        provider.record_error()
+        provider.opened_at -= provider.cooldown
+        provider._check_circuit()
+
+        provider.record_success()
+        assert provider.state is CircuitState.CLOSED
+        assert provider.cooldown == provider.base_cooldown
+        provider._check_circuit()
+
+
+class TestHedgedCall:
+    def _call(self, service, providers):
+        return asyncio.run(
+            service._hedged_call(
+                providers,
+                lambda p: p.get_wallet_assets("0xabc", "ethereum"),
+                lambda result: bool(result),
+                "获取资产",
+            )
+        )
+
+    def test_first_result_wins_and_cancels_the_rest(self):
+        slow = FakeProvider("slow", result=[_token("SLOW")], delay=5.0)
+        fast = FakeProvider("fast", result=[_token("FAST")], delay=0.01)
+        backup = FakeProvider("backup", result=[_token("BACKUP")])
+
+        provider, result = self._call(_service(), [slow, fast, backup])
+
+        assert provider is fast
+        assert result[0].symbol == "FAST"
+        assert slow.cancelled
+        assert backup.calls == 0
+
+    def test_falls_back_to_remaining_providers_in_order(self):
+        failing = FakeProvider("failing", error=RuntimeError("boom"))
+        empty = FakeProvider("empty", result=[])
+        backup = FakeProvider("backup", result=[_token("BACKUP")])
+        unused = FakeProvider("unused", result=[_token("UNUSED")])
+
+        provider, result = self._call(_service(), [failing, empty, backup, unused])
+
+        assert provider is backup
+        assert failing.error_count == 1
+        assert unused.calls == 0
+
+    def test_no_acceptable_result(self):
+        providers = [FakeProvider("a", result=[]), FakeProvider("b", result=None)]
+        assert self._call(_service(), providers) == (None, None)
+
+
+class TestStaleCache:
+    def test_expired_entry_is_only_available_as_stale(self):
+        cache = ProviderCache(ttl=10, stale_ttl=100)
+        cache.set("k", "v", "p")
+        assert cache.get("k") == "v"
+
+        cache.cache["k"]["timestamp"] -= 50
+        assert cache.get("k") is None
+        assert cache.get_stale("k") == "v"
+
+        cache.cache["k"]["timestamp"] -= 50
+        assert cache.get_stale("k") is None
+        assert "k" not in cache.cache
+
+    def test_lru_eviction(self):
+        cache = ProviderCache(maxsize=2)
+        cache.set("a", 1, "p")
+        cache.set("b", 2, "p")
+        cache.get("a")
+        cache.set("c", 3, "p")
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+
+    def test_all_providers_failing_returns_stale_assets(self, monkeypatch):
+        service = _service()
+        failing = FakeProvider("failing", error=RuntimeError("boom"))
+        monkeypatch.setattr(service, "_healthy_providers", lambda chain: [failing])
+        stale = [_token()]
+        service.provider_cache.set("assets:key", stale, "p")
+        service.provider_cache.cache["assets:key"]["timestamp"] -= service.cache_ttl
+
+        result = asyncio.run(
+            service._fetch_wallet_assets("assets:key", "0xabc", "ethereum", False)
+        )
+
+        assert result is stale
+
+    def test_all_providers_failing_without_cache_returns_empty(self, monkeypatch):
+        service = _service()
+        failing = FakeProvider("failing", error=RuntimeError("boom"))
+        monkeypatch.setattr(service, "_healthy_providers", lambda chain: [failing])
+
+        result = asyncio.run(
+            service._fetch_wallet_assets("assets:key", "0xabc", "ethereum", False)
+        )
+
+        assert result == []
+
+
+class TestRedisCache:
+    def test_assets_round_trip_through_redis(self):
+        redis = FakeRedis()
+        writer = _service(redis)
+        asyncio.run(writer._cache_set("assets:0xabc:ethereum", [_token()], "p"))
+
+        # 另一个 worker 的进程内缓存为空，从 Redis 读取并回填
+        reader = _service(redis)
+        result = asyncio.run(reader._cache_get("assets:0xabc:ethereum"))
+
+        assert [token.model_dump() for token in result] == [_token().model_dump()]
+        assert reader.provider_cache.get("assets:0xabc:ethereum") is result
+
+    def test_plain_values_round_trip(self):
+        redis = FakeRedis()
+        asyncio.run(_service(redis)._cache_set("price:ETH", 3000.5, "p"))
+        assert asyncio.run(_service(redis)._cache_get("price:ETH")) == 3000.5
+
+    def test_redis_errors_fall_back_to_local_cache(self):
+        service = _service(FakeRedis(fail=True))
+        asyncio.run(service._cache_set("price:ETH", 3000.5, "p"))
+
+        assert asyncio.run(service._cache_get("price:ETH")) == 3000.5
+        assert asyncio.run(service._cache_get("price:BTC")) is None